@@ -0,0 +1,66 @@
+"""
+Throughput of `convert_corpus` depending on the number of worker processes
+
+    python benchmarks/bench_convert_corpus.py --lang uk --docs 20000
+
+"""
+import argparse
+import os
+import time
+
+from numeral_converter import convert_corpus, convert_numerical_in_text
+from numeral_converter.parallel import shutdown_pools
+
+TEXTS = {
+    "uk": (
+        "У цій школі працює шість психологів, і кожен із нас має навантаження "
+        "понад сто учнів; у моєму портфелі лежало чотири книги і двадцять три "
+        "зошити, а до кінця року залишилось сорок два дні"
+    ),
+    "ru": (
+        "Числительные делятся на четыре лексико-грамматических разряда: "
+        "количественные (два, пятьдесят, двести, триста пятьдесят один) и "
+        "собирательные (оба, двое, пятеро)"
+    ),
+    "en": (
+        "After twenty, numbers such as twenty-five, fifty, seventy-five, "
+        "and one hundred follow; for example thirty-three is simply thirty "
+        "plus three and sixty-nine is simply sixty plus nine"
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lang", default="uk", choices=sorted(TEXTS))
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--chunksize", type=int, default=64)
+    args = parser.parse_args()
+
+    corpus = [TEXTS[args.lang]] * args.docs
+
+    start = time.perf_counter()
+    for text in corpus:
+        convert_numerical_in_text(text, lang=args.lang)
+    serial = args.docs / (time.perf_counter() - start)
+    print(f"{'serial':>8}: {serial:10.1f} docs/sec")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        # the first call starts the pool; it's excluded from the measurement
+        list(convert_corpus(corpus[:workers], lang=args.lang, workers=workers))
+
+        start = time.perf_counter()
+        for _ in convert_corpus(
+            corpus, lang=args.lang, workers=workers, chunksize=args.chunksize
+        ):
+            pass
+        rate = args.docs / (time.perf_counter() - start)
+        print(f"{workers:>8}: {rate:10.1f} docs/sec ({rate / serial:.2f}x)")
+        workers *= 2
+
+    shutdown_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Latency of `day2numeral`, `year2numeral` and `numeral2year` against
+the generic `int2numeral` and `numeral2int` on the same days and years
+
+Building of the date tables is measured separately
+
+    python benchmarks/bench_dates.py --lang uk --calls 20000 --case genetive
+
+"""
+import argparse
+import random
+import time
+import warnings
+
+from numeral_converter import (
+    MorphSpec,
+    day2numeral,
+    int2numeral,
+    load_numeral_data,
+    numeral2int,
+    numeral2year,
+    year2numeral,
+)
+from numeral_converter.constants import MORPH_FORMS
+from numeral_converter.dates import YEARS_START, YEARS_STOP, build_date_tables
+
+
+def measure(name, func, args):
+    start = time.perf_counter()
+    for arg in args:
+        try:
+            func(arg)
+        except ValueError:
+            pass
+    latency = (time.perf_counter() - start) / len(args) * 1e6
+    print(f"{name:>14}: {latency:8.2f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lang", default="uk")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    for label, forms in MORPH_FORMS.items():
+        if label != "num_class":
+            parser.add_argument(f"--{label.replace('_', '-')}", choices=forms)
+    args = parser.parse_args()
+
+    load_numeral_data(args.lang)
+    morph = MorphSpec(
+        num_class="ordinal",
+        **{
+            label: getattr(args, label) for label in MORPH_FORMS if label != "num_class"
+        },
+    )
+
+    random.seed(args.seed)
+    days = [random.randint(1, 31) for _ in range(args.calls)]
+    years = [random.randrange(YEARS_START, YEARS_STOP) for _ in range(args.calls)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        start = time.perf_counter()
+        build_date_tables(args.lang)
+        print(f"{'tables':>14}: {time.perf_counter() - start:8.2f} s")
+
+        numerals = list()
+        for year in years:
+            try:
+                numerals.append(
+                    year2numeral(year, args.lang, morph=morph)["numeral_forms"][0]
+                )
+            except ValueError:
+                pass
+
+        measure("day2numeral", lambda x: day2numeral(x, args.lang, morph=morph), days)
+        measure("int2numeral", lambda x: int2numeral(x, args.lang, morph=morph), days)
+        measure(
+            "year2numeral", lambda x: year2numeral(x, args.lang, morph=morph), years
+        )
+        measure("int2numeral", lambda x: int2numeral(x, args.lang, morph=morph), years)
+        measure("numeral2year", lambda x: numeral2year(x, args.lang), numerals)
+        measure("numeral2int", lambda x: numeral2int(x, args.lang), numerals)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Throughput of `int2numeral` on random 6- to 30-digit numbers
+
+Numbers longer than the language maximum order are shortened to it;
+the first pass includes building of the group templates
+
+    python benchmarks/bench_int2numeral.py --lang uk --numbers 20000 --case genetive
+
+"""
+import argparse
+import random
+import time
+import warnings
+
+from numeral_converter import (
+    MorphSpec,
+    int2numeral,
+    load_numeral_data,
+    maximum_number_order_to_convert,
+)
+from numeral_converter.constants import MORPH_FORMS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lang", default="uk")
+    parser.add_argument("--numbers", type=int, default=20000)
+    parser.add_argument("--min-digits", type=int, default=6)
+    parser.add_argument("--max-digits", type=int, default=30)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    for label, forms in MORPH_FORMS.items():
+        parser.add_argument(f"--{label.replace('_', '-')}", choices=forms)
+    args = parser.parse_args()
+
+    load_numeral_data(args.lang)
+    max_digits = min(args.max_digits, maximum_number_order_to_convert(args.lang) + 3)
+    morph = MorphSpec(**{label: getattr(args, label) for label in MORPH_FORMS})
+
+    random.seed(args.seed)
+    numbers = [
+        random.randrange(10 ** (n_digits - 1), 10**n_digits)
+        for n_digits in (
+            random.randint(args.min_digits, max_digits) for _ in range(args.numbers)
+        )
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i_pass in range(args.passes):
+            n_errors = 0
+            start = time.perf_counter()
+            for number in numbers:
+                try:
+                    int2numeral(number, lang=args.lang, morph=morph)
+                except ValueError:
+                    n_errors += 1
+            rate = len(numbers) / (time.perf_counter() - start)
+            print(
+                f"pass {i_pass}: {rate:10.1f} numbers/sec "
+                f"({args.min_digits}-{max_digits} digits, {n_errors} errors)"
+            )
+
+
+if __name__ == "__main__":
+    main()
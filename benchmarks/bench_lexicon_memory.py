@@ -0,0 +1,83 @@
+"""
+Memory held by the numeral lexicon (fuzzy tree and its payloads)
+of the languages, counted once per object
+
+    python benchmarks/bench_lexicon_memory.py uk ru en
+    python benchmarks/bench_lexicon_memory.py --compressed uk ru en
+
+"""
+import argparse
+import sys
+import time
+
+from numeral_converter import load_numeral_data
+from numeral_converter.lang_data_loader import NUMERAL_TREE
+
+
+def deep_sizeof(obj, seen):
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            stack.extend(getattr(obj, "__dict__", dict()).values())
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return size
+
+
+def payloads(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.get("value") is not None:
+            yield node["value"]
+        stack.extend(node["children"].values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("langs", nargs="+")
+    parser.add_argument(
+        "--compressed", action="store_true", help="load stem + suffix lexicon"
+    )
+    args = parser.parse_args()
+
+    for lang in args.langs:
+        start = time.perf_counter()
+        load_numeral_data(lang, compressed_lexicon=args.compressed)
+        seconds = time.perf_counter() - start
+
+        numeral_tree = NUMERAL_TREE[lang]
+        if args.compressed:
+            print(
+                f"{lang}: {len(numeral_tree)} words, {numeral_tree.n_stems} stems, "
+                f"{numeral_tree.n_paradigms} paradigms, "
+                f"lexicon {deep_sizeof(numeral_tree, set()) / 2**10:.1f} KiB, "
+                f"loaded in {seconds:.1f} s"
+            )
+            continue
+
+        tree = getattr(numeral_tree, "_FuzzyMultiDict__prefix_tree")
+        values = list(payloads(tree))
+        tree_size = deep_sizeof(tree, set())
+        payloads_size = deep_sizeof(values, set()) - sys.getsizeof(values)
+        print(
+            f"{lang}: {len(values)} words, lexicon {tree_size / 2**10:.1f} KiB, "
+            f"payloads {payloads_size / 2**10:.1f} KiB, loaded in {seconds:.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,27 @@
+from .converter import NumeralConverter
+from .dates import day2numeral, numeral2year, year2numeral
 from .lang_data_loader import (
     get_available_languages,
+    is_ready,
     load_numeral_data,
+    load_numeral_data_async,
     maximum_number_order_to_convert,
 )
-from .numeral_converter import int2numeral, numeral2int
-from .text import convert_numerical_in_text
+from .morph import MorphSpec
+from .numeral_converter import (
+    build_numeral_forms_table,
+    int2numeral,
+    int2numeral_range,
+    numeral2int,
+)
+from .parser import NumeralParser
+from .table import convert_csv
+from .text import (
+    convert_corpus,
+    convert_numerical_in_stream,
+    convert_numerical_in_text,
+    find_numerals,
+)
+from .writer import write_numerals
 
 __version__ = "0.0.2"
@@ -0,0 +1,187 @@
+import asyncio
+import functools
+import weakref
+from concurrent.futures import Executor
+from typing import Any, Callable, MutableMapping, Optional
+
+from .lang_data_loader import is_ready, load_numeral_data_async
+from .numeral_converter import (
+    int2numeral as int2numeral_sync,
+    numeral2int as numeral2int_sync,
+)
+from .text import (
+    convert_numerical_in_text as convert_numerical_in_text_sync,
+    split_text,
+)
+
+# texts shorter than INLINE_TEXT_LENGTH are converted in the event loop thread
+INLINE_TEXT_LENGTH = 1024
+# longer texts are converted on the executor piece by piece
+PIECE_LENGTH = 65536
+
+__EXECUTOR: Optional[Executor] = None
+__MAX_PENDING = 32
+
+__SEMAPHORES: MutableMapping[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def configure(executor: Optional[Executor] = None, max_pending: int = 32):
+    """
+    Configures execution of the asyncio API calls
+
+    :param Optional[Executor] executor: executor to run the conversion jobs on;
+           default is None: the event loop default executor
+    :param int max_pending: maximum number of the jobs run on the executor
+           at the same time in one event loop; next jobs wait for a free slot;
+           default = 32
+
+    :Example:
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from numeral_converter import aio
+    >>> aio.configure(executor=ThreadPoolExecutor(4), max_pending=8)
+
+    """
+    global __EXECUTOR, __MAX_PENDING
+
+    if max_pending < 1:
+        raise ValueError(f"invalid max_pending {max_pending}; expects positive int")
+
+    __EXECUTOR = executor
+    __MAX_PENDING = max_pending
+    __SEMAPHORES.clear()
+
+
+async def load_numeral_data(lang: str, compressed_lexicon: bool = False):
+    """
+    Loads language `lang` data without blocking the event loop
+
+    Concurrent calls for the same language wait for one loading
+    (see `load_numeral_data_async()`); cancellation of a waiting call
+    doesn't cancel the loading
+
+    :param lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param bool compressed_lexicon: if True - numeral words are stored
+           as stems and suffix tables; see `load_numeral_data()`; default = False
+
+    :Example:
+
+    >>> from numeral_converter import aio
+    >>> await aio.load_numeral_data("uk")
+
+    """
+    if is_ready(lang):
+        return
+
+    await asyncio.shield(
+        asyncio.wrap_future(
+            load_numeral_data_async(lang, compressed_lexicon=compressed_lexicon)
+        )
+    )
+
+
+async def numeral2int(numeral: str, lang: str) -> Optional[int]:
+    """
+    Converts input numeral in language `lang` into integer value
+    without blocking the event loop; see `numeral_converter.numeral2int()`
+
+    :param numeral: input numeral in language `lang`
+    :param lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :return Optional [int]: integer value; None if it fails to convert
+
+    :Example:
+
+    >>> from numeral_converter import aio
+    >>> await aio.numeral2int("сорок два", lang="uk")
+    42
+
+    """
+    await load_numeral_data(lang)
+    return await __run(numeral2int_sync, numeral, lang=lang)
+
+
+async def int2numeral(value: int, lang: str, **kwargs):
+    """
+    Converts input integer number into a numeral in language `lang`
+    without blocking the event loop; see `numeral_converter.int2numeral()`
+
+    :param value: input integer value
+    :param lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :return str: string numeral in language `lang` in a morphological form
+            given by the argument-parameters
+
+    :Example:
+
+    >>> from numeral_converter import aio
+    >>> await aio.int2numeral(42, lang='uk', case="genetive")
+    {'numeral': 'сорока двох', 'numeral_forms': ['сорока двох']}
+
+    """
+    await load_numeral_data(lang)
+    return await __run(int2numeral_sync, value, lang=lang, **kwargs)
+
+
+async def convert_numerical_in_text(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+) -> str:
+    """
+    Converts numerical string in text into integer values
+    without blocking the event loop; see
+    `numeral_converter.convert_numerical_in_text()`
+
+    Short texts are converted in place; long texts are converted on the executor
+    piece by piece, so cancellation takes effect after the current piece
+
+    :param str text: input text
+    :param str lang: input text language
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :return str: updated text with converted numerical into integer
+
+    :Example:
+
+    >>> from numeral_converter import aio
+    >>> await aio.convert_numerical_in_text("Лежало чотири книги.", lang='uk')
+    'Лежало 4 книги.'
+
+    """
+    await load_numeral_data(lang)
+
+    convert = functools.partial(
+        convert_numerical_in_text_sync,
+        lang=lang,
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    )
+
+    if len(text) < INLINE_TEXT_LENGTH:
+        return convert(text)
+
+    pieces = split_text(text, n_pieces=len(text) // PIECE_LENGTH)
+    return "".join([await __run(convert, piece) for piece in pieces])
+
+
+async def __run(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+
+    semaphore = __SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = __SEMAPHORES.setdefault(loop, asyncio.Semaphore(__MAX_PENDING))
+
+    async with semaphore:
+        return await loop.run_in_executor(
+            __EXECUTOR, functools.partial(func, *args, **kwargs)
+        )
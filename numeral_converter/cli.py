@@ -0,0 +1,422 @@
+import argparse
+import codecs
+import collections
+import functools
+import json
+import mmap
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .constants import MORPH_FORMS
+from .lang_data_loader import check_numeral_data_load
+from .numeral_converter import int2numeral, numeral2int
+from .parallel import get_pool
+from .text import convert_numerical_in_chunks, convert_numerical_in_text
+
+OPERATIONS = ("numeral2int", "int2numeral", "text")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `numeral-converter` command
+
+    :Example:
+
+    > numeral-converter file dump.txt -o dump.converted.txt --lang uk --stats
+    > numeral-converter file dump.txt --in-place --lang uk
+    > cat numerals.txt | numeral-converter lines numeral2int --lang uk
+    > cat records.jsonl | numeral-converter lines text --lang uk --field text
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="numeral-converter", description="Converts numerals into integers"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    file_parser = subparsers.add_parser(
+        "file", help="convert numerals in text file into integers"
+    )
+    file_parser.add_argument("input", help="input UTF-8 text file")
+    output_group = file_parser.add_mutually_exclusive_group(required=True)
+    output_group.add_argument("-o", "--output", help="output file")
+    output_group.add_argument(
+        "--in-place", action="store_true", help="overwrite the input file"
+    )
+    file_parser.add_argument("--lang", required=True, help="text language")
+    file_parser.add_argument(
+        "--max-corrections",
+        type=int,
+        default=0,
+        help="maximum number of corrections in a numeral word; default = 0",
+    )
+    file_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 20,
+        help="number of bytes decoded at a time; default = 1048576",
+    )
+    file_parser.add_argument(
+        "--stats", action="store_true", help="print throughput to stderr"
+    )
+
+    lines_parser = subparsers.add_parser(
+        "lines", help="convert standard input line by line into standard output"
+    )
+    lines_parser.add_argument(
+        "operation",
+        choices=OPERATIONS,
+        help="numeral2int, int2numeral or text "
+        "(convert numerals in text into integers)",
+    )
+    lines_parser.add_argument("--lang", required=True, help="language")
+    lines_parser.add_argument(
+        "--field",
+        help="read JSONL records and convert the field; "
+        "default: convert the whole line",
+    )
+    lines_parser.add_argument(
+        "--max-corrections",
+        type=int,
+        default=0,
+        help="maximum number of corrections in a numeral word "
+        "for the text operation; default = 0",
+    )
+    for label, forms in MORPH_FORMS.items():
+        lines_parser.add_argument(
+            f"--{label.replace('_', '-')}",
+            choices=forms,
+            help=f"numeral {label} for the int2numeral operation",
+        )
+    lines_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes; default is the number of CPUs",
+    )
+    lines_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="number of lines sent to a worker at a time; default = 256",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "file":
+        if args.chunk_size < 1:
+            parser.error(f"invalid chunk size {args.chunk_size}; expects positive int")
+
+        start = time.perf_counter()
+        try:
+            size = convert_file(
+                args.input,
+                args.input if args.in_place else args.output,
+                lang=args.lang,
+                chunk_size=args.chunk_size,
+                max_corrections=args.max_corrections,
+            )
+        except (OSError, ValueError) as e:
+            print(f"{parser.prog}: error: {args.input}: {e}", file=sys.stderr)
+            return 1
+        seconds = time.perf_counter() - start
+
+        if args.stats:
+            print(
+                f"{args.input}: {size / 1e6:.1f} MB in {seconds:.2f} s "
+                f"({size / 1e6 / max(seconds, 1e-9):.1f} MB/s)",
+                file=sys.stderr,
+            )
+
+    elif args.command == "lines":
+        if args.workers is not None and args.workers < 1:
+            parser.error(f"invalid number of workers {args.workers}")
+        if args.batch_size < 1:
+            parser.error(f"invalid batch size {args.batch_size}; expects positive int")
+
+        try:
+            convert_lines(
+                sys.stdin,
+                sys.stdout,
+                operation=args.operation,
+                lang=args.lang,
+                field=args.field,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                errors=sys.stderr,
+                max_corrections=args.max_corrections,
+                **{
+                    label: getattr(args, label)
+                    for label in MORPH_FORMS
+                    if getattr(args, label) is not None
+                },
+            )
+        except (OSError, ValueError) as e:
+            print(f"{parser.prog}: error: {e}", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+def convert_file(
+    input_filename: str,
+    output_filename: str,
+    lang: str,
+    chunk_size: int = 1 << 20,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+) -> int:
+    """
+    Converts numerals in UTF-8 text file into integers
+
+    The input file is memory-mapped (pipes and devices are read as streams)
+    and decoded chunk by chunk, so the whole text is never loaded into memory;
+    if the output file is the input file, the result is written into a temporary
+    file which then replaces the input; if the conversion fails, the output file
+    is removed and the input is kept; the output is not touched if the input
+    can't be opened
+
+    :param str input_filename: input file name
+    :param str output_filename: output file name; may be the same as the input
+    :param str lang: text language
+    :param int chunk_size: number of bytes decoded at a time; default = 1048576
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :return int: number of bytes read
+
+    """
+    in_place = os.path.exists(output_filename) and os.path.samefile(
+        input_filename, output_filename
+    )
+
+    with open(input_filename, "rb") as reader:
+        if stat.S_ISREG(os.fstat(reader.fileno()).st_mode):
+            chunks = __mapped_chunks(reader, chunk_size)
+        else:
+            # pipes and character devices are not mapped; they are read as streams
+            chunks = iter(functools.partial(reader.read, chunk_size), b"")
+
+        if in_place:
+            fd, output_filename = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(input_filename))
+            )
+            os.close(fd)
+
+        size = [0]
+        is_written = in_place
+        try:
+            with open(output_filename, "w", encoding="utf-8", newline="") as writer:
+                is_written = True
+                for segment in convert_numerical_in_chunks(
+                    __decoded_chunks(chunks, size),
+                    lang=lang,
+                    max_corrections=max_corrections,
+                    max_corrections_relative=max_corrections_relative,
+                ):
+                    writer.write(segment)
+        except BaseException:
+            # the output is removed only if it is created or truncated here
+            if is_written and os.path.exists(output_filename):
+                os.remove(output_filename)
+            raise
+
+    if in_place:
+        shutil.copymode(input_filename, output_filename)
+        os.replace(output_filename, input_filename)
+
+    return size[0]
+
+
+def __mapped_chunks(reader, chunk_size: int) -> Iterator[bytes]:
+    size = os.fstat(reader.fileno()).st_size
+    if not size:
+        return
+
+    with mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for position in range(0, size, chunk_size):
+            yield data[position : position + chunk_size]
+
+
+def __decoded_chunks(chunks: Iterable[bytes], size: List[int]) -> Iterator[str]:
+    # `size` counts the bytes read
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        size[0] += len(chunk)
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
+
+
+def convert_lines(
+    reader: Iterable[str],
+    writer: TextIO,
+    operation: str,
+    lang: str,
+    field: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: int = 256,
+    errors: Optional[TextIO] = None,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+    **kwargs,
+):
+    """
+    Converts lines one by one with `numeral2int()`, `int2numeral()`
+    or `convert_numerical_in_text()`
+
+    Lines are sent to a pool of processes in batches of `batch_size` lines;
+    at most 2 batches per worker are processed at a time, and the results are
+    written in the order of the input lines
+
+    A line which fails to convert doesn't stop the conversion:
+    in JSONL mode the output record gets an "error" key and keeps the field
+    unchanged; otherwise the output line is empty and
+    the `{"line": ..., "error": ...}` record is written into `errors`
+
+    :param Iterable[str] reader: input lines
+    :param TextIO writer: output
+    :param str operation: "numeral2int", "int2numeral" or "text"
+    :param str lang: language identifier
+    :param Optional[str] field: if not None - lines are JSONL records,
+           and the field `field` of each record is converted; default = None
+    :param Optional[int] workers: number of worker processes;
+           default is the number of CPUs; if 1 - lines are converted
+           in the current process
+    :param int batch_size: number of lines sent to a worker at a time;
+           default = 256
+    :param Optional[TextIO] errors: output for the error records in plain mode;
+           default is None: the errors are not written
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key
+           for the "text" operation; default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key for the "text" operation; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :param kwargs: morphological form for the "int2numeral" operation;
+           see `int2numeral()`
+
+    :Example:
+
+    >>> import io, sys
+    >>> from numeral_converter.cli import convert_lines
+    >>> convert_lines(io.StringIO("сорок два\\nсто\\n"), sys.stdout,
+    ...               "numeral2int", lang="uk")
+    42
+    100
+
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"invalid operation {operation}; use one of {OPERATIONS}")
+
+    if operation == "text":
+        kwargs = dict(
+            max_corrections=max_corrections,
+            max_corrections_relative=max_corrections_relative,
+        )
+
+    check_numeral_data_load(lang)
+
+    workers = workers or os.cpu_count() or 1
+    batches = __batches(reader, batch_size)
+
+    if workers == 1:
+        results = (
+            __convert_batch(batch, operation, lang, field, kwargs) for batch in batches
+        )
+    else:
+        results = __ordered_results(
+            get_pool(lang, workers), batches, workers, operation, lang, field, kwargs
+        )
+
+    i_line = 0
+    for result in results:
+        for output_line, error in result:
+            i_line += 1
+            writer.write(output_line)
+            writer.write("\n")
+            if error is not None and errors is not None:
+                errors.write(json.dumps({"line": i_line, "error": error}))
+                errors.write("\n")
+
+
+def __batches(reader: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    batch = list()
+    for line in reader:
+        batch.append(line.rstrip("\r\n"))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = list()
+
+    if batch:
+        yield batch
+
+
+def __ordered_results(pool, batches, workers, operation, lang, field, kwargs):
+    pending: collections.deque = collections.deque()
+
+    for batch in batches:
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().get()
+
+        pending.append(
+            pool.apply_async(__convert_batch, (batch, operation, lang, field, kwargs))
+        )
+
+    while pending:
+        yield pending.popleft().get()
+
+
+def __convert_batch(
+    lines: List[str],
+    operation: str,
+    lang: str,
+    field: Optional[str],
+    kwargs: Dict[str, Any],
+) -> List[Tuple[str, Optional[str]]]:
+    results: List[Tuple[str, Optional[str]]] = []
+
+    for line in lines:
+        if field is None:
+            try:
+                value = __convert(line, operation, lang, kwargs)
+                results.append(("" if value is None else str(value), None))
+            except Exception as e:
+                results.append(("", f"{type(e).__name__}: {e}"))
+            continue
+
+        record = None
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("JSONL record is not an object")
+            record[field] = __convert(record[field], operation, lang, kwargs)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if not isinstance(record, dict):
+                record = {"input": line}
+            record["error"] = error
+            results.append((json.dumps(record, ensure_ascii=False), error))
+        else:
+            results.append((json.dumps(record, ensure_ascii=False), None))
+
+    return results
+
+
+def __convert(value: Any, operation: str, lang: str, kwargs: Dict[str, Any]) -> Any:
+    if operation == "numeral2int":
+        return numeral2int(value, lang=lang)
+
+    if operation == "int2numeral":
+        return int2numeral(int(value), lang=lang, **kwargs)["numeral"]
+
+    return convert_numerical_in_text(value, lang=lang, **kwargs)
@@ -0,0 +1,492 @@
+import bisect
+import os
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .lexicon import LexiconEntry, MorphFeatures
+from .number_items import NumberItems
+
+# paradigm: suffix of each form -> morphological features of the form
+Paradigm = Dict[str, Tuple[MorphFeatures, ...]]
+# row of the fuzzy search: query position, path, prefix tree node, corrections
+Row = Tuple[int, str, str, List[Dict[str, Any]]]
+
+
+class CompressedLexicon:
+    """
+    Numeral lexicon stored as stems and suffix tables; can be used in place
+    of the fuzzy tree of numeral words (`FuzzyMultiDict`)
+
+    Forms of a lemma (words of one number and numeral class) are stored as
+    their common stem and a paradigm: suffixes of the forms and their
+    morphological features; equal paradigms of different lemmas are one table,
+    numbers of the lemmas are stored in `NumberItems`
+
+    Words are looked up as by `FuzzyMultiDict.get()`: the word itself
+    if it is in the lexicon, else the words that can be obtained from it
+    by the minimal number of corrections (insertion, deletion, substitution
+    and transposition of symbols); the search walks the prefix tree of the words
+    as `FuzzyMultiDict` does, so words with equal number of corrections are
+    found in the same order; children of a tree node are computed from the stems
+    (ordered by the first word added with each of them) and cached
+
+    :param Iterable[Tuple[str, Any, int, Optional[bool], MorphFeatures]] words:
+           word, its number value, order, scale flag and morphological features;
+           the number of the first occurrence of a word is kept, features
+           of all the occurrences are merged
+    :param Optional[int] max_corrections: default maximum number of corrections;
+           default = 2
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections: round(max_corrections_relative * length);
+           default = None
+
+    :Example:
+
+    >>> from numeral_converter.compressed_lexicon import CompressedLexicon
+    >>> from numeral_converter.lexicon import MorphFeatures
+    >>> lexicon = CompressedLexicon(
+    ...     (word, 3, 0, None, MorphFeatures({"case": case}))
+    ...     for word, case in [("третій", "nominative"), ("третього", "genetive")]
+    ... )
+    >>> lexicon.get("третього")[0]["value"]  # doctest: +NORMALIZE_WHITESPACE
+    LexiconEntry(value=3.0, order=0, scale=None,
+                 morph_forms=(MorphFeatures({'case': 'genetive'}),))
+    >>> lexicon.get("третього")[0]["key"], lexicon.get("третого")[0]["key"]
+    ('третього', 'третього')
+
+    """
+
+    # number of the tree nodes whose children are cached
+    __CHILDREN_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        words: Iterable[Tuple[str, Any, int, Optional[bool], MorphFeatures]],
+        max_corrections: Optional[int] = 2,
+        max_corrections_relative: Optional[float] = None,
+    ):
+        self.max_corrections = max_corrections
+        self.max_corrections_relative = max_corrections_relative
+
+        word_forms: Dict[str, Tuple[tuple, List[MorphFeatures]]] = dict()
+        for word, value, order, scale, morph in words:
+            _, morph_forms = word_forms.setdefault(word, ((value, order, scale), []))
+            if morph not in morph_forms:
+                morph_forms.append(morph)
+
+        lemmas: Dict[tuple, List[str]] = dict()
+        for word, (number, morph_forms) in word_forms.items():
+            lemma = (number, type(number[0]), morph_forms[0].get("num_class"))
+            lemmas.setdefault(lemma, []).append(word)
+
+        self.__stems: Dict[str, Tuple[int, ...]] = dict()
+        self.__paradigms: List[Paradigm] = list()
+        self.__lemmas = NumberItems()
+        self.__lemma_paradigms = array("I")
+        self.__n_words = len(word_forms)
+
+        # ids of the words (in order they are added) by the paradigm suffixes
+        # of each lemma, starting at `__lemma_word_ids[lemma_id]`
+        word_ids = {word: i for i, word in enumerate(word_forms)}
+        self.__word_ids = array("I")
+        self.__lemma_word_ids = array("I")
+
+        paradigm_ids: Dict[tuple, int] = dict()
+        for (number, _, __), lemma_words in lemmas.items():
+            stem = os.path.commonprefix(lemma_words)
+            paradigm = tuple(
+                sorted(
+                    (word[len(stem) :], tuple(word_forms[word][1]))
+                    for word in lemma_words
+                )
+            )
+            paradigm_id = paradigm_ids.setdefault(paradigm, len(paradigm_ids))
+            if paradigm_id == len(self.__paradigms):
+                self.__paradigms.append(dict(paradigm))
+
+            self.__stems[stem] = self.__stems.get(stem, ()) + (len(self.__lemmas),)
+            self.__lemmas.append_item(*number)
+            self.__lemma_paradigms.append(paradigm_id)
+            self.__lemma_word_ids.append(len(self.__word_ids))
+            self.__word_ids.extend(word_ids[stem + suffix] for suffix, _ in paradigm)
+
+        self.__sorted_stems = sorted(self.__stems)
+        self.__children_cache: Dict[str, str] = dict()
+
+    def __len__(self) -> int:
+        return self.__n_words
+
+    def __iter__(self) -> Iterator[str]:
+        for stem, lemma_ids in self.__stems.items():
+            for lemma_id in lemma_ids:
+                for suffix in self.__paradigms[self.__lemma_paradigms[lemma_id]]:
+                    yield stem + suffix
+
+    def __getitem__(self, query: str) -> LexiconEntry:
+        if not isinstance(query, str):
+            raise TypeError(f"Invalid key type: expect str; got {type(query)}")
+
+        value = self.get(query)
+        if len(value):
+            return value[0]["value"]
+
+        raise KeyError(query)
+
+    @property
+    def n_stems(self) -> int:
+        return len(self.__stems)
+
+    @property
+    def n_paradigms(self) -> int:
+        return len(self.__paradigms)
+
+    def get(
+        self,
+        query: str,
+        max_corrections: Optional[int] = None,
+        max_corrections_relative: Optional[float] = None,
+        extract_all: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extracting the value given the `query`; see `FuzzyMultiDict.get()`
+
+        :param str query: query to search for lexicon word
+        :param Optional[int] max_corrections: maximum number of corrections
+               in the query
+        :param Optional[float] max_corrections_relative: value to calculate
+               maximum number of corrections in the query; if not None -
+               `max_corrections` will be ignored;
+               calculated as round(max_corrections_relative * query_length)
+        :param bool extract_all: if True - all the words that can be obtained
+               from the query by no more than `max_corrections` corrections
+               will be returned
+        :return List[Dict[str, Any]]: found words:
+                [{"value": <LexiconEntry>, "key": <word>, "correction": <list>}, ...]
+
+        """
+        if max_corrections_relative is not None:
+            max_corrections = round(max_corrections_relative * len(query))
+        elif max_corrections is None and self.max_corrections_relative is not None:
+            max_corrections = round(self.max_corrections_relative * len(query))
+        elif max_corrections is None:
+            max_corrections = self.max_corrections or 0
+
+        node, position = self.__apply_string("", query, 0)
+
+        result: Dict[str, Dict[str, Any]] = dict()
+        if position == len(query):
+            entry = self.__get_exact(query)
+            if entry is not None:
+                result[query] = {"value": entry, "key": query, "correction": list()}
+                if not extract_all:
+                    return self.__prepare_result(result, extract_all)
+
+        # rows of the search: query position, path, prefix tree node, corrections;
+        # nodes are the prefixes of the words
+        rows: List[Row] = [
+            (position, query[:position], node, list()),
+            (0, "", "", list()),
+        ]
+        processed = {(position, path): 0 for position, path, _, __ in rows}
+
+        while True:
+            next_rows: List[Row] = list()
+            for position, path, node, correction in rows:
+                row = self.__check_value(
+                    node, path, query, position, correction, result, extract_all
+                )
+                if row is not None:
+                    result[path] = row
+                    if len(correction) < max_corrections and not extract_all:
+                        max_corrections = len(correction)
+                    continue
+
+                self.__apply_as_is(
+                    next_rows, processed, query, position, path, node, correction
+                )
+                if len(correction) >= max_corrections:
+                    continue
+
+                self.__apply_insertion(
+                    next_rows, processed, query, position, path, node, correction
+                )
+                if position < len(query):
+                    self.__apply_deletion(
+                        next_rows, processed, query, position, path, node, correction
+                    )
+                    self.__apply_substitution(
+                        next_rows, processed, query, position, path, node, correction
+                    )
+                if position + 1 < len(query):
+                    self.__apply_transposition(
+                        next_rows, processed, query, position, path, node, correction
+                    )
+
+            if not next_rows:
+                break
+            rows = next_rows
+
+        return self.__prepare_result(result, extract_all)
+
+    def __get_exact(self, word: str) -> Optional[LexiconEntry]:
+        for i in range(len(word), -1, -1):
+            lemma_ids = self.__stems.get(word[:i])
+            if lemma_ids is None:
+                continue
+
+            for lemma_id in lemma_ids:
+                paradigm = self.__paradigms[self.__lemma_paradigms[lemma_id]]
+                morph_forms = paradigm.get(word[i:])
+                if morph_forms is not None:
+                    return LexiconEntry(*self.__lemmas[lemma_id], morph_forms)
+
+        return None
+
+    def __children(self, node: str) -> str:
+        # next symbols of the words with prefix `node`, ordered by the first
+        # word added with each of them, as the children of a tree node are
+        children = self.__children_cache.get(node)
+        if children is not None:
+            return children
+
+        first_words: Dict[str, int] = dict()
+        stems = [node[:i] for i in range(len(node)) if node[:i] in self.__stems]
+        i = bisect.bisect_left(self.__sorted_stems, node)
+        while i < len(self.__sorted_stems) and self.__sorted_stems[i].startswith(node):
+            stems.append(self.__sorted_stems[i])
+            i += 1
+
+        for stem in stems:
+            for lemma_id in self.__stems[stem]:
+                paradigm = self.__paradigms[self.__lemma_paradigms[lemma_id]]
+                word_ids = self.__word_ids[self.__lemma_word_ids[lemma_id] :]
+                for suffix, word_id in zip(paradigm, word_ids):
+                    word = stem + suffix
+                    if len(word) > len(node) and word.startswith(node):
+                        c = word[len(node)]
+                        first_words[c] = min(first_words.get(c, word_id), word_id)
+
+        if len(self.__children_cache) >= self.__CHILDREN_CACHE_SIZE:
+            self.__children_cache.clear()
+
+        children = "".join(sorted(first_words, key=first_words.__getitem__))
+        self.__children_cache[node] = children
+        return children
+
+    def __apply_string(self, node: str, s: str, position: int) -> Tuple[str, int]:
+        for c in s[position:]:
+            if c not in self.__children(node):
+                break
+            node += c
+            position += 1
+
+        return node, position
+
+    def __check_value(
+        self,
+        node: str,
+        path: str,
+        query: str,
+        position: int,
+        correction: List[Dict[str, Any]],
+        result: Dict[str, Dict[str, Any]],
+        extract_all: bool,
+    ) -> Optional[Dict[str, Any]]:
+        if position != len(query):
+            return None
+
+        entry = self.__get_exact(node)
+        if entry is None:
+            return None
+
+        row = result.get(path)
+        if row is None or extract_all or len(row["correction"]) > len(correction):
+            return {"value": entry, "key": path, "correction": correction}
+
+        return None
+
+    @staticmethod
+    def __push(
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        n_processed = processed.get((position, path))
+        if n_processed is None or n_processed > len(correction):
+            rows.append((position, path, node, correction))
+            processed[(position, path)] = len(correction)
+
+    def __apply_as_is(
+        self,
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        query: str,
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        children = self.__children(node)
+        if position + 1 >= len(query) or query[position] not in children:
+            return
+
+        self.__push(
+            rows,
+            processed,
+            position + 1,
+            path + query[position],
+            node + query[position],
+            correction,
+        )
+        next_node, next_position = self.__apply_string(node, query, position)
+        self.__push(
+            rows,
+            processed,
+            next_position,
+            path + query[position:next_position],
+            next_node,
+            correction,
+        )
+
+    def __apply_insertion(
+        self,
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        query: str,
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        for c in self.__children(node):
+            next_correction = correction + [
+                {"correction": f'insertion of "{c}"', "position": position}
+            ]
+            self.__push(rows, processed, position, path + c, node + c, next_correction)
+            next_node, next_position = self.__apply_string(node + c, query, position)
+            self.__push(
+                rows,
+                processed,
+                next_position,
+                path + c + query[position:next_position],
+                next_node,
+                next_correction,
+            )
+
+    def __apply_deletion(
+        self,
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        query: str,
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        next_correction = correction + [
+            {"correction": f'deletion of "{query[position]}"', "position": position}
+        ]
+        self.__push(rows, processed, position + 1, path, node, next_correction)
+        next_node, next_position = self.__apply_string(node, query, position + 1)
+        self.__push(
+            rows,
+            processed,
+            next_position,
+            path + query[position + 1 : next_position],
+            next_node,
+            next_correction,
+        )
+
+    def __apply_substitution(
+        self,
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        query: str,
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        for c in self.__children(node):
+            if c == query[position]:
+                continue
+
+            next_correction = correction + [
+                {
+                    "correction": f'substitution "{query[position]}" for "{c}"',
+                    "position": position,
+                }
+            ]
+            self.__push(
+                rows, processed, position + 1, path + c, node + c, next_correction
+            )
+            next_node, next_position = self.__apply_string(
+                node + c, query, position + 1
+            )
+            self.__push(
+                rows,
+                processed,
+                next_position,
+                path + c + query[position + 1 : next_position],
+                next_node,
+                next_correction,
+            )
+
+    def __apply_transposition(
+        self,
+        rows: List[Row],
+        processed: Dict[Tuple[int, str], int],
+        query: str,
+        position: int,
+        path: str,
+        node: str,
+        correction: List[Dict[str, Any]],
+    ):
+        swapped = query[position + 1] + query[position]
+        if swapped[0] not in self.__children(node) or swapped[1] not in (
+            self.__children(node + swapped[0])
+        ):
+            return
+
+        next_correction = correction + [
+            {
+                "correction": "transposition of symbols "
+                f'"{query[position:position + 2]}"',
+                "position": position,
+            }
+        ]
+        self.__push(
+            rows,
+            processed,
+            position + 2,
+            path + swapped,
+            node + swapped,
+            next_correction,
+        )
+        next_node, next_position = self.__apply_string(
+            node + swapped, query, position + 2
+        )
+        # the path is extended as FuzzyMultiDict extends it, so that the keys
+        # of the words found after a transposition are the same
+        self.__push(
+            rows,
+            processed,
+            next_position,
+            path + path + swapped + query[position + 2 : next_position],
+            next_node,
+            next_correction,
+        )
+
+    @staticmethod
+    def __prepare_result(
+        result: Dict[str, Dict[str, Any]], extract_all: bool
+    ) -> List[Dict[str, Any]]:
+        rows = list(result.values())
+        if not extract_all and rows:
+            min_n_corrections = min(len(x["correction"]) for x in rows)
+            rows = [x for x in rows if len(x["correction"]) == min_n_corrections]
+
+        return sorted(rows, key=lambda x: len(x["correction"]))
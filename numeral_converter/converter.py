@@ -0,0 +1,165 @@
+import functools
+from typing import Any, Dict, Optional
+
+from .lang_data_loader import (
+    NUMERAL_DATA,
+    NUMERAL_FORMS,
+    NUMERAL_FORMS_TABLE,
+    NUMERAL_PREFILTER,
+    NUMERAL_TREE,
+    check_numeral_data_load,
+)
+from .morph import MorphSpec
+from .numeral_converter import (
+    check_numeral_morph,
+    int2number_items,
+    number_items2int,
+    number_items2numeral,
+    numeral_words2number_items,
+    preprocess_numeral,
+)
+from .text import replace_numerals, scan_numerals
+
+
+class NumeralConverter:
+    """
+    Converter bound to language `lang` data and default morphological form
+
+    Language data (including the precomputed forms table, if it is built)
+    is looked up and the default morphological form is validated once,
+    when the converter is created; use it instead of the module functions
+    in loops over many values
+
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param Optional[MorphSpec] morph: default morphological form
+           of `to_words()` numerals; default = None
+    :param default_morph: default morphological form labels: case, num_class,
+           gender, number; override the labels of `morph`; see `int2numeral()`
+
+    :Example:
+
+    >>> from numeral_converter import NumeralConverter
+    >>> converter = NumeralConverter("uk", case="genetive")
+    >>> converter.to_int("сорок два")
+    42
+    >>> converter.to_words(42)
+    {'numeral': 'сорока двох', 'numeral_forms': ['сорока двох']}
+    >>> converter.to_words(42, case="nominative")
+    {'numeral': 'сорок два', 'numeral_forms': ['сорок два']}
+    >>> converter.convert_text("Лежало чотири книги.")
+    'Лежало 4 книги.'
+    >>> converter.max_order
+    33
+
+    """
+
+    def __init__(self, lang: str, morph: Optional[MorphSpec] = None, **default_morph):
+        if morph is None:
+            morph = MorphSpec.from_kwargs(default_morph)
+        else:
+            morph = morph.update(**default_morph)
+
+        check_numeral_data_load(lang)
+
+        self.lang = lang
+        self.default_morph = morph
+
+        self._numeral_tree = NUMERAL_TREE[lang]
+        self._numeral_data = NUMERAL_DATA[lang]
+        self._numeral_forms = NUMERAL_FORMS[lang]
+        self._numeral_prefilter = NUMERAL_PREFILTER[lang]
+        self._numeral_forms_table = NUMERAL_FORMS_TABLE.get(lang)
+
+    @functools.cached_property
+    def max_order(self) -> int:
+        """
+        Order (log10(n)) of the maximum number that can be converted;
+        see `maximum_number_order_to_convert()`
+
+        """
+        return max(self._numeral_data["order"].values)
+
+    def to_int(self, numeral: str) -> int:
+        """
+        Converts numeral into integer value; see `numeral2int()`
+
+        :param str numeral: input numeral
+        :return int: integer value
+
+        """
+        numeral = preprocess_numeral(numeral, self.lang)
+
+        if self._numeral_forms_table is not None:
+            value = self._numeral_forms_table.get_value(numeral)
+            if value is not None:
+                return value
+
+        number_items = numeral_words2number_items(
+            numeral.split(" "), self._numeral_tree
+        )
+        return number_items2int(number_items)
+
+    def to_words(
+        self, value: int, morph: Optional[MorphSpec] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Converts integer value into numeral; see `int2numeral()`
+
+        :param int value: input integer value
+        :param Optional[MorphSpec] morph: morphological form; default is None:
+               the converter default morphological form
+        :param kwargs: morphological form labels: case, num_class, gender, number;
+               override the labels of `morph`
+        :return Dict[str, Any]: numeral and all its forms
+
+        """
+        if morph is None:
+            morph = self.default_morph
+        if kwargs:
+            morph = morph.update(**kwargs)
+
+        if self._numeral_forms_table is not None:
+            numeral = self._numeral_forms_table.get(value, morph)
+            if numeral is not None:
+                check_numeral_morph(value, self.lang, morph, self._numeral_forms)
+                return numeral
+
+        return number_items2numeral(
+            int2number_items(value, self.lang),
+            lang=self.lang,
+            numeral_forms=self._numeral_forms,
+            morph=morph,
+        )
+
+    def convert_text(
+        self,
+        text: str,
+        max_corrections: Optional[int] = 0,
+        max_corrections_relative: Optional[float] = None,
+    ) -> str:
+        """
+        Converts numerical string in text into integer values;
+        see `convert_numerical_in_text()`
+
+        :param str text: input text
+        :param int max_corrections: maximum number of corrections in numeral words;
+               default = 0
+        :param Optional[float] max_corrections_relative: value to calculate
+               maximum number of corrections in numeral words; default = None
+        :return str: updated text with converted numerical into integer
+
+        """
+        return "".join(
+            replace_numerals(
+                text,
+                scan_numerals(
+                    [text],
+                    lang=self.lang,
+                    numeral_tree=self._numeral_tree,
+                    prefilter=self._numeral_prefilter,
+                    max_corrections=max_corrections,
+                    max_corrections_relative=max_corrections_relative,
+                ),
+            )
+        )
@@ -0,0 +1,182 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .forms_table import NumeralFormsTable
+from .morph import MorphSpec
+from .numeral_converter import (
+    check_numeral_morph,
+    int2numeral,
+    make_numeral_forms_table,
+    numeral2int,
+    preprocess_numeral,
+)
+
+# range of years precomputed by default: [YEARS_START, YEARS_STOP)
+YEARS_START = 1000
+YEARS_STOP = 2201
+
+# days and years tables are built separately on the first lookup
+DAY_TABLES: Dict[str, NumeralFormsTable] = dict()
+YEAR_TABLES: Dict[str, NumeralFormsTable] = dict()
+
+__DATE_TABLES_LOCK = threading.Lock()
+
+
+def build_date_tables(
+    lang: str, years_start: int = YEARS_START, years_stop: int = YEARS_STOP
+) -> Tuple[NumeralFormsTable, NumeralFormsTable]:
+    """
+    Precomputes ordinal numerals of days of month 1 - 31 and of years
+    in range [years_start, years_stop) in all the cases, genders and numbers
+    of language `lang`, and their inverse tables
+
+    The days table is built on the first call of `day2numeral()`, the years
+    table on the first call of `year2numeral()` or `numeral2year()`
+    for a language; call the function to build them in advance
+    or for another range of years
+
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param int years_start: first year of the range; default = 1000
+    :param int years_stop: year after the last year of the range; default = 2201
+    :return Tuple[NumeralFormsTable, NumeralFormsTable]: days and years tables
+
+    :Example:
+
+    >>> from numeral_converter.dates import build_date_tables
+    >>> days, years = build_date_tables("uk", years_start=1900, years_stop=2100)
+    >>> years.get_value("дві тисячі двадцять третього")
+    2023
+
+    """
+    DAY_TABLES[lang] = __make_date_table(lang, 1, 32)
+    YEAR_TABLES[lang] = __make_date_table(lang, years_start, years_stop)
+    return DAY_TABLES[lang], YEAR_TABLES[lang]
+
+
+def day2numeral(
+    day: int, lang: str, morph: Optional[MorphSpec] = None, **kwargs
+) -> Dict[str, Any]:
+    """
+    Converts day of month into ordinal numeral in language `lang`
+
+    :param int day: day of month: 1 - 31
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param kwargs: morphological form labels: case, gender, number;
+           override the labels of `morph`; num_class is "ordinal" by default
+    :return Dict[str, Any]: numeral and all its forms; see `int2numeral()`
+
+    :Example:
+
+    >>> from numeral_converter import day2numeral
+    >>> day2numeral(23, lang="uk", case="genetive")
+    {'numeral': 'двадцять третього', 'numeral_forms': ['двадцять третього']}
+    >>> day2numeral(23, lang="en")
+    {'numeral': 'twenty-third', 'numeral_forms': ['twenty-third']}
+
+    """
+    if not 1 <= day <= 31:
+        raise ValueError(f"invalid day of month {day}; expect 1 - 31")
+
+    return __date2numeral(day, lang, DAY_TABLES, 1, 32, morph, kwargs)
+
+
+def year2numeral(
+    year: int, lang: str, morph: Optional[MorphSpec] = None, **kwargs
+) -> Dict[str, Any]:
+    """
+    Converts year into ordinal numeral in language `lang`
+
+    Years out of the precomputed range (see `build_date_tables()`)
+    are converted by `int2numeral()`
+
+    :param int year: year
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param kwargs: morphological form labels: case, gender, number;
+           override the labels of `morph`; num_class is "ordinal" by default
+    :return Dict[str, Any]: numeral and all its forms; see `int2numeral()`
+
+    :Example:
+
+    >>> from numeral_converter import year2numeral
+    >>> year2numeral(2023, lang="uk", case="genetive")  # doctest: +NORMALIZE_WHITESPACE
+    {'numeral': 'дві тисячі двадцять третього',
+     'numeral_forms': ['дві тисячі двадцять третього']}
+
+    """
+    return __date2numeral(
+        year, lang, YEAR_TABLES, YEARS_START, YEARS_STOP, morph, kwargs
+    )
+
+
+def numeral2year(numeral: str, lang: str) -> Optional[int]:
+    """
+    Converts ordinal (or cardinal) numeral of a year into integer value
+
+    Numerals of the years of the precomputed range are looked up;
+    others are converted by `numeral2int()`
+
+    :param str numeral: input numeral in language `lang`
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :return Optional[int]: year
+
+    :Example:
+
+    >>> from numeral_converter import numeral2year
+    >>> numeral2year("дві тисячі двадцять третього", lang="uk")
+    2023
+
+    """
+    years = __date_table(lang, YEAR_TABLES, YEARS_START, YEARS_STOP)
+
+    year = years.get_value(preprocess_numeral(numeral, lang))
+    if year is None:
+        return numeral2int(numeral, lang)
+
+    return year
+
+
+def __date2numeral(
+    value: int,
+    lang: str,
+    tables: Dict[str, NumeralFormsTable],
+    start: int,
+    stop: int,
+    morph: Optional[MorphSpec],
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    morph = MorphSpec.from_kwargs(kwargs) if morph is None else morph.update(**kwargs)
+    if morph.num_class is None:
+        morph = morph.update(num_class="ordinal")
+
+    numeral = __date_table(lang, tables, start, stop).get(value, morph)
+    if numeral is None:
+        return int2numeral(value, lang, morph=morph)
+
+    check_numeral_morph(value, lang, morph)
+    return numeral
+
+
+def __date_table(
+    lang: str, tables: Dict[str, NumeralFormsTable], start: int, stop: int
+) -> NumeralFormsTable:
+    # `tables` of language `lang`; built for [start, stop) if not built yet
+    table = tables.get(lang)
+    if table is None:
+        with __DATE_TABLES_LOCK:
+            table = tables.get(lang)
+            if table is None:
+                table = tables[lang] = __make_date_table(lang, start, stop)
+
+    return table
+
+
+def __make_date_table(lang: str, start: int, stop: int) -> NumeralFormsTable:
+    return make_numeral_forms_table(
+        lang, start=start, stop=stop, morph_forms={"num_class": ["ordinal"]}
+    )
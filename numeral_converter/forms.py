@@ -0,0 +1,291 @@
+import itertools
+import math
+import warnings
+from collections import namedtuple
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from .constants import DEFAULT_MORPH
+from .morph import MorphSpec
+
+NumeralWord = namedtuple("NumeralWord", "default alt")
+NumeralGroup = namedtuple("NumeralGroup", "numeral forms")
+
+
+class NumeralForms:
+    """
+    Numeral words of a language indexed by number and morphological form
+
+    Built once when the language is loaded; holds the capability matrix of
+    the language data: morphological labels the data has and, for each number,
+    the values of each label; specs are checked against the matrix
+    (see `check_morph()` and `check_numeral()`), resolved numeral words
+    are memoized by number and spec, so repeated conversions don't scan the data
+
+    Numerals are assembled from group templates: a group is a 0 - 999 value
+    with its scale word; group numeral and forms are built once
+    per group items and their morphological forms
+
+    :param pd.DataFrame numeral_data: language data
+    :param str lang: language identifier
+
+    """
+
+    def __init__(self, numeral_data: pd.DataFrame, lang: str):
+        self.lang = lang
+        self.labels: Tuple[str, ...] = tuple(
+            label for label in DEFAULT_MORPH.keys() if label in numeral_data.columns
+        )
+        self.capabilities: Dict[int, Dict[str, FrozenSet[str]]] = dict()
+
+        self.__numeral_data = numeral_data
+        self.__rows: Dict[int, List[Tuple[int, Dict[str, Optional[str]], str]]] = {}
+        for i, row in enumerate(numeral_data.itertuples(index=False)):
+            key = int(row.value) if row.order < 6 else 10**row.order
+            self.__rows.setdefault(key, list()).append(
+                (i, {label: getattr(row, label) for label in self.labels}, row.string)
+            )
+
+        for key, rows in self.__rows.items():
+            self.capabilities[key] = {
+                label: frozenset(
+                    value for _, x, _ in rows if (value := x[label]) is not None
+                )
+                for label in self.labels
+            }
+
+        self.__checked: Set[MorphSpec] = set()
+        self.__missing_values: Dict[MorphSpec, FrozenSet[Tuple[str, str]]] = dict()
+        self.__warned: Set[Tuple[int, MorphSpec]] = set()
+        self.__groups: Dict[
+            Tuple[Tuple[Any, ...], Tuple[MorphSpec, ...]], NumeralGroup
+        ] = dict()
+        # numeral word or error message parts of the number and spec
+        self.__words: Dict[
+            Tuple[int, MorphSpec], Union[NumeralWord, Tuple[str, str]]
+        ] = dict()
+
+    def check_morph(self, morph: MorphSpec):
+        """
+        Warns once per spec about the labels absent in the language data;
+        such labels are ignored by `numeral_word()` and `numeral_group()`
+
+        :param MorphSpec morph: morphological form
+
+        """
+        if morph in self.__checked:
+            return
+
+        for label, label_value in zip(morph._fields, morph):
+            if label_value and label not in self.labels:
+                warnings.warn(
+                    f'no column "{label}" in data for language "{self.lang}"; ignored',
+                    UserWarning,
+                )
+
+        self.__checked.add(morph)
+
+    def missing_values(self, morph: MorphSpec) -> FrozenSet[Tuple[str, str]]:
+        """
+        Label values given by the spec that some numbers have no words for;
+        memoized per spec
+
+        :param MorphSpec morph: morphological form
+        :return FrozenSet[Tuple[str, str]]: labels and their values
+
+        """
+        try:
+            return self.__missing_values[morph]
+        except KeyError:
+            missing_values = frozenset(
+                (label, label_value)
+                for label, label_value in zip(morph._fields, morph)
+                if label_value
+                and label in self.labels
+                and any(
+                    label_value not in capabilities[label]
+                    for capabilities in self.capabilities.values()
+                )
+            )
+            return self.__missing_values.setdefault(morph, missing_values)
+
+    def check_numeral(
+        self,
+        number_items: Sequence[Any],
+        plans: Iterable[Tuple[int, int, Tuple[MorphSpec, ...]]],
+        morph: MorphSpec,
+    ):
+        """
+        Warns about the label values of the spec the words of the numeral have
+        no data for; such labels are ignored for the words; warns once
+        per number and spec
+
+        :param Sequence[NumberItem] number_items: number items of the numeral
+        :param Iterable[Tuple[int, int, Tuple[MorphSpec, ...]]] plans: groups
+               of the items: start, end and morphological forms of the items
+        :param MorphSpec morph: morphological form of the numeral
+
+        """
+        missing_values = self.missing_values(morph)
+        if not missing_values:
+            return
+
+        for start, end, plan in plans:
+            for number_item, item_morph in zip(number_items[start:end], plan):
+                key = self.__key(number_item.value)
+                capabilities = self.capabilities.get(key)
+                if capabilities is None or (key, morph) in self.__warned:
+                    continue
+
+                for label, label_value in missing_values:
+                    if (
+                        getattr(item_morph, label) == label_value
+                        and label_value not in capabilities[label]
+                    ):
+                        self.__warned.add((key, morph))
+                        warnings.warn(
+                            f"no data for {label} == {label_value} "
+                            f"for number {key}; ignored",
+                            UserWarning,
+                        )
+
+    def numeral_word(self, value: int, morph: MorphSpec) -> NumeralWord:
+        """
+        Numeral word of the number in the morphological form
+
+        Labels the number has no data for are ignored; see `check_morph()`
+
+        :param int value: number: 0 - 999999 or a power of 10
+        :param MorphSpec morph: morphological form
+        :return NumeralWord: numeral word and its alternative forms
+
+        """
+        return self.__numeral_word(value, morph)
+
+    def numeral_group(
+        self, number_items: Tuple[Any, ...], plan: Tuple[MorphSpec, ...]
+    ) -> NumeralGroup:
+        """
+        Numeral of a group of number items: 0 - 999 value and its scale word
+
+        :param Tuple[NumberItem, ...] number_items: group number items
+        :param Tuple[MorphSpec, ...] plan: morphological forms of the items
+        :return NumeralGroup: group numeral and its forms
+
+        """
+        try:
+            return self.__groups[(number_items, plan)]
+        except KeyError:
+            numeral_words = [
+                self.__numeral_word(number_item.value, morph)
+                for number_item, morph in zip(number_items, plan)
+            ]
+            return self.__groups.setdefault(
+                (number_items, plan), self.__join(numeral_words, number_items)
+            )
+
+    def __numeral_word(self, value: int, morph: MorphSpec) -> NumeralWord:
+        key = self.__key(value)
+
+        try:
+            numeral_word = self.__words[(key, morph)]
+        except KeyError:
+            if key not in self.__rows:
+                raise ValueError(f"no data for number {value}")
+
+            numeral_word = self.__words.setdefault(
+                (key, morph), self.__resolve(key, morph)
+            )
+
+        if not isinstance(numeral_word, NumeralWord):
+            raise ValueError(f"{numeral_word[0]}number {value}{numeral_word[1]}")
+
+        return numeral_word
+
+    @staticmethod
+    def __key(value: int) -> int:
+        return value if value < 1000000 else 10 ** int(math.log10(value))
+
+    def __join(
+        self, numeral_words: List[NumeralWord], number_items: Tuple[Any, ...]
+    ) -> NumeralGroup:
+        if self.lang == "en":
+            # tens and ones are joined with hyphen: twenty-one
+            words = list()
+            i = 0
+            while i < len(number_items):
+                if (
+                    i + 1 < len(number_items)
+                    and number_items[i].order == 1
+                    and number_items[i + 1].order == 0
+                ):
+                    words.append(
+                        NumeralWord(
+                            numeral_words[i].default
+                            + "-"
+                            + numeral_words[i + 1].default,
+                            [],
+                        )
+                    )
+                    i += 2
+                else:
+                    words.append(numeral_words[i])
+                    i += 1
+            numeral_words = words
+
+        numeral = " ".join(
+            [
+                f"{word.default}" + (f" ({', '.join(word.alt)})" if word.alt else "")
+                for word in numeral_words
+            ]
+        )
+        forms = tuple(
+            " ".join(combination)
+            for combination in itertools.product(
+                *[[word.default] + word.alt for word in numeral_words]
+            )
+        )
+        return NumeralGroup(numeral, forms)
+
+    def __resolve(
+        self, key: int, morph: MorphSpec
+    ) -> Union[NumeralWord, Tuple[str, str]]:
+        rows = self.__rows[key]
+
+        for label, default in DEFAULT_MORPH.items():
+            label_value = getattr(morph, label) or default
+            if label not in self.labels:
+                continue
+
+            if any(x[label] == label_value for _, x, _ in rows):
+                rows = [row for row in rows if row[1][label] == label_value]
+
+        if len(rows) != 1:
+            labels_string = ", ".join(
+                [
+                    f'{label} = "{getattr(morph, label) or default}"'
+                    for label, default in DEFAULT_MORPH.items()
+                ]
+            )
+            if not rows:
+                return "No data for ", f" ({labels_string})"
+            return (
+                "There are more then one values for ",
+                f" ({labels_string}):\n"
+                f"{self.__numeral_data.iloc[[i for i, _, _ in rows]].head()}",
+            )
+
+        numeral_words = [x.strip() for x in rows[0][2].split(" ") if x]
+        return NumeralWord(numeral_words[0], numeral_words[1:])
@@ -0,0 +1,211 @@
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .forms import NumeralGroup
+from .morph import MorphSpec
+
+# version of the table file format and of the numerals it holds;
+# files of other versions are ignored
+FORMS_TABLE_VERSION = 1
+
+
+class NumeralFormsTable:
+    """
+    Precomputed `int2numeral()` output for the values in range [start, stop)
+    in all the morphological forms of a language, and the inverse table:
+    `numeral2int()` value of each numeral form
+
+    The labels the language data has no column for don't change a numeral,
+    so the specs are keyed by the labels in `labels` only
+
+    :param str lang: language identifier
+    :param int start: first value of the range
+    :param int stop: value after the last value of the range
+    :param Iterable[str] labels: morphological labels of the language data
+    :param Dict[MorphSpec, List[Optional[NumeralGroup]]] numerals:
+           numeral and numeral forms of each value of the range by spec;
+           None if the value is not in the table
+    :param Dict[str, int] values: integer value of preprocessed numeral forms
+
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        start: int,
+        stop: int,
+        labels: Iterable[str],
+        numerals: Dict[MorphSpec, List[Optional[NumeralGroup]]],
+        values: Dict[str, int],
+    ):
+        self.lang = lang
+        self.start = start
+        self.stop = stop
+        self.labels = tuple(labels)
+
+        self.__numerals = numerals
+        self.__values = values
+        self.__keys: Dict[MorphSpec, MorphSpec] = dict()
+
+    def __len__(self) -> int:
+        return sum(
+            x is not None for numerals in self.__numerals.values() for x in numerals
+        )
+
+    def key(self, morph: MorphSpec) -> MorphSpec:
+        """
+        Spec the numerals in form `morph` are stored by
+
+        :param MorphSpec morph: morphological form
+        :return MorphSpec: resolved spec without the labels absent in the data
+
+        """
+        key = self.__keys.get(morph)
+        if key is None:
+            key = self.__keys.setdefault(
+                morph,
+                MorphSpec(
+                    *(
+                        value if label in self.labels else None
+                        for label, value in zip(morph._fields, morph.resolved())
+                    )
+                ),
+            )
+
+        return key
+
+    def get(self, value: int, morph: MorphSpec) -> Optional[Dict[str, Any]]:
+        """
+        Precomputed `int2numeral()` output
+
+        :param int value: integer value
+        :param MorphSpec morph: morphological form
+        :return Optional[Dict[str, Any]]: numeral and its forms;
+                None if the value is not in the table
+
+        """
+        numeral_group = self.get_group(value, morph)
+        if numeral_group is None:
+            return None
+
+        return {
+            "numeral": numeral_group.numeral,
+            "numeral_forms": list(numeral_group.forms),
+        }
+
+    def get_group(self, value: int, morph: MorphSpec) -> Optional[NumeralGroup]:
+        """
+        Precomputed `int2numeral_group()` output
+
+        :param int value: integer value
+        :param MorphSpec morph: morphological form
+        :return Optional[NumeralGroup]: numeral and its forms;
+                None if the value is not in the table
+
+        """
+        if not self.start <= value < self.stop:
+            return None
+
+        numerals = self.__numerals.get(self.key(morph))
+        if numerals is None:
+            return None
+
+        return numerals[value - self.start]
+
+    def get_value(self, numeral: str) -> Optional[int]:
+        """
+        Precomputed `numeral2int()` output
+
+        :param str numeral: preprocessed numeral
+        :return Optional[int]: integer value; None if the numeral is not in the table
+
+        """
+        return self.__values.get(numeral)
+
+    def to_file(self, path: Union[str, os.PathLike], fingerprint: str):
+        """
+        Writes the table into gzip-compressed JSON file
+
+        :param path: file name
+        :param str fingerprint: fingerprint of the language data
+               the table is built from
+
+        """
+        strings: Dict[str, int] = dict()
+        numerals: Dict[NumeralGroup, int] = dict()
+
+        def string_id(string: str) -> int:
+            return strings.setdefault(string, len(strings))
+
+        def numeral_id(numeral: Optional[NumeralGroup]) -> int:
+            if numeral is None:
+                return -1
+            if numeral not in numerals:
+                numerals[numeral] = len(numerals)
+            return numerals[numeral]
+
+        data = {
+            "version": FORMS_TABLE_VERSION,
+            "fingerprint": fingerprint,
+            "lang": self.lang,
+            "start": self.start,
+            "stop": self.stop,
+            "labels": list(self.labels),
+            "specs": [
+                [list(morph), [numeral_id(x) for x in values]]
+                for morph, values in self.__numerals.items()
+            ],
+            "values": [[string_id(k), v] for k, v in self.__values.items()],
+        }
+        data["numerals"] = [
+            [string_id(numeral), [string_id(x) for x in forms]]
+            for numeral, forms in numerals
+        ]
+        data["strings"] = list(strings)
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, os.PathLike], fingerprint: str
+    ) -> Optional["NumeralFormsTable"]:
+        """
+        Reads the table written by `to_file()`
+
+        :param path: file name
+        :param str fingerprint: fingerprint of the current language data
+        :return Optional[NumeralFormsTable]: table; None if the file is built
+                from other language data or by other version of the module
+
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if (
+            data.get("version") != FORMS_TABLE_VERSION
+            or data.get("fingerprint") != fingerprint
+        ):
+            return None
+
+        strings = data["strings"]
+        numerals = [
+            NumeralGroup(strings[numeral], tuple(strings[x] for x in forms))
+            for numeral, forms in data["numerals"]
+        ]
+
+        return cls(
+            lang=data["lang"],
+            start=data["start"],
+            stop=data["stop"],
+            labels=data["labels"],
+            numerals={
+                MorphSpec(*morph): [numerals[x] if x >= 0 else None for x in values]
+                for morph, values in data["specs"]
+            },
+            values={strings[k]: v for k, v in data["values"]},
+        )
@@ -1,16 +1,33 @@
+import hashlib
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import semiotic_tricks_data_loader as stdl
 from fuzzy_multi_dict import FuzzyMultiDict
 
+from .compressed_lexicon import CompressedLexicon
 from .constants import DEFAULT_MORPH
+from .forms import NumeralForms
+from .forms_table import NumeralFormsTable
+from .lexicon import MorphFeatures, lexicon_entry, merge_lexicon_entries
+from .prefilter import NumeralPrefilter
 
 __NAME_ENV_STDL = "numeral_converter"
 NUMERAL_TREE: Dict[str, Any] = dict()
 NUMERAL_DATA: Dict[str, pd.DataFrame] = dict()
+NUMERAL_PREFILTER: Dict[str, NumeralPrefilter] = dict()
+NUMERAL_FORMS: Dict[str, NumeralForms] = dict()
+NUMERAL_FORMS_TABLE: Dict[str, NumeralFormsTable] = dict()
+NUMERAL_DATA_FINGERPRINT: Dict[str, str] = dict()
+NUMERAL_FORMS_TABLE_PATH: Dict[str, Path] = dict()
+
+__LOADING: Dict[str, Future] = dict()
+__LOADING_LOCK = threading.Lock()
+__LOADING_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="numeral_converter_load")
 
 
 def get_available_languages() -> List[str]:
@@ -33,12 +50,16 @@ def get_available_languages() -> List[str]:
     return [file.split(".")[0] for file in files]
 
 
-def load_numeral_data(lang: str):
+def load_numeral_data(lang: str, compressed_lexicon: bool = False):
     """
     Loads language `lang` data
 
     :param lang: language identifier;
            to find out the list of available languages, use `get_available_languages()`
+    :param bool compressed_lexicon: if True - numeral words are stored
+           as stems and suffix tables (`CompressedLexicon`) instead of
+           the fuzzy tree; takes less memory, fuzzy lookup is slower;
+           default = False
 
     :Example:
 
@@ -50,6 +71,88 @@ def load_numeral_data(lang: str):
         warnings.warn(f"data for language {lang} already load", UserWarning)
         return
 
+    # the data is loaded in the calling thread, so no loading thread is alive
+    # when the process forks (e.g. pools of `get_pool()`)
+    with __LOADING_LOCK:
+        future = __LOADING.get(lang)
+        is_loading = future is None and not __is_loaded(lang)
+        if is_loading:
+            future = __LOADING[lang] = Future()
+            future.add_done_callback(lambda _: __LOADING.pop(lang, None))
+
+    if future is None:
+        return
+
+    if is_loading:
+        try:
+            __load_numeral_data(lang, compressed_lexicon)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    future.result()
+
+
+def load_numeral_data_async(lang: str, compressed_lexicon: bool = False) -> Future:
+    """
+    Starts loading language `lang` data in a background thread;
+    `load_numeral_data()` loads the data in the calling thread
+
+    Loading of a language is started once: concurrent calls
+    (and conversion calls made while the language is loading)
+    wait for the same future
+
+    :param lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param bool compressed_lexicon: if True - numeral words are stored
+           as stems and suffix tables; see `load_numeral_data()`; default = False
+    :return Future: future that is done when the data is loaded;
+            `result()` raises the loading error if any
+
+    :Example:
+
+    >>> from numeral_converter import load_numeral_data_async, is_ready
+    >>> future = load_numeral_data_async('uk')
+    >>> is_ready('uk')
+    False
+    >>> future.result()
+    >>> is_ready('uk')
+    True
+
+    """
+    with __LOADING_LOCK:
+        future = __LOADING.get(lang)
+
+        if future is None and __is_loaded(lang):
+            future = Future()
+            future.set_result(None)
+
+        elif future is None:
+            future = __LOADING_EXECUTOR.submit(
+                __load_numeral_data, lang, compressed_lexicon
+            )
+            __LOADING[lang] = future
+            future.add_done_callback(lambda _: __LOADING.pop(lang, None))
+
+    return future
+
+
+def is_ready(lang: str) -> bool:
+    """
+    Checks whether language `lang` data is loaded
+
+    :param lang: language identifier
+    :return bool: True if the data is loaded
+
+    """
+    return __is_loaded(lang)
+
+
+def __load_numeral_data(lang: str, compressed_lexicon: bool = False):
+    if __is_loaded(lang):
+        return
+
     if not __is_available(lang):
         raise ValueError(
             f"no data for language {lang}; "
@@ -60,8 +163,24 @@ def load_numeral_data(lang: str):
         [__NAME_ENV_STDL, f"{lang}.csv"]
     )
 
-    NUMERAL_DATA[lang] = __read_language_data(filename)
-    NUMERAL_TREE[lang] = __build_numeral_tree(NUMERAL_DATA[lang])
+    numeral_data = __read_language_data(filename)
+    NUMERAL_PREFILTER[lang] = __build_numeral_prefilter(numeral_data)
+    NUMERAL_FORMS[lang] = NumeralForms(numeral_data, lang=lang)
+
+    NUMERAL_DATA_FINGERPRINT[lang] = __fingerprint(filename)
+    # precomputed forms table is persisted next to the language data
+    NUMERAL_FORMS_TABLE_PATH[lang] = Path(filename).parent / "forms" / f"{lang}.json.gz"
+    numeral_forms_table = __read_numeral_forms_table(lang)
+    if numeral_forms_table is not None:
+        NUMERAL_FORMS_TABLE[lang] = numeral_forms_table
+
+    NUMERAL_DATA[lang] = numeral_data
+    # language is loaded when its tree is set, so the tree is set the last
+    NUMERAL_TREE[lang] = (
+        CompressedLexicon(__numeral_words(numeral_data))
+        if compressed_lexicon
+        else __build_numeral_tree(numeral_data)
+    )
 
 
 def maximum_number_order_to_convert(lang: str) -> int:
@@ -91,7 +210,13 @@ def maximum_number_order_to_convert(lang: str) -> int:
 
 
 def check_numeral_data_load(lang):
-    if not __is_loaded(lang):
+    if __is_loaded(lang):
+        return
+
+    future = __LOADING.get(lang)
+    if future is not None:
+        future.result()
+    else:
         warnings.warn(
             f'data for language "{lang}" is not loaded;'
             f'starts searching for data for language "{lang}"',
@@ -113,28 +238,59 @@ def __read_language_data(filename: Path) -> pd.DataFrame:
     return df
 
 
+def __fingerprint(filename: Path) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def __read_numeral_forms_table(lang: str) -> Optional[NumeralFormsTable]:
+    path = NUMERAL_FORMS_TABLE_PATH[lang]
+    if not path.exists():
+        return None
+
+    try:
+        return NumeralFormsTable.from_file(path, NUMERAL_DATA_FINGERPRINT[lang])
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+        warnings.warn(f"can't read forms table {path}: {e}; ignored", UserWarning)
+        return None
+
+
 def __build_numeral_tree(df: pd.DataFrame) -> FuzzyMultiDict:
-    numeral_tree = FuzzyMultiDict(update_value_func=__update_numeral_word_value)
+    numeral_tree = FuzzyMultiDict(update_value_func=merge_lexicon_entries)
+
+    for string, value, order, scale, morph in __numeral_words(df):
+        numeral_tree[string] = lexicon_entry(value, order, scale, (morph,))
 
+    return numeral_tree
+
+
+def __numeral_words(
+    df: pd.DataFrame,
+) -> Iterator[Tuple[str, Any, int, Optional[bool], MorphFeatures]]:
     for i, row in df.iterrows():
+        value = row["value"] if row.order < 6 else 10**row.order
+        morph = MorphFeatures(
+            {
+                label: row[label]
+                for label in DEFAULT_MORPH.keys()
+                if row.get(label) is not None
+            }
+        )
+
         for string in row["string"].split(" "):
             if not string:
                 continue
 
-            data = {
-                "morph_forms": {
-                    label: row[label]
-                    for label in DEFAULT_MORPH.keys()
-                    if row.get(label) is not None
-                },
-                "value": row["value"] if row.order < 6 else 10**row.order,
-                "order": row["order"],
-                "scale": row["scale"],
-            }
+            yield string, value, row["order"], row["scale"], morph
 
-            numeral_tree[string] = data
 
-    return numeral_tree
+def __build_numeral_prefilter(df: pd.DataFrame) -> NumeralPrefilter:
+    return NumeralPrefilter(
+        string
+        for row_string in df["string"]
+        for string in row_string.split(" ")
+        if string
+    )
 
 
 def __is_loaded(lang: str):
@@ -144,21 +300,3 @@ def __is_loaded(lang: str):
 def __is_available(lang: str) -> bool:
     __available_languages = get_available_languages()
     return lang in __available_languages
-
-
-def __update_numeral_word_value(x, y):
-    if x is None:
-        return y
-
-    if not isinstance(x, dict) or not isinstance(y, dict):
-        raise TypeError(f"Invalid value type; expect dict; got {type(x)} and {type(y)}")
-
-    for k, v in y.items():
-        if x.get(k) is None:
-            x[k] = v
-        elif isinstance(x[k], list):
-            x[k].append(v)
-        elif x[k] != v:
-            x[k] = [x[k], v]
-
-    return x
@@ -0,0 +1,168 @@
+from collections import namedtuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .constants import DEFAULT_MORPH, MORPH_FORMS
+
+
+class MorphFeatures(Mapping[str, str]):
+    """
+    Morphological features of a lexicon word: label -> value
+
+    The values are encoded as small ints (indices in `MORPH_FORMS`) packed
+    into one int; features are interned, so equal features of all the words
+    are one object; read as a dictionary
+
+    :param Mapping[str, str] features: label values; labels of `DEFAULT_MORPH`
+
+    :Example:
+
+    >>> from numeral_converter.lexicon import MorphFeatures
+    >>> features = MorphFeatures({"case": "genetive", "num_class": "ordinal"})
+    >>> features is MorphFeatures({"num_class": "ordinal", "case": "genetive"})
+    True
+    >>> features.get("num_class"), features.get("gender")
+    ('ordinal', None)
+    >>> dict(features)
+    {'case': 'genetive', 'num_class': 'ordinal'}
+
+    """
+
+    __slots__ = ("code",)
+
+    code: int
+
+    # bits of a label value code in `code`
+    __BITS = 8
+    __MASK = 2**__BITS - 1
+    __LABELS = tuple(DEFAULT_MORPH.keys())
+    __VALUES: Dict[str, List[str]] = {
+        label: list(MORPH_FORMS.get(label, ())) for label in DEFAULT_MORPH
+    }
+    __INSTANCES: Dict[int, "MorphFeatures"] = dict()
+
+    def __new__(cls, features: Mapping[str, str]):
+        code = 0
+        for i, label in enumerate(cls.__LABELS):
+            value = features.get(label)
+            if value is not None:
+                code |= cls.__value_code(label, value) << (i * cls.__BITS)
+
+        instance = cls.__INSTANCES.get(code)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.code = code
+            instance = cls.__INSTANCES.setdefault(code, instance)
+
+        return instance
+
+    @classmethod
+    def __value_code(cls, label: str, value: str) -> int:
+        values = cls.__VALUES[label]
+        if value not in values:
+            if len(values) >= cls.__MASK:
+                raise ValueError(f"too many values of label {label}")
+            values.append(value)
+
+        return values.index(value) + 1
+
+    def __getitem__(self, label: str) -> str:
+        try:
+            i = self.__LABELS.index(label)
+        except ValueError:
+            raise KeyError(label)
+
+        value_code = (self.code >> (i * self.__BITS)) & self.__MASK
+        if not value_code:
+            raise KeyError(label)
+
+        return self.__VALUES[label][value_code - 1]
+
+    def __iter__(self) -> Iterator[str]:
+        for i, label in enumerate(self.__LABELS):
+            if (self.code >> (i * self.__BITS)) & self.__MASK:
+                yield label
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MorphFeatures):
+            return self.code == other.code
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self.code)
+
+    def __repr__(self) -> str:
+        return f"MorphFeatures({dict(self)})"
+
+    def __reduce__(self):
+        return MorphFeatures, (dict(self),)
+
+
+LexiconEntry = namedtuple("LexiconEntry", "value order scale morph_forms")
+
+__ENTRIES: Dict[Tuple[LexiconEntry, type], LexiconEntry] = dict()
+
+
+def lexicon_entry(
+    value: Any,
+    order: int,
+    scale: Optional[bool],
+    morph_forms: Tuple[MorphFeatures, ...],
+) -> LexiconEntry:
+    """
+    Interned lexicon entry of a numeral word: equal entries are one object
+
+    :param value: number value
+    :param int order: number order
+    :param Optional[bool] scale: True if the word is scale word
+    :param Tuple[MorphFeatures, ...] morph_forms: morphological features
+           of the word forms
+    :return LexiconEntry: entry
+
+    """
+    entry = LexiconEntry(value, order, scale, morph_forms)
+    # 1 == 1.0: entries of equal values of different types are not shared
+    return __ENTRIES.setdefault((entry, type(value)), entry)
+
+
+def merge_lexicon_entries(x: Optional[LexiconEntry], y: LexiconEntry) -> LexiconEntry:
+    """
+    Entry of a word that is a form of both `x` and `y`: number of `x`
+    and morphological features of both
+
+    :param Optional[LexiconEntry] x: stored entry; None if there is no one
+    :param LexiconEntry y: new entry
+    :return LexiconEntry: merged entry
+
+    """
+    if x is None:
+        return y
+
+    if not isinstance(x, LexiconEntry) or not isinstance(y, LexiconEntry):
+        raise TypeError(
+            f"Invalid value type; expect LexiconEntry; got {type(x)} and {type(y)}"
+        )
+
+    morph_forms = x.morph_forms + tuple(
+        morph for morph in y.morph_forms if morph not in x.morph_forms
+    )
+    if len(morph_forms) == len(x.morph_forms):
+        return x
+
+    return lexicon_entry(x.value, x.order, x.scale, morph_forms)
+
+
+def entry_morph_forms(entry: LexiconEntry) -> Any:
+    """
+    Morphological features of the entry word forms: one mapping
+    if the word has one form, else list of them
+
+    :param LexiconEntry entry: lexicon entry
+    :return: features
+
+    """
+    if len(entry.morph_forms) == 1:
+        return entry.morph_forms[0]
+    return list(entry.morph_forms)
@@ -0,0 +1,109 @@
+from collections import namedtuple
+from typing import Any, Dict, Optional, Tuple
+
+from .constants import DEFAULT_MORPH, MORPH_FORMS
+
+
+class MorphSpec(namedtuple("MorphSpec", "case num_class gender number")):
+    """
+    Morphological form of a numeral: case, num_class, gender, number
+
+    Specs are validated against `MORPH_FORMS` once and interned: equal specs are
+    the same object, so a spec is a cheap dictionary key; None value means
+    the default form (see `DEFAULT_MORPH`)
+
+    A spec can be passed to `int2numeral()` instead of keyword arguments
+
+    :Example:
+
+    >>> from numeral_converter import MorphSpec, int2numeral
+    >>> genetive = MorphSpec(case="genetive")
+    >>> genetive is MorphSpec(case="genetive", num_class=None)
+    True
+    >>> int2numeral(42, lang="uk", morph=genetive)
+    {'numeral': 'сорока двох', 'numeral_forms': ['сорока двох']}
+    >>> genetive.update(gender="feminine")
+    MorphSpec(case='genetive', num_class=None, gender='feminine', number=None)
+    >>> genetive.resolved()  # doctest: +NORMALIZE_WHITESPACE
+    MorphSpec(case='genetive', num_class='cardinal',
+              gender='masculine', number='singular')
+
+    """
+
+    __slots__ = ()
+
+    __INSTANCES: Dict[Tuple[Optional[str], ...], "MorphSpec"] = dict()
+    __RESOLVED: Dict["MorphSpec", "MorphSpec"] = dict()
+
+    def __new__(
+        cls,
+        case: Optional[str] = None,
+        num_class: Optional[str] = None,
+        gender: Optional[str] = None,
+        number: Optional[str] = None,
+    ):
+        key = (case or None, num_class or None, gender or None, number or None)
+
+        spec = cls.__INSTANCES.get(key)
+        if spec is None:
+            for label, label_item in zip(cls._fields, key):
+                if label_item is not None and label_item not in MORPH_FORMS[label]:
+                    raise ValueError(
+                        f"Invalid label {label} value; use one of {MORPH_FORMS[label]}"
+                    )
+            spec = cls.__INSTANCES.setdefault(key, super().__new__(cls, *key))
+
+        return spec
+
+    def _replace(self, **kwargs) -> "MorphSpec":
+        return MorphSpec(**{**self._asdict(), **kwargs})
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> "MorphSpec":
+        """
+        Validated spec of morphological form given by keyword arguments
+
+        :param Dict[str, Any] kwargs: case, num_class, gender, number
+        :return MorphSpec: spec
+
+        """
+        for label in kwargs:
+            if label not in MORPH_FORMS:
+                raise ValueError(f"Invalid label; use one of {MORPH_FORMS.keys()}")
+
+        return cls(**kwargs)
+
+    def update(self, **kwargs) -> "MorphSpec":
+        """
+        Spec with the labels given by not empty keyword arguments replaced
+
+        :param kwargs: case, num_class, gender, number
+        :return MorphSpec: spec
+
+        """
+        update = MorphSpec.from_kwargs(kwargs)
+        if not any(update):
+            return self
+
+        return MorphSpec(*(new or old for old, new in zip(self, update)))
+
+    def resolved(self) -> "MorphSpec":
+        """
+        Spec with the empty labels replaced by `DEFAULT_MORPH` values
+
+        :return MorphSpec: spec
+
+        """
+        resolved = MorphSpec.__RESOLVED.get(self)
+        if resolved is None:
+            resolved = MorphSpec.__RESOLVED.setdefault(
+                self,
+                MorphSpec(
+                    *(
+                        value or DEFAULT_MORPH[label]
+                        for label, value in zip(self._fields, self)
+                    )
+                ),
+            )
+
+        return resolved
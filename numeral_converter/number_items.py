@@ -0,0 +1,128 @@
+from array import array
+from collections import namedtuple
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+NumberItem = namedtuple("NumberItem", "value order scale")
+
+
+class NumberItems(Sequence[NumberItem]):
+    """
+    Compact sequence of number items: parallel arrays of values,
+    orders and scale flags instead of a list of `NumberItem` tuples
+
+    Items are read as `NumberItem`, so the sequence can be used in place
+    of a list of number items; scale words are stored by order:
+    their values are 10 ** order and may not fit in 64 bits; other values
+    are stored as doubles, as they are in the language data
+
+    :param Iterable[NumberItem] number_items: initial items; default = ()
+
+    :Example:
+
+    >>> from numeral_converter.number_items import NumberItem, NumberItems
+    >>> number_items = NumberItems()
+    >>> number_items.append_item(1000, 3, True)
+    >>> number_items.append_item(42, 1, None)
+    >>> number_items.reverse()
+    >>> list(number_items)  # doctest: +NORMALIZE_WHITESPACE
+    [NumberItem(value=42.0, order=1, scale=None),
+     NumberItem(value=1000, order=3, scale=True)]
+
+    """
+
+    __slots__ = ("values", "orders", "scales")
+
+    # scale flags are stored as small ints: None, True, False
+    __SCALES = (None, True, False)
+
+    def __init__(self, number_items: Iterable[NumberItem] = ()):
+        self.values = array("d")
+        self.orders = array("h")
+        self.scales = array("b")
+
+        for number_item in number_items:
+            self.append_item(*number_item)
+
+    def append_item(self, value: int, order: int, scale: Optional[bool]):
+        """
+        Appends number item given by its fields
+
+        :param int value: item value
+        :param int order: item order
+        :param Optional[bool] scale: True if the item is scale word
+
+        """
+        self.values.append(0 if scale else value)
+        self.orders.append(order)
+        self.scales.append(0 if scale is None else 1 if scale else 2)
+
+    def append(self, number_item: NumberItem):
+        self.append_item(*number_item)
+
+    def reverse(self):
+        self.values.reverse()
+        self.orders.reverse()
+        self.scales.reverse()
+
+    def columns(
+        self,
+    ) -> Tuple[List[Union[int, float]], List[int], List[Optional[bool]]]:
+        """
+        Values, orders and scale flags of the items as lists;
+        values of scale words are ints, other values are floats
+
+        :return Tuple[List[Union[int, float]], List[int], List[Optional[bool]]]:
+                columns
+
+        """
+        scales = [self.__SCALES[x] for x in self.scales]
+        values = [
+            10**order if scale else value
+            for value, order, scale in zip(self.values, self.orders, scales)
+        ]
+        return values, self.orders.tolist(), scales
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    @overload
+    def __getitem__(self, i: int) -> NumberItem:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "NumberItems":
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[NumberItem, "NumberItems"]:
+        if isinstance(i, slice):
+            number_items = NumberItems()
+            number_items.values = self.values[i]
+            number_items.orders = self.orders[i]
+            number_items.scales = self.scales[i]
+            return number_items
+
+        scale = self.__SCALES[self.scales[i]]
+        order = self.orders[i]
+        return NumberItem(10 ** order if scale else self.values[i], order, scale)
+
+    def __iter__(self) -> Iterator[NumberItem]:
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        try:
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NumberItems({list(self)})"
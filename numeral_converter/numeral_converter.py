@@ -1,20 +1,34 @@
+import functools
+import itertools
 import logging
 import math
 import re
 import warnings
-from collections import namedtuple
-from typing import Any, Dict, List, Optional
-
-from .constants import DEFAULT_MORPH, MORPH_FORMS
-from .lang_data_loader import NUMERAL_DATA, NUMERAL_TREE, check_numeral_data_load
-from .utils import combinations
-
-NumberItem = namedtuple("NumberItem", "value order scale")
-NumeralWord = namedtuple("NumeralWord", "default alt")
-
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from fuzzy_multi_dict import FuzzyMultiDict
+
+from .compressed_lexicon import CompressedLexicon
+from .constants import MORPH_FORMS
+from .forms import NumeralForms, NumeralGroup, NumeralWord
+from .forms_table import NumeralFormsTable
+from .lang_data_loader import (
+    NUMERAL_DATA_FINGERPRINT,
+    NUMERAL_FORMS,
+    NUMERAL_FORMS_TABLE,
+    NUMERAL_FORMS_TABLE_PATH,
+    NUMERAL_TREE,
+    check_numeral_data_load,
+)
+from .morph import MorphSpec
+from .number_items import NumberItem, NumberItems
 
 logger = logging.getLogger(__name__)
 
+# numeral words agreement depends on the value class of number items:
+# 1, 2-4, 5-9, 1000 or other (10)
+__VALUE_CLASSES = {1: 1, 2: 2, 3: 2, 4: 2, 5: 5, 6: 5, 7: 5, 8: 5, 9: 5, 1000: 1000}
+
 
 def numeral2int(numeral: str, lang: str) -> Optional[int]:
     """
@@ -54,12 +68,18 @@ def numeral2int(numeral: str, lang: str) -> Optional[int]:
     42
 
     """
+    numeral_forms_table = NUMERAL_FORMS_TABLE.get(lang)
+    if numeral_forms_table is not None:
+        value = numeral_forms_table.get_value(preprocess_numeral(numeral, lang))
+        if value is not None:
+            return value
+
     number_items = numeral2number_items(numeral=numeral, lang=lang)
     value = number_items2int(number_items=number_items)
     return value
 
 
-def int2numeral(value: int, lang: str, **kwargs):
+def int2numeral(value: int, lang: str, morph: Optional[MorphSpec] = None, **kwargs):
     """
     Converts input integer number into a numeral in language `lang`
     into a morphological form given by the argument-parameters
@@ -76,9 +96,13 @@ def int2numeral(value: int, lang: str, **kwargs):
     - "gender": 'masculine', 'feminine' or 'neuter';
     - "number": 'plural' or 'singular'
 
+    The form can also be given by `morph` (see `MorphSpec`); keyword
+    argument-parameters override its labels
+
     :param value: input integer value
     :param lang: language identifier;
            to find out the list of available languages, use `get_available_languages()`
+    :param Optional[MorphSpec] morph: morphological form; default = None
     :return str: string numeral in language `lang` in a morphological form
             given by the argument-parameters
 
@@ -104,77 +128,414 @@ def int2numeral(value: int, lang: str, **kwargs):
     {'numeral': 'сорок другій', 'numeral_forms': ['сорок другій']}
 
     """
-    __check_kwargs(kwargs)
+    morph = MorphSpec.from_kwargs(kwargs) if morph is None else morph.update(**kwargs)
+
+    numeral_forms_table = NUMERAL_FORMS_TABLE.get(lang)
+    if numeral_forms_table is not None:
+        numeral = numeral_forms_table.get(value, morph)
+        if numeral is not None:
+            check_numeral_morph(value, lang, morph)
+            return numeral
 
     numeral_items = int2number_items(value, lang)
 
-    numeral = number_items2numeral(
-        numeral_items,
-        lang=lang,
-        case=kwargs.get("case"),
-        num_class=kwargs.get("num_class"),
-        gender=kwargs.get("gender"),
-        number=kwargs.get("number"),
-    )
+    numeral = number_items2numeral(numeral_items, lang=lang, morph=morph)
 
     return numeral
 
 
+def int2numeral_group(
+    value: int, lang: str, morph: Optional[MorphSpec] = None, **kwargs
+) -> NumeralGroup:
+    """
+    Converts input integer number into a numeral in language `lang`;
+    see `int2numeral()`
+
+    Unlike `int2numeral()`, returns the numeral and the tuple of its forms
+    without copying them out of the module caches
+
+    :param int value: input integer value
+    :param str lang: language identifier
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param kwargs: morphological form labels: case, num_class, gender, number;
+           override the labels of `morph`
+    :return NumeralGroup: numeral and all its forms
+
+    """
+    morph = MorphSpec.from_kwargs(kwargs) if morph is None else morph.update(**kwargs)
+
+    numeral_forms_table = NUMERAL_FORMS_TABLE.get(lang)
+    if numeral_forms_table is not None:
+        numeral_group = numeral_forms_table.get_group(value, morph)
+        if numeral_group is not None:
+            check_numeral_morph(value, lang, morph)
+            return numeral_group
+
+    return number_items2numeral_group(
+        int2number_items(value, lang), lang=lang, morph=morph
+    )
+
+
+def int2numeral_range(
+    start: int,
+    stop: int,
+    step: int = 1,
+    *,
+    lang: str,
+    morph: Optional[MorphSpec] = None,
+    **kwargs,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Converts integer numbers of `range(start, stop, step)` into numerals
+    in language `lang`; yields the numerals of `int2numeral()` one by one
+
+    Consecutive numbers share the items and the words of the thousands
+    and higher groups; they are built once per thousand, and only
+    the lowest group of each number is converted
+
+    :param int start: first number of the range
+    :param int stop: number the range stops before
+    :param int step: range step; default = 1
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param kwargs: morphological form labels: case, num_class, gender, number;
+           override the labels of `morph`; see `int2numeral()`
+    :return Iterator[Dict[str, Any]]: numerals and all their forms
+
+    :Example:
+
+    >>> from numeral_converter import int2numeral_range
+    >>> for numeral in int2numeral_range(2021, 2024, lang="uk", case="genetive"):
+    ...     print(numeral["numeral"])
+    двох тисяч двадцяти одного
+    двох тисяч двадцяти двох
+    двох тисяч двадцяти трьох
+
+    """
+    for numeral_group in int2numeral_group_range(
+        start, stop, step, lang=lang, morph=morph, **kwargs
+    ):
+        yield {
+            "numeral": numeral_group.numeral,
+            "numeral_forms": list(numeral_group.forms),
+        }
+
+
+def int2numeral_group_range(
+    start: int,
+    stop: int,
+    step: int = 1,
+    *,
+    lang: str,
+    morph: Optional[MorphSpec] = None,
+    **kwargs,
+) -> Iterator[NumeralGroup]:
+    """
+    Converts integer numbers of `range(start, stop, step)` into numerals
+    in language `lang`; see `int2numeral_range()`
+
+    Unlike `int2numeral_range()`, yields the numerals and the tuples of their
+    forms without copying them out of the module caches
+
+    :param int start: first number of the range
+    :param int stop: number the range stops before
+    :param int step: range step; default = 1
+    :param str lang: language identifier
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param kwargs: morphological form labels: case, num_class, gender, number;
+           override the labels of `morph`
+    :return Iterator[NumeralGroup]: numerals and all their forms
+
+    """
+    morph = MorphSpec.from_kwargs(kwargs) if morph is None else morph.update(**kwargs)
+
+    check_numeral_data_load(lang)
+    numeral_forms = NUMERAL_FORMS[lang]
+    numeral_forms_table = NUMERAL_FORMS_TABLE.get(lang)
+
+    mf = morph.resolved()
+    is_collective = mf.num_class == "collective"
+    if is_collective:
+        mf = mf._replace(num_class="cardinal")
+
+    thousands = None
+    thousands_items: List[NumberItem] = list()
+    prefixes: Dict[Any, NumeralGroup] = dict()
+    for value in range(start, stop, step):
+        if numeral_forms_table is not None:
+            numeral_group = numeral_forms_table.get_group(value, morph)
+            if numeral_group is not None:
+                check_numeral_morph(value, lang, morph, numeral_forms)
+                yield numeral_group
+                continue
+
+        if value < 1000:
+            yield number_items2numeral_group(
+                int2number_items(value, lang),
+                lang=lang,
+                numeral_forms=numeral_forms,
+                morph=morph,
+            )
+            continue
+
+        check_numeral_morph(value, lang, morph, numeral_forms)
+        if is_collective:
+            warnings.warn("Can't convert to collective numeral number; cardinal used")
+
+        if value // 1000 != thousands:
+            thousands = value // 1000
+            thousands_items = int2number_items(thousands * 1000, lang)
+            prefixes = dict()
+
+        group_items = __GROUP_NUMBER_ITEMS[value % 1000]
+        group_shape = tuple(
+            (__VALUE_CLASSES.get(x.value, 10), bool(x.scale)) for x in group_items
+        )
+
+        # words of the higher groups depend on the lowest group only
+        # by its first item and its length
+        prefix_key = (group_shape[:1], min(len(group_items), 2))
+        prefix = prefixes.get(prefix_key)
+        if prefix is None:
+            number_items = thousands_items + list(group_items)
+            numeral_groups = list()
+            for group_start, group_end, plan in __numeral_group_plans(number_items, mf):
+                if group_start >= len(thousands_items):
+                    break
+                items = tuple(number_items[group_start:group_end])
+                numeral_groups.append(numeral_forms.numeral_group(items, plan))
+
+            prefix = prefixes[prefix_key] = __join_numeral_groups(numeral_groups)
+
+        if not group_items:
+            yield prefix
+            continue
+
+        plan = __morph_plan(
+            (__VALUE_CLASSES.get(thousands_items[-1].value, 10), True),
+            group_shape,
+            None,
+            0,
+            mf,
+        )
+        numeral_group = numeral_forms.numeral_group(group_items, plan)
+        yield NumeralGroup(
+            f"{prefix.numeral} {numeral_group.numeral}",
+            tuple(
+                f"{prefix_form} {form}"
+                for prefix_form in prefix.forms
+                for form in numeral_group.forms
+            ),
+        )
+
+
+def build_numeral_forms_table(
+    lang: str, start: int = 0, stop: int = 10000, save: bool = True
+) -> NumeralFormsTable:
+    """
+    Builds the table of `int2numeral()` output for the values in range
+    [start, stop) in all the morphological forms of language `lang`
+    and the inverse table of `numeral2int()` values of the numeral forms
+
+    The table is used by `int2numeral()` and `numeral2int()` at once;
+    if `save` is True, it is written next to the language data and read
+    when the language is loaded, until the language data is changed
+
+    Values whose conversion fails or warns are left out of the table
+    and converted as usual
+
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param int start: first value of the range; default = 0
+    :param int stop: value after the last value of the range; default = 10000
+    :param bool save: write the table next to the language data; default = True
+    :return NumeralFormsTable: table
+
+    :Example:
+
+    >>> from numeral_converter import build_numeral_forms_table, int2numeral
+    >>> table = build_numeral_forms_table("uk", stop=1000)
+    >>> table.get(42, MorphSpec(case="genetive"))
+    {'numeral': 'сорока двох', 'numeral_forms': ['сорока двох']}
+    >>> table.get_value("сорока двох")
+    42
+
+    """
+    check_numeral_data_load(lang)
+    # the table is built by the usual conversion
+    NUMERAL_FORMS_TABLE.pop(lang, None)
+
+    numeral_forms_table = make_numeral_forms_table(lang, start=start, stop=stop)
+    if save:
+        numeral_forms_table.to_file(
+            NUMERAL_FORMS_TABLE_PATH[lang], NUMERAL_DATA_FINGERPRINT[lang]
+        )
+
+    NUMERAL_FORMS_TABLE[lang] = numeral_forms_table
+    return numeral_forms_table
+
+
+def make_numeral_forms_table(
+    lang: str,
+    start: int,
+    stop: int,
+    morph_forms: Optional[Dict[str, List[str]]] = None,
+) -> NumeralFormsTable:
+    """
+    Table of `int2numeral()` output for the values in range [start, stop)
+    in the morphological forms of language `lang`; see `build_numeral_forms_table()`
+
+    :param str lang: language identifier
+    :param int start: first value of the range
+    :param int stop: value after the last value of the range
+    :param Optional[Dict[str, List[str]]] morph_forms: values of the labels
+           to build the table for; default = None: all the values of `MORPH_FORMS`
+    :return NumeralFormsTable: table
+
+    """
+    if start < 0 or stop < start:
+        raise ValueError(f"invalid range [{start}, {stop})")
+
+    check_numeral_data_load(lang)
+
+    labels = NUMERAL_FORMS[lang].labels
+    label_forms = {**MORPH_FORMS, **(morph_forms or dict())}
+    specs = [
+        MorphSpec(**dict(zip(labels, label_values)))
+        for label_values in itertools.product(*[label_forms[label] for label in labels])
+    ]
+
+    forms = NUMERAL_FORMS[lang]
+    numerals: Dict[MorphSpec, List[Optional[NumeralGroup]]] = dict()
+    unique_numerals: Dict[NumeralGroup, NumeralGroup] = dict()
+
+    # numerals are built as by `int2numeral()`, but specs aren't checked:
+    # the spec warnings are raised once, on the table lookups
+    for morph in specs:
+        mf = morph.resolved()
+        numerals[morph] = list()
+        for value in range(start, stop):
+            numeral_group: Optional[NumeralGroup] = None
+            try:
+                number_items = int2number_items(value, lang)
+                # `int2numeral()` warns on each call for collective numerals
+                # of several words: they aren't tabulated
+                if not (mf.num_class == "collective" and len(number_items) > 1):
+                    numeral_group = __join_numeral_groups(
+                        __numeral_groups(
+                            number_items,
+                            forms,
+                            __numeral_group_plans(number_items, mf),
+                        )
+                    )
+            except ValueError:
+                pass
+
+            if numeral_group is not None:
+                numeral_group = unique_numerals.setdefault(numeral_group, numeral_group)
+            numerals[morph].append(numeral_group)
+
+    values: Dict[str, int] = dict()
+    for _, numeral_forms in unique_numerals:
+        for numeral_form in numeral_forms:
+            numeral_form = preprocess_numeral(numeral_form, lang)
+            if numeral_form in values:
+                continue
+            try:
+                numeral_value = numeral2int(numeral_form, lang)
+            except ValueError:
+                continue
+            if numeral_value is not None:
+                values[numeral_form] = numeral_value
+
+    return NumeralFormsTable(
+        lang, start=start, stop=stop, labels=labels, numerals=numerals, values=values
+    )
+
+
 def numeral2number_items(numeral: str, lang: str):
     check_numeral_data_load(lang)
     numeral = preprocess_numeral(numeral, lang)
+    return numeral_words2number_items(numeral.split(" "), NUMERAL_TREE[lang])
 
-    number_items: List[NumberItem] = list()
 
-    for i, number_word in enumerate(numeral.split(" ")[::-1]):
-        number_word_info = NUMERAL_TREE[lang].get(number_word)
+def numeral_words2number_items(
+    numeral_words: List[str], numeral_tree: Union[FuzzyMultiDict, CompressedLexicon]
+) -> NumberItems:
+    number_items = NumberItems()
+
+    for i, number_word in enumerate(numeral_words[::-1]):
+        number_word_info = numeral_tree.get(number_word)
         if not len(number_word_info):
             raise ValueError(f'can\'t convert "{number_word}" to integer')
 
         if i > 0:
-            number_word_info = __delete_ordinal_from_numeral_word_info(number_word_info)
+            number_word_info = delete_ordinal_from_numeral_word_info(number_word_info)
             if not len(number_word_info):
                 raise ValueError(f'ordinal numeral word "{number_word}" inside numeral')
 
         __item = number_word_info[0]["value"]
-        number_items.insert(
-            0,
-            NumberItem(
-                value=__item["value"] if not __item["scale"] else 10 ** __item["order"],
-                order=__item["order"],
-                scale=__item["scale"],
-            ),
-        )
+        number_items.append_item(__item.value, __item.order, __item.scale)
 
+    number_items.reverse()
     return number_items
 
 
-def number_items2int(number_items: List[NumberItem]) -> int:
+def number_word_info2number_item(number_word_info: List[Dict[str, Any]]) -> NumberItem:
+    __item = number_word_info[0]["value"]
+    return NumberItem(
+        value=__item.value if not __item.scale else 10**__item.order,
+        order=__item.order,
+        scale=__item.scale,
+    )
+
+
+def number_items2int(number_items: Sequence[NumberItem]) -> int:
+    if isinstance(number_items, NumberItems):
+        values, orders, scales = number_items.columns()
+    else:
+        values = [x.value for x in number_items]
+        orders = [x.order for x in number_items]
+        scales = [x.scale for x in number_items]
+
+    return __columns2int(values[::-1], orders[::-1], scales[::-1])
+
+
+def __columns2int(
+    values: List[Union[int, float]], orders: List[int], scales: List[Optional[bool]]
+) -> int:
+    # number items are given by columns in reverse order
     int_value = 0
-    number_items = number_items[::-1]
 
     i_number = num_block_start = 0
     num_block_order = 0
 
-    if number_items[0].scale:
+    if scales[0]:
         i_number = num_block_start = 1
-        num_block_order = number_items[0].order
+        num_block_order = orders[0]
 
-    while i_number < len(number_items):
-        i_number, inner_order = __search_block(number_items, i_number, num_block_order)
-        __check_correct_order(number_items, num_block_start, i_number, inner_order)
+    while i_number < len(values):
+        i_number, inner_order = __search_block(
+            orders, scales, i_number, num_block_order
+        )
+        __check_correct_order(values, orders, num_block_start, i_number, inner_order)
         __value = (
-            number_items2int(number_items[num_block_start:i_number][::-1])
+            __columns2int(
+                values[num_block_start:i_number],
+                orders[num_block_start:i_number],
+                scales[num_block_start:i_number],
+            )
             if inner_order
-            else max(sum([x.value for x in number_items[num_block_start:i_number]]), 1)
+            else max(sum(values[num_block_start:i_number]), 1)
         )
 
         int_value += (10**num_block_order) * __value
-        if i_number >= len(number_items):
+        if i_number >= len(values):
             return int(int_value)
 
-        __check_number_is_correct_scale(number_items, i_number, int_value)
-        num_block_order = number_items[i_number].order
+        __check_number_is_correct_scale(values, orders, scales, i_number, int_value)
+        num_block_order = orders[i_number]
         num_block_start = i_number + 1
         i_number += 1
 
@@ -185,222 +546,244 @@ def number_items2int(number_items: List[NumberItem]) -> int:
 
 
 def int2number_items(number: int, lang: str) -> List[NumberItem]:
-    check_numeral_data_load(lang)
     if number == 0:
         return [
             NumberItem(0, -1, None),
         ]
 
-    number_items: List[NumberItem] = list()
-    current_order, ones = 0, None  # type: int, Optional[int]
-
-    mem = None
+    if number < 0:
+        raise ValueError(f"invalid number {number}; expects non-negative int")
 
+    groups = list()
     while number:
-        digit = number % 10
-        if current_order % 3 == 2 and digit:
-            if mem:
-                number_items.insert(0, mem)
-                mem = None
-            number_items.insert(0, NumberItem(100 * digit, current_order % 3, None))
-
-        elif current_order % 3 == 0:
-            ones = digit
-            if current_order > 0:
-                mem = NumberItem(10**current_order, current_order, True)
-        else:
-            if digit == 1 and ones > 0:
-                value = 10 * digit + ones
-                if value:
-                    if mem:
-                        number_items.insert(0, mem)
-                        mem = None
-                    number_items.insert(0, NumberItem(value, current_order % 3, None))
-            else:
-                if ones:
-                    if mem:
-                        number_items.insert(0, mem)
-                        mem = None
-                    number_items.insert(0, NumberItem(ones, 0, None))
-
-                if digit:
-                    if mem:
-                        number_items.insert(0, mem)
-                        mem = None
-                    number_items.insert(
-                        0, NumberItem(10 * digit, current_order % 3, None)
-                    )
+        number, group = divmod(number, 1000)
+        groups.append(group)
 
-            ones = None
-
-        current_order += 1
-        number = number // 10
-
-    if ones:
-        if mem:
-            number_items.insert(0, mem)
-        number_items.insert(0, NumberItem(ones, 0, None))
+    number_items: List[NumberItem] = list()
+    for i_group in range(len(groups) - 1, -1, -1):
+        if groups[i_group]:
+            number_items.extend(__GROUP_NUMBER_ITEMS[groups[i_group]])
+            if i_group:
+                number_items.append(NumberItem(10 ** (3 * i_group), 3 * i_group, True))
 
     if number_items[0].scale is not None:
-        number_items.insert(0, NumberItem(1, 0, None))
+        number_items = [NumberItem(1, 0, None)] + number_items
     elif number_items[0].value == 100 and lang == "en":
-        number_item = NumberItem(number_items[0].value, number_items[0].order, True)
-        number_items = number_items[1:]
-        number_items.insert(0, number_item)
-        number_items.insert(0, NumberItem(1, 0, None))
+        number_items = [
+            NumberItem(1, 0, None),
+            NumberItem(number_items[0].value, number_items[0].order, True),
+        ] + number_items[1:]
 
     return number_items
 
 
-def int2numeral_word(value: int, lang: str, **kwargs) -> NumeralWord:
-    __check_kwargs(kwargs)
-    check_numeral_data_load(lang)
+def __group_number_items(group: int) -> Tuple[NumberItem, ...]:
+    hundreds, tens, ones = group // 100, group // 10 % 10, group % 10
 
-    if value == 0 or math.log10(value) < 6:
-        sub_data = NUMERAL_DATA[lang][NUMERAL_DATA[lang].value == value]
+    number_items = list()
+    if hundreds:
+        number_items.append(NumberItem(100 * hundreds, 2, None))
+    if tens == 1 and ones:
+        number_items.append(NumberItem(10 + ones, 1, None))
     else:
-        sub_data = NUMERAL_DATA[lang][
-            NUMERAL_DATA[lang].order == int(math.log10(value))
-        ]
+        if tens:
+            number_items.append(NumberItem(10 * tens, 1, None))
+        if ones:
+            number_items.append(NumberItem(ones, 0, None))
+
+    return tuple(number_items)
+
+
+# number items of 0 - 999 values
+__GROUP_NUMBER_ITEMS = [__group_number_items(group) for group in range(1000)]
+
+
+def int2numeral_word(
+    value: int,
+    lang: str,
+    numeral_forms: Optional[NumeralForms] = None,
+    morph: Optional[MorphSpec] = None,
+    **kwargs,
+) -> NumeralWord:
+    if morph is None:
+        morph = MorphSpec.from_kwargs(kwargs)
+    if numeral_forms is None:
+        check_numeral_data_load(lang)
+        numeral_forms = NUMERAL_FORMS[lang]
+
+    numeral_forms.check_morph(morph)
+    numeral_forms.check_numeral(
+        [NumberItem(value, None, None)], [(0, 1, (morph,))], morph
+    )
+    return numeral_forms.numeral_word(value, morph)
 
-    if sub_data.shape[0] == 0:
-        raise ValueError(f"no data for number {value}")
 
-    for label, default in DEFAULT_MORPH.items():
-        label_value = kwargs.get(label) or default
-        if label_value and label not in NUMERAL_DATA[lang].columns:
-            warnings.warn(
-                f'no column "{label}" in data for language "{lang}"; ignored',
-                UserWarning,
-            )
+def number_items2numeral(
+    number_items: List[NumberItem],
+    lang: str,
+    numeral_forms: Optional[NumeralForms] = None,
+    morph: Optional[MorphSpec] = None,
+    **kwargs,
+):
+    numeral_group = number_items2numeral_group(
+        number_items, lang=lang, numeral_forms=numeral_forms, morph=morph, **kwargs
+    )
+    return {
+        "numeral": numeral_group.numeral,
+        "numeral_forms": list(numeral_group.forms),
+    }
 
-        if label_value and label in sub_data.columns:
-            if label_value in sub_data[label].values:
-                sub_data = sub_data[sub_data[label] == label_value]
-            elif kwargs.get(label):
-                warnings.warn(
-                    f"no data for {label} == {kwargs.get(label)}; ignored", UserWarning
-                )
-    if sub_data.shape[0] != 1:
-        val_info = __kwargs2str(value=value, kwargs=kwargs)
-        if sub_data.shape[0] == 0:
-            raise ValueError(f"No data for {val_info}")
-        if sub_data.shape[0] > 1:
-            raise ValueError(
-                f"There are more then one values for {val_info}:\n" f"{sub_data.head()}"
-            )
 
-    numeral_words = [x.strip() for x in sub_data.iloc[0].string.split(" ") if x]
-    return NumeralWord(numeral_words[0], numeral_words[1:])
+def number_items2numeral_group(
+    number_items: List[NumberItem],
+    lang: str,
+    numeral_forms: Optional[NumeralForms] = None,
+    morph: Optional[MorphSpec] = None,
+    **kwargs,
+) -> NumeralGroup:
+    if numeral_forms is None:
+        check_numeral_data_load(lang)
+        numeral_forms = NUMERAL_FORMS[lang]
 
+    if morph is None:
+        morph = MorphSpec.from_kwargs(kwargs)
+    numeral_forms.check_morph(morph)
 
-def number_items2numeral(number_items: List[NumberItem], lang: str, **kwargs):
-    mf = {label: kwargs.get(label) or value for label, value in DEFAULT_MORPH.items()}
-    if mf["num_class"] == "collective" and len(number_items) > 1:
+    mf = morph.resolved()
+    if mf.num_class == "collective" and len(number_items) > 1:
         warnings.warn("Can't convert to collective numeral number; cardinal used")
-        mf["num_class"] = "cardinal"
+        mf = mf._replace(num_class="cardinal")
 
-    numbers = list()
-    for i, number_item in enumerate(number_items):
-        if i == len(number_items) - 1:
-            case = __define_morph_case(mf["case"], number_items, i, mf["num_class"])
-            number = __define_morph_number(mf["number"], number_items, i)
-            numbers.append(
-                int2numeral_word(
-                    number_item.value,
-                    lang=lang,
-                    case=case,
-                    number=number,
-                    num_class=mf["num_class"],
-                    gender=mf["gender"],
-                )
-            )
-            continue
+    plans = list(__numeral_group_plans(number_items, mf))
+    numeral_forms.check_numeral(number_items, plans, morph)
 
-        if (
-            (0 < number_item.value < 10)
-            and (i + 1 < len(number_items))
-            and number_items[i + 1].scale
-        ):
-            gender = __define_morph_gender(number_items, i)
-            case = __define_morph_case(mf["case"], number_items, i, mf["num_class"])
-            numbers.append(
-                int2numeral_word(number_item.value, lang=lang, case=case, gender=gender)
-            )
-            continue
+    return __join_numeral_groups(__numeral_groups(number_items, numeral_forms, plans))
 
-        if number_item.scale:
-            case = __define_morph_case(mf["case"], number_items, i, mf["num_class"])
-            number = __define_morph_number(mf["number"], number_items, i)
-            numbers.append(
-                int2numeral_word(number_item.value, lang=lang, case=case, number=number)
-            )
-            continue
 
-        case = __define_morph_case(mf["case"], number_items, i, mf["num_class"])
-        numbers.append(int2numeral_word(number_item.value, lang=lang, case=case))
+def check_numeral_morph(
+    value: int,
+    lang: str,
+    morph: MorphSpec,
+    numeral_forms: Optional[NumeralForms] = None,
+):
+    """
+    Warns about the labels of the morphological form ignored in the numeral
+    of the value; see `NumeralForms.check_morph()`, `NumeralForms.check_numeral()`
+
+    :param int value: integer value
+    :param str lang: language identifier
+    :param MorphSpec morph: morphological form
+    :param Optional[NumeralForms] numeral_forms: numeral words of the language;
+           default = None: loaded ones
+
+    """
+    if numeral_forms is None:
+        check_numeral_data_load(lang)
+        numeral_forms = NUMERAL_FORMS[lang]
+
+    numeral_forms.check_morph(morph)
+    if not numeral_forms.missing_values(morph):
+        return
+
+    number_items = int2number_items(value, lang)
+    mf = morph.resolved()
+    if mf.num_class == "collective" and len(number_items) > 1:
+        mf = mf._replace(num_class="cardinal")
+    numeral_forms.check_numeral(
+        number_items, __numeral_group_plans(number_items, mf), morph
+    )
 
-    return __process_numbers(numbers, number_items, lang=lang)
 
+def __numeral_groups(
+    number_items: List[NumberItem],
+    numeral_forms: NumeralForms,
+    plans: Iterable[Tuple[int, int, Tuple[MorphSpec, ...]]],
+) -> List[NumeralGroup]:
+    return [
+        numeral_forms.numeral_group(tuple(number_items[start:end]), plan)
+        for start, end, plan in plans
+    ]
 
-def __check_kwargs(kwargs):
-    for label, label_item in kwargs.items():
-        if MORPH_FORMS.get(label) is None:
-            raise ValueError(f"Invalid label; use one of {MORPH_FORMS.keys()}")
-        if label_item and label_item not in MORPH_FORMS[label]:
-            raise ValueError(
-                f"Invalid label {label} value; use one of {MORPH_FORMS[label]}"
+
+def __numeral_group_plans(
+    number_items: List[NumberItem], mf: MorphSpec
+) -> Iterator[Tuple[int, int, Tuple[MorphSpec, ...]]]:
+    shape = [(__VALUE_CLASSES.get(x.value, 10), bool(x.scale)) for x in number_items]
+
+    # numeral is built of groups: 0 - 999 value and its scale word;
+    # morphological forms of a group depend on the group shape and its neighbours
+    start = 0
+    for i, number_item in enumerate(number_items):
+        if number_item.scale or i == len(number_items) - 1:
+            end = i + 1
+            yield start, end, __morph_plan(
+                shape[start - 1] if start else None,
+                tuple(shape[start:end]),
+                shape[end] if end < len(number_items) else None,
+                min(len(number_items) - end, 2),
+                mf,
             )
+            start = end
 
 
-def __process_numbers(
-    numbers: List[NumeralWord], number_items, lang: str
-) -> Dict[str, Any]:
-    if lang == "en":
-        numbers__ = numbers.copy()
-        numbers = list()
-        i = 0
-        while i < len(number_items):
-            if (
-                i + 1 < len(number_items)
-                and number_items[i].order == 1
-                and number_items[i + 1].order == 0
-            ):
-                numbers.append(
-                    NumeralWord(
-                        numbers__[i].default + "-" + numbers__[i + 1].default, []
-                    )
-                )
-                i += 2
-            else:
-                numbers.append(numbers__[i])
-                i += 1
-
-    numeral = " ".join(
-        [
-            f"{number.default}" + (f" ({', '.join(number.alt)})" if number.alt else "")
-            for number in numbers
-        ]
+def __join_numeral_groups(numeral_groups: List[NumeralGroup]) -> NumeralGroup:
+    if len(numeral_groups) == 1:
+        return numeral_groups[0]
+
+    return NumeralGroup(
+        " ".join([x.numeral for x in numeral_groups]),
+        tuple(
+            " ".join(combination)
+            for combination in itertools.product(*[x.forms for x in numeral_groups])
+        ),
     )
 
-    numeral_forms = [
-        " ".join(
-            [
-                (
-                    [
-                        numbers[i].default,
-                    ]
-                    + numbers[i].alt
-                )[j]
-                for i, j in enumerate(__combinations)
-            ]
-        )
-        for __combinations in combinations(
-            *[range(1 + len(number.alt)) for number in numbers]
-        )
+
+@functools.lru_cache(maxsize=4096)
+def __morph_plan(
+    prev_shape: Optional[Tuple[int, bool]],
+    shape: Tuple[Tuple[int, bool], ...],
+    next_shape: Optional[Tuple[int, bool]],
+    n_next: int,
+    mf: MorphSpec,
+) -> Tuple[MorphSpec, ...]:
+    """
+    Morphological forms of the numeral words of a group of number items
+
+    Agreement of the words depends only on the value classes and scale flags
+    of the group items and their neighbours, and on the words number after
+    the group (0, 1 or more), so the items are replaced by their shapes
+
+    """
+    number_items = [
+        NumberItem(value, None, scale)
+        for value, scale in ([prev_shape] if prev_shape else [])
+        + list(shape)
+        + ([next_shape] if next_shape else [])
+        + [(10, False)] * max(n_next - 1, 0)
     ]
 
-    return {"numeral": numeral, "numeral_forms": numeral_forms}
+    plan = list()
+    for i in range(1 if prev_shape else 0, len(number_items) - n_next):
+        number_item = number_items[i]
+        case = __define_morph_case(mf.case, number_items, i, mf.num_class)
+
+        if i == len(number_items) - 1:
+            number = __define_morph_number(mf.number, number_items, i)
+            plan.append(MorphSpec(case, mf.num_class, mf.gender, number))
+
+        elif (0 < number_item.value < 10) and number_items[i + 1].scale:
+            gender = __define_morph_gender(number_items, i)
+            plan.append(MorphSpec(case=case, gender=gender))
+
+        elif number_item.scale:
+            number = __define_morph_number(mf.number, number_items, i)
+            plan.append(MorphSpec(case=case, number=number))
+
+        else:
+            plan.append(MorphSpec(case=case))
+
+    return tuple(plan)
 
 
 def preprocess_numeral(numeral: str, lang: str) -> str:
@@ -415,90 +798,68 @@ def preprocess_numeral(numeral: str, lang: str) -> str:
     return numeral
 
 
-def __delete_ordinal_from_numeral_word_info(
+def delete_ordinal_from_numeral_word_info(
     number_word_info: List[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
     return [
         item
         for item in number_word_info
-        if (
-            not isinstance(item["value"]["morph_forms"], list)
-            and item["value"]["morph_forms"].get("num_class") != "ordinal"
-        )
-        or all(
-            [
-                (v.get("num_class") is None or v.get("num_class") != "ordinal")
-                for v in item["value"]["morph_forms"]
-            ]
-        )
+        if all(v.get("num_class") != "ordinal" for v in item["value"].morph_forms)
     ]
 
 
 def __check_correct_order(
-    number_items: List[NumberItem], start: int, end: int, inner_order: Optional[int]
+    values: List[Union[int, float]],
+    orders: List[int],
+    start: int,
+    end: int,
+    inner_order: Optional[int],
 ):
     for k in range(start + 1, end):
-        __order = (
-            0
-            if number_items[k].value % 10 ** number_items[k].order
-            else number_items[k].order
-        )
+        __order = 0 if values[k] % 10 ** orders[k] else orders[k]
 
-        if not inner_order and number_items[k - 1].order >= __order:
+        if not inner_order and orders[k - 1] >= __order:
             raise ValueError(
-                f"position {len(number_items) - k}: {number_items[k - 1].value}"
-                f" with order {number_items[k - 1].order} stands after "
-                f"{number_items[k].value} with less/equal order {__order}"
+                f"position {len(values) - k}: {values[k - 1]}"
+                f" with order {orders[k - 1]} stands after "
+                f"{values[k]} with less/equal order {__order}"
             )
 
-        if inner_order and number_items[k - 1].order == __order:
+        if inner_order and orders[k - 1] == __order:
             raise ValueError(
-                f"position {len(number_items) - k}: {number_items[k - 1].value}"
-                f" with order {number_items[k - 1].order} stands after "
-                f"{number_items[k].value} with equal order {__order}"
+                f"position {len(values) - k}: {values[k - 1]}"
+                f" with order {orders[k - 1]} stands after "
+                f"{values[k]} with equal order {__order}"
             )
 
 
-def __search_block(number_items, start, num_block_order):
+def __search_block(orders, scales, start, num_block_order):
     inner_order = None
-    while start < len(number_items) and (
-        not number_items[start].scale or number_items[start].order < num_block_order
+    while start < len(orders) and (
+        not scales[start] or orders[start] < num_block_order
     ):
-        if number_items[start].scale and (
-            inner_order is None or inner_order < number_items[start].order
-        ):
-            inner_order = number_items[start].order
+        if scales[start] and (inner_order is None or inner_order < orders[start]):
+            inner_order = orders[start]
         start += 1
     return start, inner_order
 
 
-def __check_number_is_correct_scale(number_items, i_number, int_value):
-    if not number_items[i_number].scale:
+def __check_number_is_correct_scale(values, orders, scales, i_number, int_value):
+    if not scales[i_number]:
         raise ValueError(
-            f"position {len(number_items) - 1 - i_number}: expects 10^(3n) or 100; "
-            f"found {number_items[i_number].value}"
+            f"position {len(values) - 1 - i_number}: expects 10^(3n) or 100; "
+            f"found {values[i_number]}"
         )
 
     value_order = int(math.log10(int_value))
-    if number_items[i_number].order <= value_order:
+    if orders[i_number] <= value_order:
         raise ValueError(
-            f"position {len(number_items) - 1 - i_number}: order of "
-            f"{number_items[i_number].value}:{number_items[i_number].order} "
+            f"position {len(values) - 1 - i_number}: order of "
+            f"{values[i_number]}:{orders[i_number]} "
             f"is less/equal of summary order in next group: {value_order}"
         )
 
 
-def __kwargs2str(value, kwargs):
-    labels_string = ", ".join(
-        [
-            f'{label} = "{kwargs.get(label) or default}"'
-            for label, default in DEFAULT_MORPH.items()
-            if (kwargs.get(label) or default)
-        ]
-    )
-    return f"number {value} ({labels_string})"
-
-
 def __define_morph_number(
     global_number: str, number_items: List[NumberItem], i: int
 ) -> str:
@@ -0,0 +1,55 @@
+import atexit
+import multiprocessing
+import os
+from multiprocessing.pool import Pool
+from typing import Dict, Optional, Tuple
+
+from .lang_data_loader import check_numeral_data_load, is_ready, load_numeral_data
+
+__POOLS: Dict[Tuple[str, int], Pool] = dict()
+
+
+def get_pool(lang: str, workers: Optional[int] = None) -> Pool:
+    """
+    Persistent pool of processes with language `lang` data loaded
+
+    :param str lang: language identifier
+    :param Optional[int] workers: number of worker processes;
+           default is the number of CPUs
+    :return Pool: pool of processes
+
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"invalid number of workers {workers}; expects positive int")
+
+    pool = __POOLS.get((lang, workers))
+    if pool is None:
+        # loads (and downloads) data once in the main process;
+        # forked workers inherit it, spawned workers read it from the local cache
+        check_numeral_data_load(lang)
+        pool = multiprocessing.Pool(
+            processes=workers, initializer=__init_worker, initargs=(lang,)
+        )
+        __POOLS[(lang, workers)] = pool
+
+    return pool
+
+
+def shutdown_pools():
+    """
+    Terminates all the pools created by `get_pool()`
+
+    """
+    while __POOLS:
+        _, pool = __POOLS.popitem()
+        pool.terminate()
+        pool.join()
+
+
+def __init_worker(lang: str):
+    if not is_ready(lang):
+        load_numeral_data(lang)
+
+
+atexit.register(shutdown_pools)
@@ -0,0 +1,238 @@
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .lang_data_loader import NUMERAL_PREFILTER
+from .numeral_converter import (
+    NUMERAL_TREE,
+    NumberItem,
+    check_numeral_data_load,
+    delete_ordinal_from_numeral_word_info,
+    number_items2int,
+    number_word_info2number_item,
+    preprocess_numeral,
+)
+
+ParsedNumeral = namedtuple("ParsedNumeral", "value start end")
+
+
+class NumeralParser:
+    """
+    Incremental (push) parser of numerals given word by word
+
+    Each word is looked up in the language numeral tree only once, when it is fed;
+    the numeral is never rejoined into a string and reparsed
+
+    Parser states returned by `feed()`:
+
+    - "empty": no numeral is started; the word is not a numeral word;
+    - "open": the word continues (or starts) the numeral, it may continue further;
+    - "complete": the numeral can't continue: the word is not a numeral word
+      (the word isn't included into the numeral) or the word is an ordinal
+      numeral word (the word is included into the numeral);
+    - "invalid": the word is a numeral word, but it can't continue the numeral;
+      the numeral is closed without it and the word starts the next numeral
+
+    After "complete" or "invalid" the numeral must be taken with `close()`;
+    `close()` also has to be called at the end of the stream
+
+    Hyphenated words (e.g. "twenty-three") are fed part by part; connector
+    words (e.g. "and" in "one hundred and one") keep the numeral open,
+    but are not included into it
+
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param int max_corrections: maximum number of corrections in the word
+           when searching for a matching numeral word; default = 0
+    :param Optional[float] max_corrections_relative: value to calculate
+           maximum number of corrections in the word when searching
+           for a matching numeral word; default = None
+           calculated as round(max_corrections_relative * word_length)
+
+    :Example:
+
+    >>> from numeral_converter import NumeralParser
+    >>> parser = NumeralParser(lang="uk")
+    >>> for word in "дві тисячі двадцять три роки".split(" "):
+    ...     parser.feed(word)
+    'open'
+    'open'
+    'open'
+    'open'
+    'complete'
+    >>> parser.close()
+    ParsedNumeral(value=2023, start=0, end=4)
+
+    """
+
+    EMPTY = "empty"
+    OPEN = "open"
+    COMPLETE = "complete"
+    INVALID = "invalid"
+
+    # words that may join the parts of a numeral
+    __CONNECTORS = {"en": ("and",)}
+
+    def __init__(
+        self,
+        lang: str,
+        max_corrections: Optional[int] = 0,
+        max_corrections_relative: Optional[float] = None,
+    ):
+        check_numeral_data_load(lang)
+
+        self.lang = lang
+        self.max_corrections = max_corrections
+        self.max_corrections_relative = max_corrections_relative
+
+        self.__n_words = 0
+        self.__state = self.EMPTY
+        self.__connected = False
+        self.__rejected: Optional[Tuple[List[Dict[str, Any]], int, int]] = None
+        self.__reset()
+
+    @property
+    def state(self) -> str:
+        return self.__state
+
+    def feed(
+        self, word: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> str:
+        """
+        Feeds the next word into the parser
+
+        :param str word: next word
+        :param Optional[int] start: start position of the word, e.g. in the text;
+               default is the word index in the stream
+        :param Optional[int] end: end position of the word;
+               default is the word index in the stream + 1
+        :return str: parser state
+
+        """
+        if self.__state in (self.COMPLETE, self.INVALID):
+            raise ValueError(f"numeral is {self.__state}; call close() before feed()")
+
+        if start is None:
+            start = self.__n_words
+        if end is None:
+            end = start + 1
+        self.__n_words += 1
+
+        for part in preprocess_numeral(word, lang=self.lang).split(" "):
+            if self.__state not in (self.EMPTY, self.OPEN):
+                break
+            self.__feed_part(part, start, end)
+
+        return self.__state
+
+    def __feed_part(self, word: str, start: int, end: int):
+        if (
+            self.__number_items
+            and not self.__connected
+            and word in self.__CONNECTORS.get(self.lang, ())
+        ):
+            self.__connected = True
+            return
+
+        number_word_info = (
+            NUMERAL_TREE[self.lang].get(
+                word,
+                max_corrections=self.max_corrections,
+                max_corrections_relative=self.max_corrections_relative,
+            )
+            if NUMERAL_PREFILTER[self.lang].may_match(
+                word,
+                max_corrections=self.max_corrections,
+                max_corrections_relative=self.max_corrections_relative,
+            )
+            else list()
+        )
+
+        if not number_word_info:
+            self.__state = self.COMPLETE if self.__number_items else self.EMPTY
+            return
+
+        if not self.__number_items:
+            self.__start(number_word_info, start, end)
+        else:
+            self.__continue(number_word_info, start, end)
+
+    def close(self) -> Optional[ParsedNumeral]:
+        """
+        Closes the current numeral
+
+        :return Optional[ParsedNumeral]: value and span of the numeral;
+                None if no numeral is started
+
+        """
+        parsed_numeral = None
+        if self.__number_items:
+            parsed_numeral = ParsedNumeral(
+                number_items2int(self.__number_items), self.__span[0], self.__span[1]
+            )
+
+        self.__reset()
+        if self.__rejected is not None:
+            self.__start(*self.__rejected)
+            self.__rejected = None
+
+        return parsed_numeral
+
+    def __reset(self) -> None:
+        self.__state = self.EMPTY
+        self.__connected = False
+        self.__number_items: List[NumberItem] = list()
+        self.__last_word_info: List[Dict[str, Any]] = list()
+        self.__span = (0, 0)
+
+    def __start(self, number_word_info: List[Dict[str, Any]], start: int, end: int):
+        self.__number_items = [number_word_info2number_item(number_word_info)]
+        self.__last_word_info = number_word_info
+        self.__span = (start, end)
+        self.__state = self.__open_or_complete(number_word_info)
+
+    def __continue(self, number_word_info: List[Dict[str, Any]], start: int, end: int):
+        prev_word_info = delete_ordinal_from_numeral_word_info(self.__last_word_info)
+        if not prev_word_info:
+            self.__rejected = (number_word_info, start, end)
+            self.__state = self.INVALID
+            return
+
+        # the last item is replaced by its non-ordinal form, the new item is added
+        tail = [
+            number_word_info2number_item(prev_word_info),
+            number_word_info2number_item(number_word_info),
+        ]
+
+        # only the block of the numeral the new item changes is validated:
+        # items from the nearest scale word of greater order than all the scale
+        # words after it; the items before it don't depend on the new item
+        block_start = self.__block_start(tail)
+        try:
+            number_items2int(self.__number_items[block_start:-1] + tail)
+        except ValueError:
+            self.__rejected = (number_word_info, start, end)
+            self.__state = self.INVALID
+            return
+
+        self.__number_items[-1:] = tail
+        self.__last_word_info = number_word_info
+        self.__span = (self.__span[0], end)
+        self.__connected = False
+        self.__state = self.__open_or_complete(number_word_info)
+
+    def __block_start(self, tail: List[NumberItem]) -> int:
+        i_tail = len(self.__number_items) - 1
+        max_order = tail[-1].order if tail[-1].scale else None
+        for i in range(i_tail, -1, -1):
+            number_item = tail[0] if i == i_tail else self.__number_items[i]
+            if number_item.scale:
+                if max_order is None or number_item.order > max_order:
+                    return i
+                max_order = max(max_order, number_item.order)
+
+        return 0
+
+    def __open_or_complete(self, number_word_info: List[Dict[str, Any]]) -> str:
+        if delete_ordinal_from_numeral_word_info(number_word_info):
+            return self.OPEN
+        return self.COMPLETE
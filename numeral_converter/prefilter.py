@@ -0,0 +1,94 @@
+from typing import Iterable, Optional
+
+
+class NumeralPrefilter:
+    """
+    Cheap check whether a word can be found in the numeral tree
+
+    Rejects words which can't match any numeral word with the allowed number
+    of corrections; never rejects a word the numeral tree lookup would match
+
+    A correction (insertion, deletion, substitution or transposition of symbols)
+    changes the word length by 1 at most, brings in at most 1 symbol and breaks
+    at most 3 bigrams of the word; so the word is rejected if its length,
+    symbols or bigrams are out of the numeral words data beyond these limits
+
+    :param Iterable[str] words: numeral words
+
+    :Example:
+
+    >>> prefilter = NumeralPrefilter(["one", "two", "three"])
+    >>> prefilter.may_match("two")
+    True
+    >>> prefilter.may_match("tow")
+    False
+    >>> prefilter.may_match("tow", max_corrections=1)
+    True
+    >>> prefilter.may_match("apple", max_corrections=1)
+    False
+
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = frozenset(words)
+        self.min_length = min((len(word) for word in self.words), default=0)
+        self.max_length = max((len(word) for word in self.words), default=0)
+        self.symbols = frozenset(c for word in self.words for c in word)
+        self.bigrams = frozenset(
+            word[i : i + 2] for word in self.words for i in range(len(word) - 1)
+        )
+
+    def may_match(
+        self,
+        word: str,
+        max_corrections: Optional[int] = 0,
+        max_corrections_relative: Optional[float] = None,
+    ) -> bool:
+        """
+        Checks whether the word may match a numeral word
+
+        :param str word: preprocessed word
+        :param int max_corrections: maximum number of corrections in the word;
+               default = 0
+        :param Optional[float] max_corrections_relative: value to calculate
+               maximum number of corrections in the word; if not None -
+               `max_corrections` will be ignored; default = None
+               calculated as round(max_corrections_relative * word_length)
+        :return bool: False if the word can't match any numeral word
+
+        """
+        if word in self.words:
+            return True
+
+        if max_corrections_relative is not None:
+            max_corrections = round(max_corrections_relative * len(word))
+
+        # numeral tree default number of corrections is used
+        if max_corrections is None:
+            return True
+
+        if max_corrections <= 0:
+            return False
+
+        if not (
+            self.min_length - max_corrections
+            <= len(word)
+            <= self.max_length + max_corrections
+        ):
+            return False
+
+        n_unknown = 0
+        for c in word:
+            if c not in self.symbols:
+                n_unknown += 1
+                if n_unknown > max_corrections:
+                    return False
+
+        n_unknown = 0
+        for i in range(len(word) - 1):
+            if word[i : i + 2] not in self.bigrams:
+                n_unknown += 1
+                if n_unknown > 3 * max_corrections:
+                    return False
+
+        return True
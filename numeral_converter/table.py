@@ -0,0 +1,198 @@
+import os
+import time
+from collections import namedtuple
+from typing import Any, Iterable, List, Union
+
+import pandas as pd
+
+from .lang_data_loader import check_numeral_data_load
+from .morph import MorphSpec
+from .numeral_converter import int2numeral, numeral2int
+
+TableStats = namedtuple("TableStats", "rows seconds rows_per_second")
+
+OPERATIONS = ("numeral2int", "int2numeral")
+
+
+def convert_csv(
+    input_filename: Union[str, os.PathLike],
+    output_filename: Union[str, os.PathLike],
+    lang: str,
+    columns: Iterable[str],
+    operation: str = "numeral2int",
+    chunksize: int = 100000,
+    sep: str = ",",
+    **kwargs,
+) -> TableStats:
+    """
+    Converts columns of CSV file with `numeral2int()` or `int2numeral()`
+
+    The file is read and written chunk by chunk of `chunksize` rows, so memory
+    use doesn't depend on the file size; each unique value of a column
+    is converted once per chunk (see `convert_series()`);
+    values which fail to convert become empty
+
+    :param input_filename: input CSV file
+    :param output_filename: output CSV file
+    :param str lang: language identifier
+    :param Iterable[str] columns: names of the columns to convert
+    :param str operation: "numeral2int" or "int2numeral"; default = "numeral2int"
+    :param int chunksize: number of rows read at a time; default = 100000
+    :param str sep: CSV delimiter; default = ","
+    :param kwargs: morphological form for the "int2numeral" operation;
+           see `int2numeral()`
+    :return TableStats: number of rows, time in seconds and rows per second
+
+    :Example:
+
+    >>> from numeral_converter import convert_csv
+    >>> convert_csv("orders.csv", "orders.converted.csv", lang="uk",
+    ...             columns=["amount"])
+    TableStats(rows=1000000, seconds=12.5, rows_per_second=80000.0)
+
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"invalid operation {operation}; use one of {OPERATIONS}")
+
+    if chunksize < 1:
+        raise ValueError(f"invalid chunksize {chunksize}; expects positive int")
+
+    MorphSpec.from_kwargs(kwargs)
+    columns = list(columns)
+    check_numeral_data_load(lang)
+
+    start = time.perf_counter()
+    n_rows = 0
+
+    with pd.read_csv(
+        input_filename,
+        sep=sep,
+        chunksize=chunksize,
+        dtype={column: object for column in columns},
+    ) as reader, open(output_filename, "w", encoding="utf-8", newline="") as writer:
+        for i_chunk, chunk in enumerate(reader):
+            for column in columns:
+                if column not in chunk.columns:
+                    raise ValueError(f'no column "{column}" in {input_filename}')
+
+                chunk[column] = convert_series(
+                    chunk[column], operation=operation, lang=lang, **kwargs
+                )
+
+            chunk.to_csv(writer, sep=sep, header=i_chunk == 0, index=False)
+            n_rows += len(chunk)
+
+    seconds = time.perf_counter() - start
+    return TableStats(n_rows, seconds, n_rows / max(seconds, 1e-9))
+
+
+def convert_series(series: pd.Series, operation: str, lang: str, **kwargs) -> pd.Series:
+    """
+    Converts values of the series with `numeral2int()` or `int2numeral()`
+
+    The series is factorized, so each unique value is converted once;
+    values which fail to convert and missing values become NA
+
+    :param pd.Series series: input series
+    :param str operation: "numeral2int" or "int2numeral"
+    :param str lang: language identifier
+    :param kwargs: morphological form for the "int2numeral" operation;
+           see `int2numeral()`
+    :return pd.Series: converted values with the index of the input series
+
+    :Example:
+
+    >>> import pandas as pd
+    >>> from numeral_converter.table import convert_series
+    >>> convert_series(pd.Series(["сорок два", "сто", "сорок два"]),
+    ...                operation="numeral2int", lang="uk")
+    0     42
+    1    100
+    2     42
+    dtype: object
+
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"invalid operation {operation}; use one of {OPERATIONS}")
+
+    morph = MorphSpec.from_kwargs(kwargs)
+    check_numeral_data_load(lang)
+
+    codes, uniques = pd.factorize(series)
+    # the last item is taken by the missing values code -1
+    values = pd.Series(
+        __convert_unique(uniques, operation, lang, morph) + [pd.NA], dtype=object
+    )
+
+    return pd.Series(values.take(codes).values, index=series.index, name=series.name)
+
+
+@pd.api.extensions.register_series_accessor("numeral")
+class NumeralAccessor:
+    """
+    `Series.numeral` accessor: conversion of the series values
+
+    Each unique value is converted once (see `convert_series()`);
+    values which fail to convert become NA
+
+    :Example:
+
+    >>> import pandas as pd
+    >>> import numeral_converter
+    >>> pd.Series(["сорок два", "сто", "сорок два"]).numeral.to_int("uk")
+    0     42
+    1    100
+    2     42
+    dtype: object
+    >>> pd.Series([1, 2]).numeral.to_words("uk", case="genetive")
+    0    одного
+    1      двох
+    dtype: object
+
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def to_int(self, lang: str) -> pd.Series:
+        """
+        Converts numerals into integer values; see `numeral2int()`
+
+        :param str lang: language identifier
+        :return pd.Series: integer values
+
+        """
+        return convert_series(self._series, operation="numeral2int", lang=lang)
+
+    def to_words(self, lang: str, **kwargs) -> pd.Series:
+        """
+        Converts integer values into numerals; see `int2numeral()`
+
+        :param str lang: language identifier
+        :param kwargs: morphological form: case, num_class, gender, number
+        :return pd.Series: numerals
+
+        """
+        return convert_series(
+            self._series, operation="int2numeral", lang=lang, **kwargs
+        )
+
+
+def __convert_unique(
+    values: Iterable[Any], operation: str, lang: str, morph: MorphSpec
+) -> List[Any]:
+    results: List[Any] = list()
+
+    for value in values:
+        try:
+            if operation == "numeral2int":
+                results.append(numeral2int(str(value), lang=lang))
+            else:
+                number = int(value)
+                if not isinstance(value, str) and number != value:
+                    raise ValueError(f"invalid value {value}; expects integer")
+                results.append(int2numeral(number, lang=lang, morph=morph)["numeral"])
+        except (ValueError, TypeError):
+            results.append(pd.NA)
+
+    return [pd.NA if result is None else result for result in results]
@@ -1,21 +1,63 @@
-from typing import List, Optional
+import functools
+import itertools
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Optional, TextIO, Union, overload
 
+from fuzzy_multi_dict import FuzzyMultiDict
+
+from .compressed_lexicon import CompressedLexicon
 from .constants import REGEX_PATTERN_WORDS
+from .lang_data_loader import NUMERAL_PREFILTER
+from .lexicon import entry_morph_forms
+from .number_items import NumberItems
 from .numeral_converter import (
     NUMERAL_TREE,
-    NumberItem,
     check_numeral_data_load,
     number_items2int,
     preprocess_numeral,
 )
+from .parallel import get_pool
+from .prefilter import NumeralPrefilter
+
+NumeralSpan = namedtuple("NumeralSpan", "start end value morph_forms")
+
+# minimum length of a text piece converted by a worker in parallel mode
+PARALLEL_PIECE_LENGTH = 65536
 
 
+@overload
 def convert_numerical_in_text(
     text: str,
     lang: str,
     max_corrections: Optional[int] = 0,
     max_corrections_relative: Optional[float] = None,
+    writer: None = None,
+    workers: Optional[int] = None,
 ) -> str:
+    ...
+
+
+@overload
+def convert_numerical_in_text(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+    *,
+    writer: TextIO,
+    workers: Optional[int] = None,
+) -> None:
+    ...
+
+
+def convert_numerical_in_text(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+    writer: Optional[TextIO] = None,
+    workers: Optional[int] = None,
+) -> Optional[str]:
     """
     Converts numerical string in text into integer values
 
@@ -28,7 +70,14 @@ def convert_numerical_in_text(
            maximum number of corrections in the query key when searching
            for a matching dictionary key; default = None
            calculated as round(max_corrections_relative * token_length)
-    :return str: updated text with converted numerical into integer
+    :param Optional[TextIO] writer: text writer (e.g. `io.TextIOBase`);
+           if given, the updated text is written into it piece by piece
+           and None is returned; default = None
+    :param Optional[int] workers: if greater than 1 - the text is split between
+           words that can't be a part of one numeral, and the pieces are converted
+           on a pool of `workers` processes; the result is the same as in
+           the serial mode; default = None (serial mode)
+    :return Optional[str]: updated text with converted numerical into integer
 
     :Example:
 
@@ -42,53 +91,434 @@ def convert_numerical_in_text(
     "У моєму портфелі лежало 4 книги."
 
     """
+    pieces = (
+        split_text(text, n_pieces=min(4 * workers, len(text) // PARALLEL_PIECE_LENGTH))
+        if workers and workers > 1
+        else [text]
+    )
+
+    segments: Iterable[str]
+    if len(pieces) > 1:
+        segments = get_pool(lang, workers=workers).imap(
+            functools.partial(
+                __convert_text,
+                lang=lang,
+                max_corrections=max_corrections,
+                max_corrections_relative=max_corrections_relative,
+            ),
+            pieces,
+        )
+    else:
+        segments = __converted_segments(
+            text,
+            lang=lang,
+            max_corrections=max_corrections,
+            max_corrections_relative=max_corrections_relative,
+        )
+
+    if writer is not None:
+        for segment in segments:
+            writer.write(segment)
+        return None
+
+    return "".join(segments)
+
+
+def find_numerals(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+) -> Iterator[NumeralSpan]:
+    """
+    Searches for numerals in text; spans are yielded lazily while scanning the text
+
+    :param str text: input text
+    :param str lang: input text language
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :return Iterator[NumeralSpan]: numeral spans: start and end position
+            of the numeral in text, its integer value and morph forms
+            of the last numeral word
+
+    :Example:
+
+    >>> s = "У моєму портфелі лежало чотири книги."
+    >>> [(x.start, x.end, x.value) for x in find_numerals(s, lang='uk')]
+    [(24, 30, 4)]
+
+    """
+    for numeral in __scan_numerals(
+        [text],
+        lang=lang,
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    ):
+        if isinstance(numeral, NumeralSpan):
+            yield numeral
+
+
+def convert_corpus(
+    texts: Iterable[str],
+    lang: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Converts numerical strings into integer values in each text of the corpus
+    on a pool of processes
+
+    The pool is created on the first call for the given language and number
+    of workers and reused by next calls; each worker loads the language data once
+
+    :param Iterable[str] texts: input texts
+    :param str lang: input texts language
+    :param Optional[int] workers: number of worker processes;
+           default is the number of CPUs
+    :param int chunksize: number of texts sent to a worker at a time; default = 16
+    :param bool ordered: if True - results are yielded in the order of input texts,
+           otherwise - as soon as they are ready; default = True
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :return Iterator[str]: updated texts with converted numerical into integer
+
+    :Example:
+
+    >>> from numeral_converter import convert_corpus
+    >>> list(convert_corpus(["сорок два", "сто учнів"], lang="uk", workers=2))
+    ['42', '100 учнів']
+
+    """
+    if chunksize < 1:
+        raise ValueError(f"invalid chunksize {chunksize}; expects positive int")
+
+    pool = get_pool(lang, workers=workers)
+    func = functools.partial(
+        __convert_text,
+        lang=lang,
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    )
+
+    if ordered:
+        return pool.imap(func, texts, chunksize=chunksize)
+    return pool.imap_unordered(func, texts, chunksize=chunksize)
+
+
+def convert_numerical_in_stream(
+    reader: TextIO,
+    writer: TextIO,
+    lang: str,
+    chunk_size: int = 65536,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+):
+    """
+    Converts numerical string in text stream into integer values
+
+    The input is read chunk by chunk; numerals that span a chunk boundary
+    are converted as a whole; memory use is bounded by the chunk size
+
+    :param TextIO reader: input text stream; must support `read(size)`
+    :param TextIO writer: output text stream; must support `write(s)`
+    :param str lang: input text language
+    :param int chunk_size: number of characters to read at a time; default = 65536
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+
+    :Example:
+
+    >>> with open("input.txt") as reader, open("output.txt", "w") as writer:
+    ...     convert_numerical_in_stream(reader, writer, lang="uk")
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f"invalid chunk size {chunk_size}; expects positive int")
+
+    for segment in convert_numerical_in_chunks(
+        iter(functools.partial(reader.read, chunk_size), ""),
+        lang=lang,
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    ):
+        writer.write(segment)
+
+
+def convert_numerical_in_chunks(
+    chunks: Iterable[str],
+    lang: str,
+    max_corrections: Optional[int] = 0,
+    max_corrections_relative: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Converts numerical string in text given by chunks into integer values
+
+    Numerals that span a chunk boundary are converted as a whole;
+    only the text after the last position that can't be a part of a numeral
+    is kept between chunks
+
+    :param Iterable[str] chunks: input text chunks
+    :param str lang: input text language
+    :param int max_corrections: default value of maximum number of corrections
+           in the query key when searching for a matching dictionary key;
+           default = 0
+    :param Optional[float] max_corrections_relative: default value to calculate
+           maximum number of corrections in the query key when searching
+           for a matching dictionary key; default = None
+           calculated as round(max_corrections_relative * token_length)
+    :return Iterator[str]: pieces of the updated text
+
+    :Example:
+
+    >>> "".join(convert_numerical_in_chunks(["лежало чоти", "ри книги"], lang="uk"))
+    'лежало 4 книги'
+
+    """
+    buffer = str()
+    buffer_start = i = 0
+
+    def __chunks() -> Iterator[str]:
+        nonlocal buffer
+        for chunk in chunks:
+            buffer += chunk
+            yield chunk
+
+    for numeral in __scan_numerals(
+        __chunks(),
+        lang=lang,
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    ):
+        if isinstance(numeral, NumeralSpan):
+            yield buffer[i - buffer_start : numeral.start - buffer_start]
+            yield str(numeral.value)
+            i = numeral.end
+        elif numeral > i:
+            yield buffer[i - buffer_start : numeral - buffer_start]
+            buffer = buffer[numeral - buffer_start :]
+            buffer_start = i = numeral
+
+    yield buffer[i - buffer_start :]
+
+
+def split_text(text: str, n_pieces: int) -> List[str]:
+    """
+    Splits text into about `n_pieces` pieces of equal length between words
+    that can't be a part of one numeral
+
+    Converting the pieces separately gives the same result as converting
+    the whole text
+
+    :param str text: input text
+    :param int n_pieces: number of pieces to split the text into
+    :return List[str]: pieces of the text; "".join(pieces) == text
+
+    """
+    if n_pieces < 2:
+        return [text]
+
+    pieces = list()
+    start = 0
+    for k in range(1, n_pieces):
+        target = max(start, k * len(text) // n_pieces)
+
+        # cuts inside a gap of 2+ symbols between words: a numeral can't span it
+        cut = None
+        prev_end = None
+        for match in REGEX_PATTERN_WORDS.finditer(text, target):
+            if prev_end is not None and match.start() - prev_end >= 2:
+                cut = prev_end + 1
+                break
+            prev_end = match.end()
+
+        if cut is None:
+            break
+
+        pieces.append(text[start:cut])
+        start = cut
+
+    pieces.append(text[start:])
+    return pieces
+
+
+def __scan_numerals(
+    chunks: Iterable[str],
+    lang: str,
+    max_corrections: Optional[int],
+    max_corrections_relative: Optional[float],
+) -> Iterator[Union[NumeralSpan, int]]:
     check_numeral_data_load(lang)
 
-    updated_text = str()
-    i = 0
+    yield from scan_numerals(
+        chunks,
+        lang=lang,
+        numeral_tree=NUMERAL_TREE[lang],
+        prefilter=NUMERAL_PREFILTER[lang],
+        max_corrections=max_corrections,
+        max_corrections_relative=max_corrections_relative,
+    )
+
 
-    __number_items: List[NumberItem] = list()
-    __prev_number_end = None  # type: Optional[int]
+def scan_numerals(
+    chunks: Iterable[str],
+    lang: str,
+    numeral_tree: Union[FuzzyMultiDict, CompressedLexicon],
+    prefilter: NumeralPrefilter,
+    max_corrections: Optional[int],
+    max_corrections_relative: Optional[float],
+) -> Iterator[Union[NumeralSpan, int]]:
+    """
+    Yields numeral spans found in the text given by chunks
+    and, after each chunk, the position before which the text
+    can't be a part of next numerals
+
+    Language data is given by the caller and is not looked up
+
+    :param Iterable[str] chunks: input text chunks
+    :param str lang: input text language
+    :param numeral_tree: numeral words of the language
+    :param NumeralPrefilter prefilter: prefilter of the language numeral words
+    :param int max_corrections: maximum number of corrections in numeral words
+    :param Optional[float] max_corrections_relative: value to calculate
+           maximum number of corrections in numeral words
+    :return Iterator[Union[NumeralSpan, int]]: numeral spans and positions
+
+    """
+    __number_items = NumberItems()
+    __start = __end = 0
+    __morph_forms = None
+
+    tail, offset = str(), 0
+
+    for chunk in itertools.chain(chunks, [None]):
+        text = tail + chunk if tail and chunk else (chunk or tail)
+        scan_end = len(text)
+
+        for match in REGEX_PATTERN_WORDS.finditer(text):
+            # word may continue in the next chunk
+            if chunk is not None and match.end() == len(text):
+                scan_end = match.start()
+                break
+
+            # words matched by REGEX_PATTERN_WORDS need no preprocessing but lower()
+            if not prefilter.may_match(
+                match.group().lower(),
+                max_corrections=max_corrections,
+                max_corrections_relative=max_corrections_relative,
+            ):
+                continue
+
+            numeral = numeral_tree.get(
+                preprocess_numeral(match.group(), lang=lang),
+                max_corrections=max_corrections,
+                max_corrections_relative=max_corrections_relative,
+            )
+
+            if not numeral:
+                continue
+
+            __item = numeral[0]["value"]
+
+            # number continues
+            if __number_items and offset + match.start() - __end < 2:
+                __number_items.append_item(__item.value, __item.order, __item.scale)
+                __end = offset + match.end()
+                __morph_forms = entry_morph_forms(__item)
+                continue
+
+            # prev number ends
+            if __number_items:
+                yield NumeralSpan(
+                    __start, __end, number_items2int(__number_items), __morph_forms
+                )
+
+            # number starts
+            __number_items = NumberItems()
+            __number_items.append_item(__item.value, __item.order, __item.scale)
+            __start, __end = offset + match.start(), offset + match.end()
+            __morph_forms = entry_morph_forms(__item)
+
+        # next word can't continue the number
+        if __number_items and (chunk is None or offset + scan_end - __end >= 2):
+            yield NumeralSpan(
+                __start, __end, number_items2int(__number_items), __morph_forms
+            )
+            __number_items = NumberItems()
 
-    for match in REGEX_PATTERN_WORDS.finditer(text):
-        numeral = NUMERAL_TREE[lang].get(
-            preprocess_numeral(match.group(), lang=lang),
+        tail, offset = text[scan_end:], offset + scan_end
+        yield __start if __number_items else offset
+
+
+def __convert_text(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int],
+    max_corrections_relative: Optional[float],
+) -> str:
+    # worker of the pools: always returns the updated text
+    return "".join(
+        __converted_segments(
+            text,
+            lang=lang,
             max_corrections=max_corrections,
             max_corrections_relative=max_corrections_relative,
         )
+    )
 
-        if numeral:
-            __number_item = NumberItem(
-                numeral[0]["value"]["value"],
-                numeral[0]["value"]["order"],
-                numeral[0]["value"]["scale"],
-            )
 
-            # number starts
-            if not len(__number_items):
-                updated_text += text[i : match.span()[0]]
-                __number_items.append(__number_item)
-                __prev_number_end = match.span()[1]
-                i = match.span()[1]
+def __converted_segments(
+    text: str,
+    lang: str,
+    max_corrections: Optional[int],
+    max_corrections_relative: Optional[float],
+) -> Iterator[str]:
+    return replace_numerals(
+        text,
+        __scan_numerals(
+            [text],
+            lang=lang,
+            max_corrections=max_corrections,
+            max_corrections_relative=max_corrections_relative,
+        ),
+    )
 
-            # number continues
-            elif match.span()[0] - __prev_number_end < 2:
-                __number_items.append(__number_item)
-                __prev_number_end = match.span()[1]
-                i = match.span()[1]
-
-            # prev number ends, new number starts
-            else:
-                updated_text += str(number_items2int(__number_items))
-                updated_text += text[i : match.span()[0]]
-                __number_items = [
-                    __number_item,
-                ]
-                __prev_number_end = match.span()[1]
-                i = match.span()[1]
-
-    if __number_items:
-        updated_text += str(number_items2int(__number_items))
-
-    updated_text += text[i:]
-    return updated_text
+
+def replace_numerals(
+    text: str, numerals: Iterable[Union[NumeralSpan, int]]
+) -> Iterator[str]:
+    """
+    Pieces of the text with the numeral spans replaced by their values
+
+    :param str text: input text
+    :param Iterable[Union[NumeralSpan, int]] numerals: output of `scan_numerals()`
+           for the text
+    :return Iterator[str]: pieces of the updated text
+
+    """
+    i = 0
+
+    for numeral in numerals:
+        if isinstance(numeral, NumeralSpan):
+            yield text[i : numeral.start]
+            yield str(numeral.value)
+            i = numeral.end
+
+    yield text[i:]
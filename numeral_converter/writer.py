@@ -0,0 +1,148 @@
+import io
+import json
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .forms import NumeralGroup
+from .lang_data_loader import check_numeral_data_load
+from .morph import MorphSpec
+from .numeral_converter import int2numeral_group, int2numeral_group_range
+
+FORMATS = ("default", "forms", "jsonl")
+
+
+def write_numerals(
+    values: Iterable[int],
+    writer: Union[TextIO, BinaryIO],
+    lang: str,
+    fmt: str = "default",
+    morph: Optional[MorphSpec] = None,
+    buffer_size: int = 1024,
+    encoding: str = "utf-8",
+    **kwargs,
+) -> int:
+    """
+    Converts integer values into numerals in language `lang` and writes them
+    into `writer`, one line per value
+
+    Formats:
+
+    - "default": the first numeral form;
+    - "forms": all the numeral forms separated by tab;
+    - "jsonl": JSON object with keys "value", "numeral" and "numeral_forms"
+               (see `int2numeral()`)
+
+    Lines are written `buffer_size` at a time; the lines converted before
+    a failed value are written before the error is raised; `range` values
+    are converted by `int2numeral_group_range()`
+
+    :param Iterable[int] values: input integer values
+    :param writer: text writer or binary writer (`io.RawIOBase`,
+           `io.BufferedIOBase`); must support `write(s)`
+    :param str lang: language identifier;
+           to find out the list of available languages, use `get_available_languages()`
+    :param str fmt: output format: "default", "forms" or "jsonl"; default = "default"
+    :param Optional[MorphSpec] morph: morphological form; default = None
+    :param int buffer_size: number of lines written at a time; default = 1024
+    :param str encoding: encoding of binary writer output; default = "utf-8"
+    :param kwargs: morphological form labels: case, num_class, gender, number;
+           override the labels of `morph`; see `int2numeral()`
+    :return int: number of lines written
+
+    :Example:
+
+    >>> import io
+    >>> from numeral_converter import write_numerals
+    >>> writer = io.StringIO()
+    >>> write_numerals([1, 42], writer, lang="uk", fmt="jsonl", case="genetive")
+    2
+    >>> print(writer.getvalue())
+    {"value": 1, "numeral": "одного", "numeral_forms": ["одного"]}
+    {"value": 42, "numeral": "сорока двох", "numeral_forms": ["сорока двох"]}
+    <BLANKLINE>
+
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"invalid format {fmt}; use one of {FORMATS}")
+
+    if buffer_size < 1:
+        raise ValueError(f"invalid buffer size {buffer_size}; expects positive int")
+
+    morph = MorphSpec.from_kwargs(kwargs) if morph is None else morph.update(**kwargs)
+    check_numeral_data_load(lang)
+
+    format_line = __FORMATTERS[fmt]
+    is_binary = isinstance(writer, (io.RawIOBase, io.BufferedIOBase))
+
+    numerals: Iterable[Tuple[int, NumeralGroup]]
+    if isinstance(values, range):
+        numerals = zip(
+            values,
+            int2numeral_group_range(
+                values.start, values.stop, values.step, lang=lang, morph=morph
+            ),
+        )
+    else:
+        numerals = (
+            (value, int2numeral_group(value, lang, morph=morph)) for value in values
+        )
+
+    lines = list()
+    n_lines = 0
+    try:
+        for value, numeral_group in numerals:
+            lines.append(format_line(value, numeral_group))
+            if len(lines) >= buffer_size:
+                __write(writer, lines, is_binary, encoding)
+                n_lines += len(lines)
+                lines = list()
+    finally:
+        if lines:
+            __write(writer, lines, is_binary, encoding)
+            n_lines += len(lines)
+
+    return n_lines
+
+
+def __write(
+    writer: Union[TextIO, BinaryIO], lines: list, is_binary: bool, encoding: str
+):
+    output = "\n".join(lines) + "\n"
+    if is_binary:
+        cast(BinaryIO, writer).write(output.encode(encoding))
+    else:
+        cast(TextIO, writer).write(output)
+
+
+def __format_default(value: int, numeral_group: NumeralGroup) -> str:
+    return numeral_group.forms[0]
+
+
+def __format_forms(value: int, numeral_group: NumeralGroup) -> str:
+    return "\t".join(numeral_group.forms)
+
+
+def __format_jsonl(value: int, numeral_group: NumeralGroup) -> str:
+    return (
+        f'{{"value": {int(value)}, '
+        f'"numeral": {__dumps(numeral_group.numeral)}, '
+        f'"numeral_forms": [{", ".join(map(__dumps, numeral_group.forms))}]}}'
+    )
+
+
+__dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+__FORMATTERS: Dict[str, Callable[[int, NumeralGroup], str]] = {
+    "default": __format_default,
+    "forms": __format_forms,
+    "jsonl": __format_jsonl,
+}
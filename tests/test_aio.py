@@ -0,0 +1,29 @@
+import asyncio
+
+from numeral_converter import aio, convert_numerical_in_text, int2numeral
+
+
+def test_aio_numeral2int():
+    assert asyncio.run(aio.numeral2int("forty two", lang="en")) == 42
+
+
+def test_aio_int2numeral():
+    R = asyncio.run(aio.int2numeral(2023, lang="en", num_class="ordinal"))
+    assert R == int2numeral(2023, lang="en", num_class="ordinal")
+
+
+def test_aio_convert_numerical_in_text():
+    s = "For example thirty-three is simply thirty plus three. " * 100
+
+    R = asyncio.run(aio.convert_numerical_in_text(s[:50], lang="en"))
+    assert R == convert_numerical_in_text(s[:50], lang="en")
+
+    R = asyncio.run(aio.convert_numerical_in_text(s, lang="en"))
+    assert R == convert_numerical_in_text(s, lang="en")
+
+
+def test_aio_concurrent_loads():
+    async def __load():
+        await asyncio.gather(*[aio.load_numeral_data("en") for _ in range(10)])
+
+    asyncio.run(__load())
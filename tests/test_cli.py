@@ -0,0 +1,172 @@
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from numeral_converter import convert_numerical_in_text, int2numeral
+from numeral_converter.cli import main
+
+TEXT = (
+    "After twenty, numbers such as twenty-five, fifty, seventy-five, "
+    "and one hundred follow.\nFor example thirty-three is simply “thirty” "
+    "plus three; sixty-nine is simply “sixty” plus nine.\n"
+) * 50
+
+
+def test_cli_file(tmp_path, capsys):
+    input_file, output_file = tmp_path / "input.txt", tmp_path / "output.txt"
+    input_file.write_text(TEXT, encoding="utf-8")
+
+    assert (
+        main(
+            [
+                "file",
+                str(input_file),
+                "-o",
+                str(output_file),
+                "--lang",
+                "en",
+                "--chunk-size",
+                "7",
+                "--stats",
+            ]
+        )
+        == 0
+    )
+    assert output_file.read_text(encoding="utf-8") == convert_numerical_in_text(
+        TEXT, lang="en"
+    )
+    assert "MB/s" in capsys.readouterr().err
+
+
+def test_cli_file_in_place(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(TEXT, encoding="utf-8")
+
+    assert main(["file", str(input_file), "--in-place", "--lang", "en"]) == 0
+    assert input_file.read_text(encoding="utf-8") == convert_numerical_in_text(
+        TEXT, lang="en"
+    )
+    assert [x.name for x in tmp_path.iterdir()] == ["input.txt"]
+
+
+def test_cli_empty_file(tmp_path):
+    input_file, output_file = tmp_path / "input.txt", tmp_path / "output.txt"
+    input_file.write_text("", encoding="utf-8")
+
+    assert main(["file", str(input_file), "-o", str(output_file), "--lang", "en"]) == 0
+    assert output_file.read_text(encoding="utf-8") == ""
+
+
+def test_cli_lines(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("forty two\nfoo bar\none hundred\n"))
+
+    assert main(["lines", "numeral2int", "--lang", "en", "--batch-size", "1"]) == 0
+    out, err = capsys.readouterr()
+    assert out == "42\n\n100\n"
+    assert json.loads(err)["line"] == 2
+
+
+def test_cli_lines_unknown_lang(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("one\n"))
+
+    assert main(["lines", "numeral2int", "--lang", "xx", "--workers", "1"]) == 1
+    err = capsys.readouterr().err
+    assert "error: no data for language xx" in err
+    assert "Traceback" not in err
+
+
+def test_cli_lines_int2numeral(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("42\n1\n"))
+
+    assert main(["lines", "int2numeral", "--lang", "en", "--workers", "1"]) == 0
+    assert capsys.readouterr().out == "\n".join(
+        [
+            int2numeral(42, lang="en")["numeral"],
+            int2numeral(1, lang="en")["numeral"],
+            "",
+        ]
+    )
+
+
+def test_cli_lines_jsonl(monkeypatch, capsys):
+    lines = [
+        json.dumps({"id": i, "text": text})
+        for i, text in enumerate(TEXT.split("\n")[:-1])
+    ] + ["not json", json.dumps({"id": -1})]
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines)))
+
+    assert (
+        main(
+            [
+                "lines",
+                "text",
+                "--lang",
+                "en",
+                "--field",
+                "text",
+                "--workers",
+                "2",
+                "--batch-size",
+                "3",
+            ]
+        )
+        == 0
+    )
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record.get("id") for record in records[:-2]] == list(range(100))
+    assert [record["text"] for record in records[:-2]] == [
+        convert_numerical_in_text(text, lang="en") for text in TEXT.split("\n")[:-1]
+    ]
+    assert records[-2]["input"] == "not json" and "error" in records[-2]
+    assert records[-1]["id"] == -1 and "error" in records[-1]
+
+
+def test_cli_file_error(tmp_path, capsys):
+    input_file, output_file = tmp_path / "input.txt", tmp_path / "output.txt"
+    input_file.write_text(TEXT + "one two three\n" + TEXT, encoding="utf-8")
+
+    assert main(["file", str(input_file), "-o", str(output_file), "--lang", "en"]) == 1
+    assert "error" in capsys.readouterr().err
+    assert [x.name for x in tmp_path.iterdir()] == ["input.txt"]
+
+    assert main(["file", str(input_file), "--in-place", "--lang", "en"]) == 1
+    assert [x.name for x in tmp_path.iterdir()] == ["input.txt"]
+    assert input_file.read_text(encoding="utf-8") == TEXT + "one two three\n" + TEXT
+
+
+def test_cli_file_input_error_keeps_output(tmp_path, capsys):
+    output_file = tmp_path / "output.txt"
+    output_file.write_text("keep", encoding="utf-8")
+
+    for input_file in [tmp_path / "missing.txt", tmp_path]:
+        assert (
+            main(["file", str(input_file), "-o", str(output_file), "--lang", "en"]) == 1
+        )
+        assert "error" in capsys.readouterr().err
+        assert output_file.read_text(encoding="utf-8") == "keep"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="no named pipes")
+def test_cli_file_pipe(tmp_path):
+    input_file, output_file = tmp_path / "input.fifo", tmp_path / "output.txt"
+    os.mkfifo(input_file)
+
+    def write():
+        with open(input_file, "w", encoding="utf-8") as writer:
+            writer.write(TEXT)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    try:
+        assert (
+            main(["file", str(input_file), "-o", str(output_file), "--lang", "en"]) == 0
+        )
+    finally:
+        thread.join()
+
+    assert output_file.read_text(encoding="utf-8") == convert_numerical_in_text(
+        TEXT, lang="en"
+    )
@@ -0,0 +1,127 @@
+import random
+
+import pytest
+from fuzzy_multi_dict import FuzzyMultiDict
+
+from numeral_converter import load_numeral_data, numeral2int
+from numeral_converter.compressed_lexicon import CompressedLexicon
+from numeral_converter.lang_data_loader import NUMERAL_DATA, NUMERAL_TREE
+from numeral_converter.lexicon import (
+    LexiconEntry,
+    MorphFeatures,
+    lexicon_entry,
+    merge_lexicon_entries,
+)
+
+
+def words(lang):
+    for _, row in NUMERAL_DATA[lang].iterrows():
+        morph = MorphFeatures(
+            {
+                label: row[label]
+                for label in ("case", "num_class", "gender", "number")
+                if row.get(label) is not None
+            }
+        )
+        for string in row["string"].split(" "):
+            if string:
+                value = row["value"] if row.order < 6 else 10**row.order
+                yield string, value, row["order"], row["scale"], morph
+
+
+def misspellings(words):
+    # words with one or two random insertions, deletions, substitutions
+    # and transpositions of symbols
+    rnd = random.Random(0)
+    words = list(words)
+    alphabet = sorted(set("".join(words)))
+    for word in words:
+        for _ in range(3):
+            symbols = list(word)
+            for _ in range(rnd.randint(1, 2)):
+                operation = rnd.randrange(4)
+                i = rnd.randrange(len(symbols))
+                if operation == 0:
+                    symbols[i] = rnd.choice(alphabet)
+                elif operation == 1 and len(symbols) > 1:
+                    del symbols[i]
+                elif operation == 2:
+                    symbols.insert(i, rnd.choice(alphabet))
+                elif i + 1 < len(symbols):
+                    symbols[i], symbols[i + 1] = symbols[i + 1], symbols[i]
+            yield "".join(symbols)
+
+
+def test_compressed_lexicon():
+    nominative = MorphFeatures({"case": "nominative", "num_class": "ordinal"})
+    genetive = MorphFeatures({"case": "genetive", "num_class": "ordinal"})
+    words = [
+        ("третій", 3, 0, None, nominative),
+        ("третього", 3, 0, None, genetive),
+        ("четвертий", 4, 0, None, nominative),
+        ("четвертого", 4, 0, None, genetive),
+        ("третій", 5, 0, None, genetive),
+    ]
+    lexicon = CompressedLexicon(words)
+    numeral_tree = FuzzyMultiDict(update_value_func=merge_lexicon_entries)
+    for word, value, order, scale, morph in words:
+        numeral_tree[word] = lexicon_entry(float(value), order, scale, (morph,))
+
+    assert len(lexicon) == 4
+    assert lexicon.n_stems == 2
+    assert lexicon.n_paradigms == 2
+    assert list(lexicon) == ["третього", "третій", "четвертий", "четвертого"]
+
+    assert lexicon.get("третій") == [
+        {
+            "value": LexiconEntry(3, 0, None, (nominative, genetive)),
+            "key": "третій",
+            "correction": [],
+        }
+    ]
+    assert lexicon["четвертого"] == LexiconEntry(4, 0, None, (genetive,))
+
+    assert lexicon.get("тертього")[0]["value"] == LexiconEntry(3, 0, None, (genetive,))
+    assert [x["key"] for x in lexicon.get("четвертог")] == ["четвертого"]
+    assert lexicon.get("четвертог")[0]["correction"] == [
+        {"correction": 'insertion of "о"', "position": 9}
+    ]
+    assert lexicon.get("тертього", max_corrections=0) == []
+    assert lexicon.get("четвертийй", max_corrections_relative=0.0) == []
+
+    for query in ["тертього", "четвертог", "третьго", "чевтертий", "тертій"]:
+        assert lexicon.get(query) == numeral_tree.get(query)
+        assert lexicon.get(query, extract_all=True) == numeral_tree.get(
+            query, extract_all=True
+        )
+
+    with pytest.raises(KeyError):
+        lexicon["п'ятий"]
+
+    with pytest.raises(TypeError):
+        lexicon[5]
+
+
+@pytest.mark.parametrize("lang", ["en", "uk"])
+def test_compressed_lexicon_as_tree(lang):
+    load_numeral_data(lang)
+    lexicon = CompressedLexicon(words(lang))
+    numeral_tree = NUMERAL_TREE[lang]
+
+    for word in lexicon:
+        assert lexicon.get(word) == numeral_tree.get(word)
+
+    for query in misspellings(lexicon):
+        assert lexicon.get(query) == numeral_tree.get(query), query
+        assert lexicon.get(query, extract_all=True) == numeral_tree.get(
+            query, extract_all=True
+        ), query
+
+
+def test_compressed_lexicon_numeral2int(monkeypatch):
+    load_numeral_data("uk")
+    numerals = ["сорок два", "сорок двох", "двадцять тертього", "три тисячі"]
+    expected = [numeral2int(numeral, lang="uk") for numeral in numerals]
+
+    monkeypatch.setitem(NUMERAL_TREE, "uk", CompressedLexicon(words("uk")))
+    assert [numeral2int(numeral, lang="uk") for numeral in numerals] == expected
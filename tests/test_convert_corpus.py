@@ -0,0 +1,19 @@
+from numeral_converter import convert_corpus, convert_numerical_in_text
+
+TEXTS = [
+    "After twenty, numbers such as twenty-five, fifty, seventy-five",
+    "So long as one knows the core number",
+    "no numbers here",
+    "For example thirty-three is simply thirty plus three",
+] * 10
+
+
+def test_convert_corpus():
+    expect = [convert_numerical_in_text(text, lang="en") for text in TEXTS]
+    assert list(convert_corpus(TEXTS, lang="en", workers=2, chunksize=3)) == expect
+
+
+def test_convert_corpus_unordered():
+    expect = [convert_numerical_in_text(text, lang="en") for text in TEXTS]
+    R = list(convert_corpus(iter(TEXTS), lang="en", workers=2, ordered=False))
+    assert sorted(R) == sorted(expect)
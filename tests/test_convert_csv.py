@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from numeral_converter import convert_csv, int2numeral
+
+
+def test_convert_csv(tmp_path):
+    input_file, output_file = tmp_path / "input.csv", tmp_path / "output.csv"
+    pd.DataFrame(
+        {
+            "id": range(10),
+            "amount": ["forty two", "one", "forty two", "banana", None] * 2,
+            "number": [42, 1, 42, 1, 7] * 2,
+        }
+    ).to_csv(input_file, index=False)
+
+    stats = convert_csv(
+        input_file, output_file, lang="en", columns=["amount"], chunksize=3
+    )
+    assert stats.rows == 10 and stats.rows_per_second > 0
+
+    df = pd.read_csv(output_file)
+    assert list(df.columns) == ["id", "amount", "number"]
+    assert list(df["id"]) == list(range(10))
+    assert list(df["amount"].fillna(-1)) == [42, 1, 42, -1, -1] * 2
+
+    convert_csv(
+        input_file,
+        output_file,
+        lang="en",
+        columns=["number"],
+        operation="int2numeral",
+        chunksize=4,
+    )
+    df = pd.read_csv(output_file)
+    assert list(df["number"]) == [
+        int2numeral(value, lang="en")["numeral"] for value in [42, 1, 42, 1, 7] * 2
+    ]
+
+
+def test_convert_csv_non_integral(tmp_path):
+    input_file, output_file = tmp_path / "input.csv", tmp_path / "output.csv"
+    input_file.write_text("id,price\n1,1.5\n2,3\n3,0.25\n")
+
+    convert_csv(
+        input_file, output_file, lang="en", columns=["price"], operation="int2numeral"
+    )
+    df = pd.read_csv(output_file)
+    assert df["price"].isna().tolist() == [True, False, True]
+    assert df["price"][1] == int2numeral(3, lang="en")["numeral"]
+
+
+def test_convert_csv_invalid(tmp_path):
+    input_file, output_file = tmp_path / "input.csv", tmp_path / "output.csv"
+    input_file.write_text("id,amount\n1,one\n")
+
+    with pytest.raises(ValueError):
+        convert_csv(input_file, output_file, lang="en", columns=["price"])
+
+    with pytest.raises(ValueError):
+        convert_csv(
+            input_file, output_file, lang="en", columns=["amount"], operation="x"
+        )
@@ -1,4 +1,6 @@
-from numeral_converter import convert_numerical_in_text
+import io
+
+from numeral_converter import convert_numerical_in_stream, convert_numerical_in_text
 
 
 def test_convert_numerical_in_text():
@@ -48,3 +50,46 @@ def test_convert_numerical_in_text():
     )
 
     assert convert_numerical_in_text(s, lang="en") == expect
+
+
+def test_convert_numerical_in_text_writer():
+    s = "For example thirty-three is simply thirty plus three"
+    writer = io.StringIO()
+
+    assert convert_numerical_in_text(s, lang="en", writer=writer) is None
+    assert writer.getvalue() == "For example 33 is simply 30 plus 3"
+    assert writer.getvalue() == convert_numerical_in_text(s, lang="en")
+
+
+def test_convert_numerical_in_stream():
+    s = "Прості числівники мають один корінь; складні мають двадцять три корені"
+    expect = "Прості числівники мають 1 корінь; складні мають 23 корені"
+
+    for chunk_size in (1, 2, 5, 52, 55, 1000):
+        writer = io.StringIO()
+        convert_numerical_in_stream(
+            io.StringIO(s), writer, lang="uk", chunk_size=chunk_size
+        )
+        assert writer.getvalue() == expect
+
+
+def test_convert_numerical_in_stream_numeral_across_chunks():
+    s = "двадцять три"
+    writer = io.StringIO()
+    convert_numerical_in_stream(io.StringIO(s), writer, lang="uk", chunk_size=9)
+    assert writer.getvalue() == "23"
+
+
+def test_convert_numerical_in_text_parallel():
+    s = (
+        "After twenty, numbers such as twenty-five, fifty, seventy-five, "
+        "and one hundred follow.\nFor example thirty-three is simply thirty "
+        "plus three; sixty-nine is simply sixty plus nine. "
+    ) * 2000
+
+    expect = convert_numerical_in_text(s, lang="en")
+    assert convert_numerical_in_text(s, lang="en", workers=2) == expect
+
+    writer = io.StringIO()
+    convert_numerical_in_text(s, lang="en", workers=2, writer=writer)
+    assert writer.getvalue() == expect
@@ -0,0 +1,43 @@
+import pytest
+
+from numeral_converter import (
+    NumeralConverter,
+    convert_numerical_in_text,
+    int2numeral,
+    maximum_number_order_to_convert,
+    numeral2int,
+)
+
+
+def test_converter():
+    converter = NumeralConverter("en")
+
+    for value in [0, 1, 42, 100, 2023, 1000001, 10**20 + 7]:
+        numeral = int2numeral(value, lang="en")
+        assert converter.to_words(value) == numeral
+        assert converter.to_int(numeral["numeral_forms"][0]) == numeral2int(
+            numeral["numeral_forms"][0], lang="en"
+        )
+
+    assert converter.to_words(42, num_class="ordinal") == int2numeral(
+        42, lang="en", num_class="ordinal"
+    )
+
+    text = "forty two apples and one hundred pears"
+    assert converter.convert_text(text) == convert_numerical_in_text(text, lang="en")
+    assert converter.max_order == maximum_number_order_to_convert("en")
+
+
+def test_converter_default_morph():
+    converter = NumeralConverter("uk", case="genetive")
+
+    assert converter.to_words(42) == int2numeral(42, lang="uk", case="genetive")
+    assert converter.to_words(42, case="dative", gender="feminine") == int2numeral(
+        42, lang="uk", case="dative", gender="feminine"
+    )
+
+    with pytest.raises(ValueError):
+        NumeralConverter("uk", case="unknown")
+
+    with pytest.raises(ValueError):
+        converter.to_words(42, color="red")
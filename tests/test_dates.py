@@ -0,0 +1,61 @@
+import pytest
+
+from numeral_converter import (
+    MorphSpec,
+    dates,
+    day2numeral,
+    int2numeral,
+    numeral2int,
+    numeral2year,
+    year2numeral,
+)
+from numeral_converter.dates import build_date_tables
+
+
+def test_day2numeral():
+    for day in range(1, 32):
+        assert day2numeral(day, lang="en") == int2numeral(
+            day, lang="en", num_class="ordinal"
+        )
+
+    assert day2numeral(23, lang="uk", case="genetive") == int2numeral(
+        23, lang="uk", case="genetive", num_class="ordinal"
+    )
+    assert day2numeral(23, lang="en", num_class="cardinal") == int2numeral(
+        23, lang="en", num_class="cardinal"
+    )
+
+    with pytest.raises(ValueError):
+        day2numeral(32, lang="en")
+
+
+def test_day2numeral_builds_days_table_only(monkeypatch):
+    monkeypatch.setattr(dates, "DAY_TABLES", dict())
+    monkeypatch.setattr(dates, "YEAR_TABLES", dict())
+
+    day2numeral(23, lang="en")
+    assert "en" in dates.DAY_TABLES
+    assert "en" not in dates.YEAR_TABLES
+
+
+def test_year2numeral():
+    morph = MorphSpec(case="genetive", num_class="ordinal")
+    assert year2numeral(2023, lang="uk", case="genetive") == int2numeral(
+        2023, lang="uk", morph=morph
+    )
+
+    for year in [999, 1000, 1999, 2023, 2200, 2201, 3000]:
+        assert year2numeral(year, lang="en") == int2numeral(
+            year, lang="en", num_class="ordinal"
+        )
+
+
+def test_numeral2year():
+    build_date_tables("en", years_start=1990, years_stop=2030)
+
+    for year in [1989, 1990, 2023, 2029, 2030]:
+        numeral = int2numeral(year, lang="en", num_class="ordinal")["numeral"]
+        assert numeral2year(numeral, lang="en") == numeral2int(numeral, lang="en")
+        assert numeral2year(numeral, lang="en") == year
+
+    assert numeral2year("two thousand twenty three", lang="en") == 2023
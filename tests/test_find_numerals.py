@@ -0,0 +1,25 @@
+from numeral_converter import find_numerals
+
+
+def test_find_numerals():
+    s = "У моєму портфелі лежало чотири книги і сорок два зошити."
+    R = list(find_numerals(s, lang="uk"))
+
+    assert len(R) == 2
+    assert [s[x.start : x.end] for x in R] == ["чотири", "сорок два"]
+    assert [x.value for x in R] == [4, 42]
+
+
+def test_find_numerals_morph_forms():
+    R = list(find_numerals("the third day", lang="en"))
+    assert len(R) == 1
+    assert R[0].value == 3
+
+    morph_forms = R[0].morph_forms
+    if not isinstance(morph_forms, list):
+        morph_forms = [morph_forms]
+    assert any(x.get("num_class") == "ordinal" for x in morph_forms)
+
+
+def test_find_numerals_no_numerals():
+    assert list(find_numerals("nothing to convert here", lang="en")) == []
@@ -1,8 +1,11 @@
 import re
+import warnings
 
 import pytest
 
-from numeral_converter import int2numeral
+from numeral_converter import int2numeral, load_numeral_data
+from numeral_converter.forms import NumeralForms
+from numeral_converter.lang_data_loader import NUMERAL_DATA, NUMERAL_FORMS
 from numeral_converter.numeral_converter import MORPH_FORMS
 
 
@@ -2353,3 +2356,33 @@ def test_scales():
         int2numeral(100000000000000000000000000, lang="en")["numeral"]
         == "one hundred septilion"
     )
+
+
+def test_int2numeral_morph_plan_shared_by_shape():
+    R21 = int2numeral(21000, lang="uk", case="genetive")
+    R41 = int2numeral(41000, lang="uk", case="genetive")
+    assert R41 != R21
+    assert R41["numeral_forms"][0].split(" ")[1:] == (
+        R21["numeral_forms"][0].split(" ")[1:]
+    )
+
+    assert int2numeral(21000, lang="uk", case="genetive") == R21
+    assert int2numeral(41000, lang="uk", case="genetive") == R41
+
+
+def test_int2numeral_warns_ignored_label(monkeypatch):
+    load_numeral_data("uk")
+    monkeypatch.setitem(NUMERAL_FORMS, "uk", NumeralForms(NUMERAL_DATA["uk"], "uk"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        int2numeral(1, lang="uk", gender="feminine")
+        int2numeral(21, lang="uk", gender="feminine")
+
+    with pytest.warns(UserWarning, match="no data for gender == feminine"):
+        int2numeral(5, lang="uk", gender="feminine")
+
+
+def test_int2numeral_negative():
+    with pytest.raises(ValueError):
+        int2numeral(-1, lang="uk")
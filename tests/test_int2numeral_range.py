@@ -0,0 +1,24 @@
+from numeral_converter import MorphSpec, int2numeral, int2numeral_range
+
+
+def test_int2numeral_range():
+    for start, stop, step in [
+        (0, 1200, 1),
+        (999990, 1002010, 1),
+        (10**12 - 5, 10**12 + 1100, 7),
+        (2000, 0, -3),
+    ]:
+        assert list(int2numeral_range(start, stop, step, lang="en")) == [
+            int2numeral(value, lang="en") for value in range(start, stop, step)
+        ]
+
+
+def test_int2numeral_range_morph():
+    morph = MorphSpec(case="genetive", num_class="ordinal")
+    assert list(int2numeral_range(2020, 2027, lang="uk", morph=morph)) == [
+        int2numeral(value, lang="uk", morph=morph) for value in range(2020, 2027)
+    ]
+    assert list(int2numeral_range(1999, 2002, lang="en", num_class="ordinal")) == [
+        int2numeral(value, lang="en", num_class="ordinal")
+        for value in range(1999, 2002)
+    ]
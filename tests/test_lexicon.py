@@ -0,0 +1,59 @@
+import pytest
+
+from numeral_converter import load_numeral_data
+from numeral_converter.lang_data_loader import NUMERAL_TREE
+from numeral_converter.lexicon import (
+    LexiconEntry,
+    MorphFeatures,
+    entry_morph_forms,
+    lexicon_entry,
+    merge_lexicon_entries,
+)
+
+
+def test_morph_features():
+    features = MorphFeatures({"case": "genetive", "num_class": "ordinal"})
+
+    assert features is MorphFeatures({"num_class": "ordinal", "case": "genetive"})
+    assert features == {"case": "genetive", "num_class": "ordinal"}
+    assert dict(features) == {"case": "genetive", "num_class": "ordinal"}
+    assert len(features) == 2
+    assert features["case"] == "genetive"
+    assert features.get("gender") is None
+    assert not hasattr(features, "__dict__")
+
+    with pytest.raises(KeyError):
+        features["gender"]
+
+    assert MorphFeatures({}) == {}
+    assert MorphFeatures({"gender": "unknown"}).get("gender") == "unknown"
+
+
+def test_lexicon_entry():
+    cardinal = (MorphFeatures({"num_class": "cardinal"}),)
+    ordinal = (MorphFeatures({"num_class": "ordinal"}),)
+
+    entry = lexicon_entry(2.0, 0, None, cardinal)
+    assert entry is lexicon_entry(2.0, 0, None, cardinal)
+    assert entry is not lexicon_entry(2, 0, None, cardinal)
+    assert entry_morph_forms(entry) == {"num_class": "cardinal"}
+
+    assert merge_lexicon_entries(None, entry) is entry
+    assert merge_lexicon_entries(entry, lexicon_entry(2.0, 0, None, cardinal)) is entry
+
+    merged = merge_lexicon_entries(entry, lexicon_entry(2.0, 0, None, ordinal))
+    assert merged == LexiconEntry(2.0, 0, None, cardinal + ordinal)
+    assert entry_morph_forms(merged) == [
+        {"num_class": "cardinal"},
+        {"num_class": "ordinal"},
+    ]
+
+    with pytest.raises(TypeError):
+        merge_lexicon_entries({"value": 2}, entry)
+
+
+def test_lexicon_payloads_shared():
+    load_numeral_data("en")
+    first = NUMERAL_TREE["en"].get("first")[0]["value"]
+    assert isinstance(first, LexiconEntry)
+    assert first.morph_forms[0] is MorphFeatures({"num_class": "ordinal"})
@@ -1,8 +1,13 @@
+import threading
+
 import pytest
 
 from numeral_converter import (
     get_available_languages,
+    is_ready,
+    lang_data_loader,
     load_numeral_data,
+    load_numeral_data_async,
     maximum_number_order_to_convert,
 )
 
@@ -42,3 +47,30 @@ def test_maximum_number_order_to_convert():
     123
     print(maximum_number_order_to_convert("en"))
     24
+
+
+def test_load_async():
+    futures = [load_numeral_data_async("uk") for _ in range(3)]
+    for future in futures:
+        future.result()
+    assert is_ready("uk")
+
+
+def test_load_async_unknown_lang():
+    future = load_numeral_data_async("unknown")
+    with pytest.raises(ValueError):
+        future.result()
+    assert not is_ready("unknown")
+
+
+def test_load_in_calling_thread(monkeypatch):
+    threads = list()
+    monkeypatch.setattr(
+        lang_data_loader,
+        "__load_numeral_data",
+        lambda lang, compressed_lexicon: threads.append(threading.current_thread()),
+    )
+
+    load_numeral_data("unknown")
+    assert threads == [threading.current_thread()]
+    assert not is_ready("unknown")
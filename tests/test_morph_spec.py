@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from numeral_converter import MorphSpec, NumeralConverter, int2numeral
+
+
+def test_morph_spec_interned():
+    spec = MorphSpec(case="genetive")
+
+    assert spec is MorphSpec("genetive", None, None, None)
+    assert spec is MorphSpec(case="genetive", gender="")
+    assert spec is MorphSpec.from_kwargs({"case": "genetive"})
+    assert spec is pickle.loads(pickle.dumps(spec))
+    assert spec is spec.update(number=None)
+    assert spec.update(gender="feminine") is MorphSpec("genetive", gender="feminine")
+    assert spec._replace(case=None) is MorphSpec()
+    assert hash(spec) == hash(MorphSpec(case="genetive"))
+    assert {spec: 1}[MorphSpec(case="genetive")] == 1
+
+    assert spec.resolved() == MorphSpec("genetive", "cardinal", "masculine", "singular")
+    assert spec.resolved() is spec.resolved().resolved()
+
+    with pytest.raises(AttributeError):
+        spec.case = "dative"
+
+
+def test_morph_spec_invalid():
+    with pytest.raises(ValueError):
+        MorphSpec(case="unknown")
+
+    with pytest.raises(ValueError):
+        MorphSpec.from_kwargs({"color": "red"})
+
+    with pytest.raises(ValueError):
+        MorphSpec().update(gender="unknown")
+
+
+def test_int2numeral_morph_spec():
+    spec = MorphSpec(case="dative", gender="feminine", num_class="ordinal")
+
+    for value in [1, 2, 42, 1000, 2023]:
+        expected = int2numeral(
+            value, lang="uk", case="dative", gender="feminine", num_class="ordinal"
+        )
+        assert int2numeral(value, lang="uk", morph=spec) == expected
+        assert NumeralConverter("uk", morph=spec).to_words(value) == expected
+
+    assert int2numeral(42, lang="uk", morph=spec, case="genetive") == int2numeral(
+        42, lang="uk", case="genetive", gender="feminine", num_class="ordinal"
+    )
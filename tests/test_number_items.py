@@ -0,0 +1,44 @@
+from numeral_converter.number_items import NumberItem, NumberItems
+from numeral_converter.numeral_converter import number_items2int, numeral2number_items
+
+NUMBER_ITEMS = [
+    NumberItem(2, 0, None),
+    NumberItem(10**123, 123, True),
+    NumberItem(40, 1, None),
+    NumberItem(1000, 3, True),
+    NumberItem(0, -1, None),
+]
+
+
+def test_number_items():
+    number_items = NumberItems(NUMBER_ITEMS)
+
+    assert len(number_items) == len(NUMBER_ITEMS)
+    assert list(number_items) == NUMBER_ITEMS
+    assert number_items == NUMBER_ITEMS
+    assert number_items[1] == NumberItem(10**123, 123, True)
+    assert number_items[1:3] == NUMBER_ITEMS[1:3]
+    assert number_items.columns() == (
+        [2, 10**123, 40, 1000, 0],
+        [0, 123, 1, 3, -1],
+        [None, True, None, True, None],
+    )
+
+    number_items.reverse()
+    assert list(number_items) == NUMBER_ITEMS[::-1]
+
+
+def test_number_items2int():
+    number_items = [
+        NumberItem(2, 0, None),
+        NumberItem(10**6, 6, True),
+        NumberItem(40, 1, None),
+        NumberItem(2, 0, None),
+        NumberItem(1000, 3, True),
+    ]
+    assert number_items2int(number_items) == 2042000
+    assert number_items2int(NumberItems(number_items)) == 2042000
+
+    number_items = numeral2number_items("two million forty two thousand", lang="en")
+    assert isinstance(number_items, NumberItems)
+    assert number_items2int(number_items) == 2042000
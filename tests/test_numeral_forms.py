@@ -0,0 +1,102 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from numeral_converter.forms import NumeralForms, NumeralGroup, NumeralWord
+from numeral_converter.morph import MorphSpec
+from numeral_converter.numeral_converter import NumberItem
+
+DATA = pd.DataFrame(
+    {
+        "string": ["one", "first", "ones", "ten", "tenth", "million", "millionth"],
+        "value": [1, 1, 1, 10, 10, None, None],
+        "order": [0, 0, 0, 1, 1, 6, 6],
+        "scale": [None, None, None, None, None, True, True],
+        "num_class": [
+            "cardinal",
+            "ordinal",
+            "collective",
+            "cardinal",
+            "ordinal",
+            "cardinal",
+            "ordinal",
+        ],
+    }
+)
+
+
+def test_numeral_forms():
+    forms = NumeralForms(DATA, lang="xx")
+
+    assert forms.labels == ("num_class",)
+    assert forms.capabilities[10] == {"num_class": {"cardinal", "ordinal"}}
+    assert forms.capabilities[10**6] == {"num_class": {"cardinal", "ordinal"}}
+
+    assert forms.numeral_word(1, MorphSpec()) == NumeralWord("one", [])
+    assert forms.numeral_word(1, MorphSpec(num_class="ordinal")).default == "first"
+    assert forms.numeral_word(10**6, MorphSpec()).default == "million"
+    assert forms.numeral_word(2 * 10**6, MorphSpec()).default == "million"
+
+    with pytest.raises(ValueError, match="no data for number 42"):
+        forms.numeral_word(42, MorphSpec())
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(2):
+            with pytest.raises(ValueError, match="more then one values for number 10"):
+                forms.numeral_word(10, MorphSpec(num_class="collective"))
+
+
+def test_numeral_forms_check_morph():
+    forms = NumeralForms(DATA, lang="xx")
+
+    with pytest.warns(UserWarning, match='no column "case"'):
+        forms.check_morph(MorphSpec(case="genetive"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        forms.check_morph(MorphSpec(case="genetive"))
+        forms.check_morph(MorphSpec(num_class="collective"))
+        forms.check_morph(MorphSpec(num_class="ordinal"))
+
+    assert forms.missing_values(MorphSpec(num_class="collective")) == {
+        ("num_class", "collective")
+    }
+    assert forms.missing_values(MorphSpec(num_class="ordinal")) == set()
+
+
+def test_numeral_forms_check_numeral():
+    forms = NumeralForms(DATA, lang="xx")
+    morph = MorphSpec(num_class="collective")
+
+    def check_numeral(value):
+        forms.check_numeral([NumberItem(value, 0, None)], [(0, 1, (morph,))], morph)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        check_numeral(1)
+
+    with pytest.warns(
+        UserWarning, match="no data for num_class == collective for number 10"
+    ):
+        check_numeral(10)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        check_numeral(10)
+
+
+def test_numeral_forms_group():
+    forms = NumeralForms(DATA, lang="en")
+    number_items = (NumberItem(10, 1, None), NumberItem(1, 0, None))
+
+    group = forms.numeral_group(number_items, (MorphSpec(), MorphSpec()))
+    assert group == NumeralGroup("ten-one", ("ten-one",))
+    assert forms.numeral_group(number_items, (MorphSpec(), MorphSpec())) is group
+
+    group = forms.numeral_group(
+        (NumberItem(1, 0, None), NumberItem(10**6, 6, True)),
+        (MorphSpec(), MorphSpec(num_class="ordinal")),
+    )
+    assert group == NumeralGroup("one millionth", ("one millionth",))
@@ -0,0 +1,86 @@
+import warnings
+
+from numeral_converter import (
+    MorphSpec,
+    NumeralConverter,
+    build_numeral_forms_table,
+    int2numeral,
+    numeral2int,
+)
+from numeral_converter.forms import NumeralGroup
+from numeral_converter.forms_table import NumeralFormsTable
+from numeral_converter.lang_data_loader import NUMERAL_FORMS_TABLE
+
+TABLE = NumeralFormsTable(
+    "xx",
+    start=1,
+    stop=3,
+    labels=("num_class",),
+    numerals={
+        MorphSpec(num_class="cardinal"): [
+            NumeralGroup("one", ("one",)),
+            NumeralGroup("two", ("two",)),
+        ],
+        MorphSpec(num_class="ordinal"): [NumeralGroup("first", ("first",)), None],
+    },
+    values={"one": 1, "two": 2, "first": 1},
+)
+
+
+def test_numeral_forms_table():
+    assert len(TABLE) == 3
+
+    assert TABLE.get(1, MorphSpec()) == {"numeral": "one", "numeral_forms": ["one"]}
+    assert TABLE.get(1, MorphSpec(case="genetive")) == TABLE.get(1, MorphSpec())
+    assert TABLE.get(1, MorphSpec(num_class="ordinal"))["numeral"] == "first"
+    assert TABLE.get(2, MorphSpec(num_class="ordinal")) is None
+    assert TABLE.get(0, MorphSpec()) is None
+    assert TABLE.get(3, MorphSpec()) is None
+    assert TABLE.get(1, MorphSpec(num_class="collective")) is None
+
+    assert TABLE.get_value("first") == 1
+    assert TABLE.get_value("three") is None
+
+
+def test_numeral_forms_table_file(tmp_path):
+    path = tmp_path / "forms" / "xx.json.gz"
+    TABLE.to_file(path, fingerprint="abc")
+
+    table = NumeralFormsTable.from_file(path, fingerprint="abc")
+    assert table.labels == TABLE.labels
+    for value in range(0, 4):
+        for num_class in ["cardinal", "ordinal", "collective"]:
+            morph = MorphSpec(num_class=num_class)
+            assert table.get(value, morph) == TABLE.get(value, morph)
+    assert table.get_value("first") == 1
+
+    assert NumeralFormsTable.from_file(path, fingerprint="def") is None
+
+
+def test_build_numeral_forms_table():
+    expected, expected_values = dict(), dict()
+    for morph in [MorphSpec(), MorphSpec(num_class="ordinal")]:
+        for value in range(0, 120):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                expected[(value, morph)] = int2numeral(value, lang="en", morph=morph)
+            for numeral_form in expected[(value, morph)]["numeral_forms"]:
+                expected_values[numeral_form] = numeral2int(numeral_form, lang="en")
+
+    try:
+        table = build_numeral_forms_table("en", stop=100, save=False)
+        assert NUMERAL_FORMS_TABLE["en"] is table
+        converter = NumeralConverter("en")
+
+        for (value, morph), numeral in expected.items():
+            assert int2numeral(value, lang="en", morph=morph) == numeral
+            assert converter.to_words(value, morph=morph) == numeral
+            if value < 100:
+                assert table.get(value, morph) == numeral
+
+        for numeral_form, value in expected_values.items():
+            assert numeral2int(numeral_form, lang="en") == value
+            assert converter.to_int(numeral_form) == value
+
+    finally:
+        NUMERAL_FORMS_TABLE.pop("en", None)
@@ -0,0 +1,86 @@
+import pytest
+
+from numeral_converter import NumeralParser
+
+
+def test_numeral_parser():
+    parser = NumeralParser(lang="en")
+    states = [
+        parser.feed(word) for word in "two thousand twenty three apples".split(" ")
+    ]
+    assert states == ["open", "open", "open", "open", "complete"]
+
+    R = parser.close()
+    assert R.value == 2023
+    assert (R.start, R.end) == (0, 4)
+    assert parser.state == "empty"
+
+
+def test_numeral_parser_spans():
+    parser = NumeralParser(lang="uk")
+    text = "маю сорок два яблука"
+
+    assert parser.feed("маю", 0, 3) == "empty"
+    assert parser.feed("сорок", 4, 9) == "open"
+    assert parser.feed("два", 10, 13) == "open"
+    assert parser.feed("яблука", 14, 20) == "complete"
+
+    R = parser.close()
+    assert R.value == 42
+    assert text[R.start : R.end] == "сорок два"
+
+
+def test_numeral_parser_ordinal_completes_numeral():
+    parser = NumeralParser(lang="en")
+    assert parser.feed("twenty") == "open"
+    assert parser.feed("third") == "complete"
+    assert parser.close().value == 23
+
+
+def test_numeral_parser_invalid():
+    parser = NumeralParser(lang="en")
+    assert parser.feed("twenty") == "open"
+    assert parser.feed("thirty") == "invalid"
+
+    with pytest.raises(ValueError):
+        parser.feed("three")
+
+    R = parser.close()
+    assert (R.value, R.start, R.end) == (20, 0, 1)
+
+    # rejected word starts the next numeral
+    assert parser.state == "open"
+    assert parser.feed("three") == "open"
+    R = parser.close()
+    assert (R.value, R.start, R.end) == (33, 1, 3)
+
+
+def test_numeral_parser_close_empty():
+    parser = NumeralParser(lang="en")
+    assert parser.feed("apples") == "empty"
+    assert parser.close() is None
+
+
+def test_numeral_parser_hyphenated_word():
+    parser = NumeralParser(lang="en")
+    assert parser.feed("twenty-three", 0, 12) == "open"
+    assert parser.feed("apples", 13, 19) == "complete"
+
+    R = parser.close()
+    assert (R.value, R.start, R.end) == (23, 0, 12)
+
+
+def test_numeral_parser_connector():
+    parser = NumeralParser(lang="en")
+    states = [parser.feed(word) for word in "one hundred and one apples".split(" ")]
+    assert states == ["open", "open", "open", "open", "complete"]
+
+    R = parser.close()
+    assert (R.value, R.start, R.end) == (101, 0, 4)
+
+    # connector is not included into the numeral
+    states = [parser.feed(word) for word in "one hundred and apples".split(" ")]
+    assert states == ["open", "open", "open", "complete"]
+
+    R = parser.close()
+    assert (R.value, R.start, R.end) == (100, 5, 7)
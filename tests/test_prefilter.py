@@ -0,0 +1,66 @@
+import random
+
+from fuzzy_multi_dict import FuzzyMultiDict
+
+from numeral_converter.prefilter import NumeralPrefilter
+
+WORDS = [
+    "один",
+    "одна",
+    "два",
+    "дві",
+    "три",
+    "двадцять",
+    "двадцяти",
+    "сорок",
+    "сто",
+    "тисяча",
+    "тисячі",
+    "мільйон",
+]
+
+
+def test_prefilter_exact():
+    prefilter = NumeralPrefilter(WORDS)
+    assert prefilter.may_match("двадцять")
+    assert not prefilter.may_match("двадцят")
+    assert not prefilter.may_match("яблуко")
+
+
+def test_prefilter_corrections():
+    prefilter = NumeralPrefilter(WORDS)
+    assert prefilter.may_match("двадцят", max_corrections=1)
+    assert prefilter.may_match("двадцтяь", max_corrections=1)
+    assert not prefilter.may_match("яблуко", max_corrections=1)
+    assert prefilter.may_match("тисячи", max_corrections_relative=0.2)
+    assert prefilter.may_match("яблуко", max_corrections=None)
+
+
+def test_prefilter_never_rejects_tree_match():
+    random.seed(42)
+    prefilter = NumeralPrefilter(WORDS)
+    tree = FuzzyMultiDict()
+    for word in WORDS:
+        tree[word] = word
+
+    symbols = sorted(prefilter.symbols) + list("abcyїx")
+    for _ in range(2000):
+        word = random.choice(WORDS)
+        for _ in range(random.randint(0, 3)):
+            i = random.randrange(len(word))
+            c = random.choice(symbols)
+            word = (
+                random.choice(
+                    [
+                        word[:i] + c + word[i:],
+                        word[:i] + word[i + 1 :],
+                        word[:i] + c + word[i + 1 :],
+                        word[:i] + word[i + 1 : i + 2] + word[i] + word[i + 2 :],
+                    ]
+                )
+                or c
+            )
+
+        for max_corrections in range(3):
+            if tree.get(word, max_corrections=max_corrections):
+                assert prefilter.may_match(word, max_corrections=max_corrections)
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from numeral_converter import int2numeral, numeral2int
+
+
+def test_series_to_int():
+    series = pd.Series(
+        ["forty two", "one", None, "banana", "forty two"],
+        index=list("abcde"),
+        name="amount",
+    )
+
+    result = series.numeral.to_int("en")
+    assert list(result.index) == list("abcde") and result.name == "amount"
+    assert list(result.fillna(-1)) == [42, 1, -1, -1, 42]
+    assert list(result[["a", "b"]]) == [
+        numeral2int("forty two", lang="en"),
+        numeral2int("one", lang="en"),
+    ]
+
+
+def test_series_to_words():
+    result = pd.Series([42, 1, 42, 10**100]).numeral.to_words("en")
+    assert list(result[:3]) == [
+        int2numeral(value, lang="en")["numeral"] for value in [42, 1, 42]
+    ]
+    assert result.isna().tolist() == [False, False, False, True]
+
+
+def test_series_to_words_non_integral():
+    result = pd.Series([1.5, 2.0, 0.25, float("nan")]).numeral.to_words("en")
+    assert result.isna().tolist() == [True, False, True, True]
+    assert result[1] == int2numeral(2, lang="en")["numeral"]
@@ -0,0 +1,43 @@
+import io
+import json
+
+import pytest
+
+from numeral_converter import int2numeral, write_numerals
+
+
+@pytest.mark.parametrize("values", [[0, 42, 2023, 10**9 + 1], range(999995, 1000010)])
+def test_write_numerals(values):
+    numerals = [int2numeral(value, lang="en", num_class="ordinal") for value in values]
+
+    writer = io.StringIO()
+    assert write_numerals(values, writer, lang="en", num_class="ordinal") == len(
+        numerals
+    )
+    assert writer.getvalue() == "".join(
+        f"{numeral['numeral_forms'][0]}\n" for numeral in numerals
+    )
+
+    writer = io.StringIO()
+    write_numerals(values, writer, lang="en", fmt="forms", num_class="ordinal")
+    assert writer.getvalue() == "".join(
+        "\t".join(numeral["numeral_forms"]) + "\n" for numeral in numerals
+    )
+
+    writer = io.BytesIO()
+    write_numerals(
+        iter(values), writer, lang="en", fmt="jsonl", buffer_size=2, num_class="ordinal"
+    )
+    assert [json.loads(line) for line in writer.getvalue().decode().splitlines()] == [
+        {"value": value, **numeral} for value, numeral in zip(values, numerals)
+    ]
+
+
+def test_write_numerals_errors():
+    writer = io.StringIO()
+    with pytest.raises(ValueError):
+        write_numerals([1, 2], writer, lang="en", fmt="csv")
+
+    with pytest.raises(ValueError):
+        write_numerals([1, 2, -3], writer, lang="en", buffer_size=1)
+    assert writer.getvalue() == "one\ntwo\n"